@@ -0,0 +1,126 @@
+"""
+Benchmark of the dat file reader and writer
+
+Writes a structured hexahedral mesh with element options (MAT, KINEM, TECH) and
+element and nodal fibers into a dat file, reads it back and writes the read
+discretization again. The time of each step is reported.
+
+    python benchmarks/dat_io.py --elements 125000
+    python benchmarks/dat_io.py --elements 1000000 --materials 8 --no-fibers
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import lnmmeshio
+import numpy as np
+from lnmmeshio.element import factory_many
+
+
+def create_discretization(num_elements: int) -> lnmmeshio.Discretization:
+    """
+    Creates a structured mesh of approximately num_elements HEX8 elements
+    """
+    n = max(1, int(round(num_elements ** (1.0 / 3.0))))
+    nx, ny, nz = n, n, max(1, num_elements // (n * n))
+
+    x, y, z = np.meshgrid(
+        np.arange(nx + 1, dtype=float),
+        np.arange(ny + 1, dtype=float),
+        np.arange(nz + 1, dtype=float),
+        indexing="ij",
+    )
+    coords = np.column_stack((x.ravel(), y.ravel(), z.ravel()))
+    ids = np.arange(len(coords)).reshape((nx + 1, ny + 1, nz + 1))
+
+    corners = [
+        ids[:-1, :-1, :-1],
+        ids[1:, :-1, :-1],
+        ids[1:, 1:, :-1],
+        ids[:-1, 1:, :-1],
+        ids[:-1, :-1, 1:],
+        ids[1:, :-1, 1:],
+        ids[1:, 1:, 1:],
+        ids[:-1, 1:, 1:],
+    ]
+    connectivity = np.column_stack([c.ravel() for c in corners])
+
+    dis = lnmmeshio.Discretization()
+    dis.nodes = lnmmeshio.Node.from_coords(coords)
+    dis.elements.structure = factory_many("HEX8", connectivity, dis.nodes, "SOLIDH8")
+
+    return dis
+
+
+def add_options(dis: lnmmeshio.Discretization, num_materials: int) -> None:
+    """
+    Assigns the material ids 1, ..., num_materials to consecutive blocks of elements
+    and the same kinematics to all elements. Every other element uses EAS.
+    """
+    num_eles = len(dis.elements.structure)
+    materials = np.arange(num_eles) * num_materials // max(1, num_eles) + 1
+    for matid in range(1, num_materials + 1):
+        dis.set_element_option("MAT", matid, materials == matid)
+
+    dis.set_element_option("KINEM", "nonlinear")
+    dis.set_element_option("TECH", "none")
+    dis.set_element_option("TECH", "eas_full", np.arange(num_eles) % 2 == 1)
+
+
+def add_fibers(dis: lnmmeshio.Discretization) -> None:
+    """
+    Adds two random fibers to all elements and one to all nodes
+    """
+    rng = np.random.default_rng(0)
+    num_eles = len(dis.elements.structure)
+    dis.set_element_fibers(lnmmeshio.Fiber.TypeFiber1, rng.random((num_eles, 3)))
+    dis.set_element_fibers(lnmmeshio.Fiber.TypeFiber2, rng.random((num_eles, 3)))
+    dis.set_node_fibers(lnmmeshio.Fiber.TypeFiber1, rng.random((len(dis.nodes), 3)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--elements", type=int, default=125_000)
+    parser.add_argument("--materials", type=int, default=4)
+    parser.add_argument("--no-fibers", action="store_true", help="Write no fibers")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    dis = create_discretization(args.elements)
+    add_options(dis, args.materials)
+    if not args.no_fibers:
+        add_fibers(dis)
+    print(
+        "Created {0} elements and {1} nodes in {2:.2f} s".format(
+            len(dis.elements.structure), len(dis.nodes), time.perf_counter() - start
+        )
+    )
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "benchmark.dat")
+
+        start = time.perf_counter()
+        lnmmeshio.write(filename, dis, out=False)
+        print(
+            "Write: {0:.2f} s ({1:.0f} MB)".format(
+                time.perf_counter() - start, os.path.getsize(filename) / 1e6
+            )
+        )
+
+        start = time.perf_counter()
+        dis = lnmmeshio.read(filename, out=False)
+        print("Read: {0:.2f} s".format(time.perf_counter() - start))
+
+        start = time.perf_counter()
+        lnmmeshio.write(filename, dis, out=False)
+        print(
+            "Write the read discretization: {0:.2f} s".format(
+                time.perf_counter() - start
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
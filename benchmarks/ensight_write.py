@@ -0,0 +1,144 @@
+"""
+Benchmark of the EnSight case writer
+
+Writes a structured hexahedral mesh with element and nodal variables and reports the time of
+each step. The defaults (10M elements, 50 variables) need a lot of memory, use --elements and
+--variables for smaller runs.
+
+    python benchmarks/ensight_write.py --elements 1000000 --variables 10
+    python benchmarks/ensight_write.py --elements 1000000 --materials 8 --parts material
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import lnmmeshio
+import numpy as np
+from lnmmeshio.element import factory_many
+
+
+def create_discretization(num_elements: int) -> lnmmeshio.Discretization:
+    """
+    Creates a structured mesh of approximately num_elements HEX8 elements
+    """
+    n = max(1, int(round(num_elements ** (1.0 / 3.0))))
+    nx, ny, nz = n, n, max(1, num_elements // (n * n))
+
+    x, y, z = np.meshgrid(
+        np.arange(nx + 1, dtype=float),
+        np.arange(ny + 1, dtype=float),
+        np.arange(nz + 1, dtype=float),
+        indexing="ij",
+    )
+    coords = np.column_stack((x.ravel(), y.ravel(), z.ravel()))
+    ids = np.arange(len(coords)).reshape((nx + 1, ny + 1, nz + 1))
+
+    corners = [
+        ids[:-1, :-1, :-1],
+        ids[1:, :-1, :-1],
+        ids[1:, 1:, :-1],
+        ids[:-1, 1:, :-1],
+        ids[:-1, :-1, 1:],
+        ids[1:, :-1, 1:],
+        ids[1:, 1:, 1:],
+        ids[:-1, 1:, 1:],
+    ]
+    connectivity = np.column_stack([c.ravel() for c in corners])
+
+    dis = lnmmeshio.Discretization()
+    dis.nodes = lnmmeshio.Node.from_coords(coords)
+    dis.elements.structure = factory_many("HEX8", connectivity, dis.nodes, "SOLIDH8")
+
+    return dis
+
+
+def add_materials(dis: lnmmeshio.Discretization, num_materials: int) -> None:
+    """
+    Assigns the material ids 1, ..., num_materials to consecutive blocks of elements
+    """
+    num_eles = len(dis.elements.structure)
+    materials = np.arange(num_eles) * num_materials // max(1, num_eles) + 1
+    for matid in range(1, num_materials + 1):
+        dis.set_element_option("MAT", matid, materials == matid)
+
+
+def add_variables(dis: lnmmeshio.Discretization, num_variables: int) -> None:
+    """
+    Adds num_variables variables, alternating between scalar and vector element and nodal data
+    """
+    rng = np.random.default_rng(0)
+    num_eles = len(dis.elements.structure)
+    num_nodes = len(dis.nodes)
+    for i in range(num_variables):
+        shape = tuple() if i % 4 < 2 else (3,)
+        if i % 2 == 0:
+            dis.set_element_data(
+                "element_variable_{0}".format(i), rng.random((num_eles,) + shape)
+            )
+        else:
+            dis.set_node_data(
+                "nodal_variable_{0}".format(i), rng.random((num_nodes,) + shape)
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--elements", type=int, default=10_000_000)
+    parser.add_argument("--variables", type=int, default=50)
+    parser.add_argument("--ascii", action="store_true", help="Write ASCII files")
+    parser.add_argument("--materials", type=int, default=1)
+    parser.add_argument(
+        "--parts",
+        choices=["field", "material"],
+        default=None,
+        help="Write one part per field or per field and material",
+    )
+    parser.add_argument("--threads", type=int, default=None)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    dis = create_discretization(args.elements)
+    add_materials(dis, args.materials)
+    add_variables(dis, args.variables)
+    print(
+        "Created {0} elements, {1} nodes and {2} variables in {3:.2f} s".format(
+            len(dis.elements.structure),
+            len(dis.nodes),
+            args.variables,
+            time.perf_counter() - start,
+        )
+    )
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        os.makedirs(os.path.join(tmpdir, "ensight"))
+        filename = os.path.join(tmpdir, "ensight", "benchmark.case")
+
+        start = time.perf_counter()
+        with open(
+            os.path.join(tmpdir, "geometry.geo"), "wb" if not args.ascii else "w"
+        ) as f:
+            dis.compute_ids(zero_based=False)
+            lnmmeshio.ensightio.write_geometry(f, dis, binary=not args.ascii)
+        print("Geometry: {0:.2f} s".format(time.perf_counter() - start))
+
+        start = time.perf_counter()
+        lnmmeshio.ensightio.write_case(
+            filename,
+            dis,
+            binary=not args.ascii,
+            override=True,
+            out=False,
+            parts=args.parts,
+            num_threads=args.threads,
+        )
+        print(
+            "Case (geometry and variables): {0:.2f} s".format(
+                time.perf_counter() - start
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
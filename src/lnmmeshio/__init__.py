@@ -11,7 +11,18 @@ from meshio import Mesh
 from meshio import read as _meshioread
 from meshio import write as _meshiowrite
 
-from . import element, ensightio, ioutils, mimics_stlio, node, nodeset
+from . import (
+    element,
+    ensightio,
+    fielddata,
+    integration,
+    ioutils,
+    mimics_stlio,
+    node,
+    nodeset,
+    spatial,
+    transfer,
+)
 from .discretization import Discretization
 from .element.element import (
     Element,
@@ -42,6 +53,7 @@ from .element.wedge6 import Wedge6
 from .fiber import Fiber
 from .node import Node
 from .nodeset import LineNodeset, PointNodeset, SurfaceNodeset, VolumeNodeset
+from .transfer import transfer_nodal_field
 
 __TYPE_LEGACY_DAT = 1
 __TYPE_FOUR_C_YAML = 2
@@ -109,7 +121,7 @@ def read(
             return read_four_c_yaml(f, out=out)
     elif ftype == __TYPE_CASE:
         # this is ensight gold file format
-        raise NotImplementedError("Case file reading is not implemented yet")
+        return ensightio.read_case(filename)
     elif ftype == __TYPE_MIMICS_STL:
         return from_mesh(mimics_stlio.read(filename))
     else:
@@ -194,7 +206,7 @@ def read_mesh(filename: str, file_format: Optional[str] = None) -> Mesh:
         return to_mesh(read(filename, file_format=file_format))
     elif ftype == __TYPE_CASE:
         # this is ensight gold file format
-        raise NotImplementedError("Case file reading into mesh is not implemented yet")
+        return to_mesh(read(filename, file_format=file_format))
     elif ftype == __TYPE_MIMICS_STL:
         return mimics_stlio.read(filename)
     else:
@@ -267,19 +279,34 @@ def from_mesh(mesh: Mesh) -> Discretization:
     return meshio_to_discretization.mesh2Discretization(mesh)
 
 
-def to_mesh(mesh: Discretization) -> Mesh:
+def to_mesh(
+    mesh: Discretization, nodeset_cells: bool = False, keep_order: bool = True
+) -> Mesh:
     """
-    Converts a discretization to a meshio.Mesh
+    Converts a discretization to a meshio.Mesh. The nodesets are exported as point sets and, if
+    nodeset_cells is true, additionally as vertex, line and surface cells. If keep_order is false,
+    the cells are grouped into one cell block per shape.
     """
     from . import meshio_to_discretization
 
-    return meshio_to_discretization.discretization2mesh(mesh)
+    return meshio_to_discretization.discretization2mesh(
+        mesh, keep_order=keep_order, nodeset_cells=nodeset_cells
+    )
 
 
 def to_pyvista(dis: Discretization):
     """
     Converts a discretization to a pyvista unstructured grid
     """
-    import pyvista
+    from . import pyvista_to_discretization
+
+    return pyvista_to_discretization.discretization2pyvista(dis)
+
+
+def from_pyvista(grid) -> Discretization:
+    """
+    Converts a pyvista unstructured grid to a discretization
+    """
+    from . import pyvista_to_discretization
 
-    return pyvista.from_meshio(to_mesh(dis))
+    return pyvista_to_discretization.pyvista2Discretization(grid)
@@ -1,4 +1,16 @@
-from typing import IO, TYPE_CHECKING, Dict, List, Set
+from operator import attrgetter
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 import numpy as np
 import yaml
@@ -7,9 +19,15 @@ from tqdm import tqdm
 from .element.element import Element1D, Element2D, Element3D
 from .element.element_container import ElementContainer
 from .fiber import Fiber
+from .fielddata import CategoricalColumn, ColumnTable, check_column, gather
+from .integration import integrate_coords
 from .ioutils import line_option, read_option_item, read_option_items, write_title
 from .node import Node
-from .nodeset import LineNodeset, PointNodeset, SurfaceNodeset, VolumeNodeset
+from .nodeset import LineNodeset, Nodeset, PointNodeset, SurfaceNodeset, VolumeNodeset
+from .spatial import BoundingBoxGrid, merge_points
+
+# maximum number of pairs of elements and points that are mapped at once
+_locate_chunk_size = 1 << 16
 
 
 class Discretization:
@@ -31,6 +49,18 @@ class Discretization:
         self.surfacenodesets: List[SurfaceNodeset] = []
         self.volumenodesets: List[VolumeNodeset] = []
 
+        # columnwise stored nodal and element variables (the data of each node and element is a
+        # view into a row of these columns, see ColumnTable)
+        self.node_data: Dict[str, np.ndarray] = {}
+        self.element_data: Dict[str, Dict[str, np.ndarray]] = {}
+
+        # columnwise stored nodal and element fibers (fiber type as key, np.array((num, 3)) as value)
+        self.node_fibers: Dict[str, np.ndarray] = {}
+        self.element_fibers: Dict[str, Dict[str, np.ndarray]] = {}
+
+        # columnwise stored element options (option name as key, categorical column as value)
+        self.element_options: Dict[str, Dict[str, CategoricalColumn]] = {}
+
     def compute_ids(self, zero_based: bool) -> None:
         """
         Computes the ids of the elements and nodes.
@@ -92,15 +122,633 @@ class Discretization:
 
     def get_node_coords(self) -> np.ndarray:
         """
-        Returns an np.array((num_node, 3)) with the coordinates of each node
+        Returns an np.array((num_node, 3)) with the coordinates of each node. If all nodes share
+        one coordinate buffer (nodes created with Node.from_coords, read from a dat file or merged
+        with merge_coincident_nodes), the buffer is returned without copying, i.e. changing the
+        array moves the nodes. Nodes that were reordered in place need to be bound again with
+        bind_data().
+        """
+        table = ColumnTable.of(self.nodes)
+        if table is not None and table.coords_complete:
+            return table.coords
+
+        return np.array([node.coords for node in self.nodes], dtype=float).reshape(
+            (-1, 3)
+        )
+
+    def set_node_data(self, name: str, values: np.ndarray) -> None:
+        """
+        Stores a nodal variable columnwise. The values are not copied, node.data[name] of each node
+        is a view into the corresponding row.
+
+        Args:
+            name: Name of the variable
+            values: np.array((num_nodes, ...)) with the values of the variable
+        """
+        values = check_column(name, values, len(self.nodes))
+        self.__bind_nodes()
+        self.node_data[name] = values
+
+    def set_element_data(
+        self,
+        name: str,
+        values: np.ndarray,
+        fieldtype: str = ElementContainer.TypeStructure,
+    ) -> None:
+        """
+        Stores an element variable of a field columnwise. The values are not copied, ele.data[name]
+        of each element is a view into the corresponding row.
+
+        Args:
+            name: Name of the variable
+            values: np.array((num_ele, ...)) with the values of the variable
+            fieldtype: Type of the element field (e.g. ElementContainer.TypeStructure)
+        """
+        values = check_column(name, values, len(self.elements[fieldtype]))
+        self.__bind_elements(fieldtype).data[name] = values
+
+    def get_node_data(self) -> Dict[str, np.ndarray]:
+        """
+        Returns all nodal variables. Columnwise stored variables are returned without copying.
+
+        Returns:
+            dict with the variable name as key and np.array((num_nodes, ...)) as value
+        """
+        self.__check_nodes()
+        for name, values in self.node_data.items():
+            check_column(name, values, len(self.nodes))
+
+        return gather(self.nodes, self.node_data, "_data")
+
+    def get_element_data(
+        self, fieldtype: str = ElementContainer.TypeStructure
+    ) -> Dict[str, np.ndarray]:
+        """
+        Returns all element variables of a field. Columnwise stored variables are returned without
+        copying.
+
+        Args:
+            fieldtype: Type of the element field (e.g. ElementContainer.TypeStructure)
+
+        Returns:
+            dict with the variable name as key and np.array((num_ele, ...)) as value
+        """
+        elements = self.elements[fieldtype]
+        self.__check_elements(fieldtype)
+        columns = self.element_data.get(fieldtype, {})
+        for name, values in columns.items():
+            check_column(name, values, len(elements))
+
+        return gather(elements, columns, "_data")
+
+    def set_node_fibers(self, fiber_type: str, fibers: np.ndarray) -> None:
+        """
+        Stores the fibers of one type of all nodes columnwise. The fibers are not copied,
+        node.fibers[fiber_type].fiber of each node is a view into the corresponding row.
+
+        Args:
+            fiber_type: Type of the fiber (e.g. Fiber.TypeFiber1)
+            fibers: np.array((num_nodes, 3)) with the fiber vectors
+        """
+        fibers = check_column(fiber_type, fibers, len(self.nodes))
+        self.__bind_nodes()
+        self.node_fibers[fiber_type] = fibers
+
+    def set_element_fibers(
+        self,
+        fiber_type: str,
+        fibers: np.ndarray,
+        fieldtype: str = ElementContainer.TypeStructure,
+    ) -> None:
+        """
+        Stores the fibers of one type of all elements of a field columnwise. The fibers are not
+        copied, ele.fibers[fiber_type].fiber of each element is a view into the corresponding row.
+
+        Args:
+            fiber_type: Type of the fiber (e.g. Fiber.TypeFiber1)
+            fibers: np.array((num_ele, 3)) with the fiber vectors
+            fieldtype: Type of the element field (e.g. ElementContainer.TypeStructure)
+        """
+        fibers = check_column(fiber_type, fibers, len(self.elements[fieldtype]))
+        self.__bind_elements(fieldtype).fibers[fiber_type] = fibers
+
+    def get_node_fibers(self) -> Dict[str, np.ndarray]:
+        """
+        Returns the fibers of all nodes. Columnwise stored fibers are returned without copying.
+
+        Returns:
+            dict with the fiber type as key and np.array((num_nodes, 3)) as value
+        """
+        self.__check_nodes()
+        for fiber_type, fibers in self.node_fibers.items():
+            check_column(fiber_type, fibers, len(self.nodes))
+
+        return gather(self.nodes, self.node_fibers, "_fibers", lambda f: f.fiber)
+
+    def get_element_fibers(
+        self, fieldtype: str = ElementContainer.TypeStructure
+    ) -> Dict[str, np.ndarray]:
+        """
+        Returns the fibers of all elements of a field. Columnwise stored fibers are returned
+        without copying.
+
+        Args:
+            fieldtype: Type of the element field (e.g. ElementContainer.TypeStructure)
+
+        Returns:
+            dict with the fiber type as key and np.array((num_ele, 3)) as value
+        """
+        elements = self.elements[fieldtype]
+        self.__check_elements(fieldtype)
+        columns = self.element_fibers.get(fieldtype, {})
+        for fiber_type, fibers in columns.items():
+            check_column(fiber_type, fibers, len(elements))
+
+        return gather(elements, columns, "_fibers", lambda f: f.fiber)
+
+    def compress_element_options(
+        self, fieldtype: str = ElementContainer.TypeStructure
+    ) -> None:
+        """
+        Moves the options of all elements of a field (MAT, KINEM, ...) into categorical columns.
+        Each distinct value is stored only once and ele.options of each element reads from and
+        writes into the corresponding row. This is done when reading a discretization and only
+        needs to be called again if elements were added or options were replaced afterwards.
+
+        Args:
+            fieldtype: Type of the element field (e.g. ElementContainer.TypeStructure)
+        """
+        elements = self.elements[fieldtype]
+        columns = self.__bind_elements(fieldtype).options
+
+        for i, ele in enumerate(elements):
+            options = ele._options
+            if not options:
+                continue
+
+            for key, value in options.items():
+                if key not in columns:
+                    columns[key] = CategoricalColumn(len(elements))
+                columns[key][i] = value
+
+            ele._options = None
+
+    def get_elements_with_option(
+        self, key: str, value, fieldtype: str = ElementContainer.TypeStructure
+    ) -> np.ndarray:
+        """
+        Returns the positions of the elements of a field with an option value (e.g. all elements
+        with MAT 3). Values are compared by their text representation in the input file.
+
+        Args:
+            key: Name of the option (e.g. MAT)
+            value: Value of the option
+            fieldtype: Type of the element field (e.g. ElementContainer.TypeStructure)
+
+        Returns:
+            np.array((num_found)) with the positions of the elements within the field
+        """
+        if fieldtype not in self.element_options:
+            self.compress_element_options(fieldtype)
+        self.__check_elements(fieldtype)
+
+        column = self.element_options[fieldtype].get(key, None)
+        if column is None:
+            return np.zeros((0), dtype=int)
+
+        return column.find(value)
+
+    def set_element_option(
+        self,
+        key: str,
+        value,
+        positions: Optional[np.ndarray] = None,
+        fieldtype: str = ElementContainer.TypeStructure,
+    ) -> None:
+        """
+        Sets an option of many elements of a field at once (e.g. MAT of all elements in positions)
+
+        Args:
+            key: Name of the option (e.g. MAT)
+            value: Value of the option, None removes the option
+            positions: Positions (or boolean mask) of the elements within the field. If None, the
+                option is set for all elements.
+            fieldtype: Type of the element field (e.g. ElementContainer.TypeStructure)
+        """
+        if fieldtype not in self.element_options:
+            self.compress_element_options(fieldtype)
+
+        elements = self.elements[fieldtype]
+        columns = self.__bind_elements(fieldtype).options
+        if key not in columns:
+            columns[key] = CategoricalColumn(len(elements))
+
+        if positions is None:
+            positions = slice(None)
+        columns[key][positions] = value
+
+    def interpolate_nodal_fibers(
+        self,
+        fibers: np.ndarray,
+        fieldtype: str = ElementContainer.TypeStructure,
+        numgp: Optional[int] = None,
+    ) -> np.ndarray:
+        """
+        Interpolates nodal fibers to the elements of a field. Elements of the same shape are
+        evaluated at once. The interpolated fibers are not normalized (see Fiber.normalize).
+
+        Args:
+            fibers: np.array((num_nodes, 3)) with the nodal fibers
+            fieldtype: Type of the element field (e.g. ElementContainer.TypeStructure)
+            numgp: Number of Gauss points per element. If None, the mean of the nodal fibers of
+                each element is returned.
+
+        Returns:
+            np.array((num_ele, 3)) if numgp is None, otherwise np.array((num_ele, numgp, 3))
+        """
+        fibers = check_column("fibers", fibers, len(self.nodes))
+        elements = self.elements[fieldtype]
+
+        self.compute_ids(zero_based=True)
+        groups = ElementContainer.group_by_shape(elements)
+
+        if numgp is None:
+            result = np.zeros((len(elements), fibers.shape[1]))
+        else:
+            result = np.zeros((len(elements), numgp, fibers.shape[1]))
+
+        for positions, node_ids in groups.values():
+            nodal_fibers = fibers[node_ids]
+
+            if numgp is None:
+                result[positions] = np.mean(nodal_fibers, axis=1)
+                continue
+
+            ele_type = type(elements[positions[0]])
+            if not hasattr(ele_type, "int_points"):
+                raise NotImplementedError(
+                    "Gauss points are not implemented for {0}".format(
+                        ele_type.ShapeName
+                    )
+                )
+
+            shape_fcns = ele_type.shape_fcns_many(
+                np.atleast_2d(ele_type.int_points(numgp))
+            )
+            result[positions] = np.einsum("gn,enk->egk", shape_fcns, nodal_fibers)
+
+        return result
+
+    def get_element_bounding_boxes(
+        self, fieldtype: str = ElementContainer.TypeStructure
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the axis aligned bounding boxes of the nodes of the elements of a field
+
+        Args:
+            fieldtype: Type of the element field (e.g. ElementContainer.TypeStructure)
+
+        Returns:
+            Tuple of the lower and upper corners np.array((num_ele, 3))
+        """
+        return ElementLocator.of(self, fieldtype).get_bounding_boxes()
+
+    def locate_points(
+        self,
+        points: np.ndarray,
+        fieldtype: str = ElementContainer.TypeStructure,
+        tol: float = 1e-10,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Finds the elements of a field that contain the points (see ElementLocator.locate)
+
+        Args:
+            points: np.array((num_points, 3)) with the coordinates of the points
+            fieldtype: Type of the element field (e.g. ElementContainer.TypeStructure)
+            tol: Tolerance in reference coordinates (see Element.is_in_ref), such that points on the
+                boundary are found despite round-off errors
+
+        Returns:
+            Tuple of the positions of the elements within the field np.array((num_points)) (-1 for
+            points outside of all elements) and the local coordinates np.array((num_points, dim))
+            (nan for points outside of all elements)
+        """
+        return ElementLocator.of(self, fieldtype).locate(points, tol)
+
+    def integrate(
+        self,
+        integrand: Optional[Callable] = None,
+        fieldtype: str = ElementContainer.TypeStructure,
+        positions: Optional[np.ndarray] = None,
+        numgp: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Integrates over all (or the selected) elements of a field. Elements of the same shape are
+        integrated at once (see integration.integrate_coords).
+
+        Args:
+            integrand: Vectorized function integrand(x, normals) of the coordinates of the Gauss
+                points np.array((num_ele, numgp, 3)) (see integration.integrate_coords). If None,
+                the volumes of the elements are computed.
+            fieldtype: Type of the element field (e.g. ElementContainer.TypeStructure)
+            positions: Positions (or boolean mask) of the elements within the field. If None, all
+                elements are integrated.
+            numgp: Number of Gauss points (default see integration.get_default_numgp)
+
+        Returns:
+            Tuple of the integrals over each selected element np.array((num_selected, ...)) and
+            their sum
+        """
+        elements = self.elements[fieldtype]
+        if positions is None:
+            positions = np.arange(len(elements))
+        positions = np.arange(len(elements))[positions]
+
+        # row of each element within the selection
+        rows = np.full((len(elements)), -1, dtype=int)
+        rows[positions] = np.arange(len(positions))
+
+        self.compute_ids(zero_based=True)
+        coords = self.get_node_coords()
+
+        per_element: Optional[np.ndarray] = None
+        for group_positions, node_ids in ElementContainer.group_by_shape(
+            elements
+        ).values():
+            is_selected = rows[group_positions] >= 0
+            if not np.any(is_selected):
+                continue
+
+            result = integrate_coords(
+                type(elements[group_positions[0]]),
+                coords[node_ids[is_selected]],
+                integrand,
+                numgp,
+            )
+            if per_element is None:
+                per_element = np.zeros((len(positions),) + result.shape[1:])
+            per_element[rows[group_positions[is_selected]]] = result
+
+        if per_element is None:
+            per_element = np.zeros((0))
+
+        return per_element, np.sum(per_element, axis=0)
+
+    def merge_coincident_nodes(self, tol: float = 0.0) -> Dict[str, int]:
+        """
+        Merges nodes at the same position (within the tolerance, see spatial.merge_points) into
+        the first of these nodes. The elements and nodesets of the removed nodes are remapped to
+        the kept node. Columnwise stored nodal data and fibers are compacted, the data of the
+        removed nodes is dropped. If nodes were merged, the node ids are zero-based afterwards.
+
+        Args:
+            tol: Nodes with a distance of at most tol are merged (0: only nodes with exactly the
+                same coordinates)
+
+        Returns:
+            dict with the number of removed nodes (merged_nodes), the number of elements with
+            remapped nodes (remapped_elements), the number of these elements that now contain a
+            node more than once (degenerated_elements) and the number of changed nodesets
+            (remapped_nodesets)
+        """
+        report = {
+            "merged_nodes": 0,
+            "remapped_elements": 0,
+            "degenerated_elements": 0,
+            "remapped_nodesets": 0,
+        }
+
+        coords = self.get_node_coords()
+        kept, inverse = merge_points(coords, tol)
+        if len(kept) == len(self.nodes):
+            return report
+
+        self.__check_nodes()
+
+        self.compute_ids(zero_based=True)
+        nodes = self.nodes
+        new_nodes = list(map(nodes.__getitem__, kept.tolist()))
+        is_merged = kept[inverse] != np.arange(len(nodes))
+        report["merged_nodes"] = len(nodes) - len(kept)
+
+        # only the elements with removed nodes need new nodes
+        get_node = new_nodes.__getitem__
+        for eles in self.elements.values():
+            for positions, node_ids in ElementContainer.group_by_shape(eles).values():
+                rows = np.flatnonzero(np.any(is_merged[node_ids], axis=1))
+                new_ids = inverse[node_ids[rows]]
+                for position, ids in zip(positions[rows].tolist(), new_ids.tolist()):
+                    eles[position].nodes = list(map(get_node, ids))
+
+                report["remapped_elements"] += len(rows)
+                report["degenerated_elements"] += int(
+                    np.sum(
+                        np.any(np.diff(np.sort(new_ids, axis=1), axis=1) == 0, axis=1)
+                    )
+                )
+
+        for attribute, nodesets in (
+            ("pointnodesets", self.pointnodesets),
+            ("linenodesets", self.linenodesets),
+            ("surfacenodesets", self.surfacenodesets),
+            ("volumenodesets", self.volumenodesets),
+        ):
+            for ns in nodesets:
+                ids = np.fromiter((n.id for n in ns), dtype=int, count=len(ns))
+                is_merged_ns = is_merged[ids]
+                if not np.any(is_merged_ns):
+                    continue
+
+                new_ids = np.unique(inverse[ids])
+                ns.nodes = set(map(get_node, new_ids.tolist()))
+                report["remapped_nodesets"] += 1
+
+                # the kept nodes inherit the nodeset of the removed nodes
+                has_nodeset = np.zeros((len(kept)), dtype=bool)
+                has_nodeset[inverse[ids[~is_merged_ns]]] = True
+                targets = np.unique(inverse[ids[is_merged_ns]])
+                for i in targets[~has_nodeset[targets]].tolist():
+                    getattr(new_nodes[i], attribute).append(ns)
+
+        # all kept nodes share one compacted coordinate buffer
+        ColumnTable(new_nodes, coords[kept]).bind()
+        for i, node in enumerate(new_nodes):
+            node.id = i
+
+        self.nodes = new_nodes
+        self.node_data = {name: values[kept] for name, values in self.node_data.items()}
+        self.node_fibers = {
+            fiber_type: fibers[kept] for fiber_type, fibers in self.node_fibers.items()
+        }
+        self.__bind_nodes()
+
+        return report
+
+    def bind_data(self) -> None:
+        """
+        Binds the coordinates, data, fibers and options of all nodes and elements to the
+        columnwise stored variables. The coordinates of the nodes are gathered into one shared
+        buffer. This is done automatically when a variable is set or returned. The columnwise
+        stored variables are reordered along with the nodes and elements, if they were reordered
+        (in place or as a new list) since they were bound.
+        """
+        self.__bind_nodes(rebind=True)
+        for fieldtype in self.elements.keys():
+            self.__bind_elements(fieldtype, rebind=True)
+
+    def __check_nodes(self) -> None:
+        """
+        Makes sure that the columnwise stored nodal variables are aligned with the nodes
+        """
+        if (
+            len(self.node_data) > 0
+            or len(self.node_fibers) > 0
+            or self.__is_owner(self.nodes)
+        ):
+            self.__bind_nodes()
+
+    def __check_elements(self, fieldtype: str) -> None:
+        """
+        Makes sure that the columnwise stored element variables of a field are aligned with the
+        elements
+        """
+        if any(
+            len(columns.get(fieldtype, {})) > 0
+            for columns in (
+                self.element_data,
+                self.element_fibers,
+                self.element_options,
+            )
+        ) or self.__is_owner(self.elements[fieldtype]):
+            self.__bind_elements(fieldtype)
+
+    def __is_owner(self, items: Sequence) -> bool:
+        """
+        Returns whether any of the items is bound to a table of this discretization, e.g. after the
+        items were moved from another field
+        """
+        return any(
+            t is not None and t.owner is self
+            for t in set(map(attrgetter("_table"), items))
+        )
+
+    def __bind_nodes(self, rebind: bool = False) -> ColumnTable:
+        """
+        Returns the table of the nodes, the nodes are bound to a new table if necessary
+        """
+        columns = {"data": self.node_data, "fibers": self.node_fibers}
+        table = self.__bind_table(self.nodes, columns, rebind)
+        self.node_data = columns["data"]
+        self.node_fibers = columns["fibers"]
+
+        if rebind:
+            # the coordinates are gathered into a new buffer
+            coords = np.array([node.coords for node in self.nodes], dtype=float)
+            table = ColumnTable(self.nodes, coords.reshape((-1, 3)))
+            table.bind()
+        elif table is None:
+            table = ColumnTable(self.nodes)
+            table.bind()
+
+        table.data = self.node_data
+        table.fibers = self.node_fibers
+        table.owner = self
+        return table
+
+    def __bind_elements(self, fieldtype: str, rebind: bool = False) -> ColumnTable:
+        """
+        Returns the table of the elements of a field, the elements are bound to a new table if
+        necessary
+        """
+        elements = self.elements[fieldtype]
+        columns = {
+            "data": self.element_data.setdefault(fieldtype, {}),
+            "fibers": self.element_fibers.setdefault(fieldtype, {}),
+            "options": self.element_options.setdefault(fieldtype, {}),
+        }
+        table = self.__bind_table(elements, columns, rebind)
+        self.element_data[fieldtype] = columns["data"]
+        self.element_fibers[fieldtype] = columns["fibers"]
+        self.element_options[fieldtype] = columns["options"]
+
+        if table is None:
+            table = ColumnTable(elements)
+            table.bind()
+
+        table.data = columns["data"]
+        table.fibers = columns["fibers"]
+        table.options = columns["options"]
+        table.owner = self
+
+        # elements may have been appended since the options were set
+        for column in table.options.values():
+            if len(column) != len(elements):
+                column.resize(len(elements))
+
+        return table
+
+    def __bind_table(
+        self, items: Sequence, columns: Dict[str, Dict], rebind: bool
+    ) -> Optional[ColumnTable]:
+        """
+        Returns the table the items are bound to as a whole or None, if they have to be bound to a
+        new table. If the items were reordered or moved from another list since they were bound,
+        the columnwise stored variables are gathered from the tables of the items into new
+        columns, which replace the columns in the given dict. The previous tables keep their
+        columns.
+
+        Args:
+            items: List of nodes or elements
+            columns: The columnwise stored variables of the discretization by the name of the
+                table attribute (data, fibers, options)
+            rebind: Whether the items have to be bound to a new table
+
+        Raises:
+            RuntimeError: If the items are bound to the variables of another discretization or if
+                a variable is not stored for all items
         """
-        arr: np.ndarray = np.zeros((len(self.nodes), 3))
+        table = ColumnTable.of(items)
+        if table is not None and (
+            table.owner is None
+            or (
+                table.owner is self
+                and all(getattr(table, key) is c for key, c in columns.items())
+            )
+        ):
+            # the variables are aligned with the items
+            return None if rebind else table
+
+        item_type = "elements" if "options" in columns else "nodes"
+        for t in set(map(attrgetter("_table"), items)):
+            if (
+                t is not None
+                and t.owner is not None
+                and t.owner is not self
+                and any(len(getattr(t, key)) > 0 for key in columns.keys())
+            ):
+                raise RuntimeError(
+                    "The {0} are bound to the variables of another discretization".format(
+                        item_type
+                    )
+                )
 
-        for i, node in enumerate(self.nodes):
-            arr[i, :] = node.coords
-            i += 1
+        for key, own in columns.items():
+            gathered = ColumnTable.gather_columns(items, key)
+            merged = {}
+            for name, values in own.items():
+                if name in gathered:
+                    merged[name] = gathered.pop(name)
+                elif isinstance(values, CategoricalColumn):
+                    merged[name] = CategoricalColumn(len(items))
+                else:
+                    raise RuntimeError(
+                        "Variable {0} is not stored for the {1}, they were replaced since it was "
+                        "set".format(name, item_type)
+                    )
+            merged.update(gathered)
+            columns[key] = merged
 
-        return arr
+        return None
 
     def get_dline_elements(self, id: int) -> List[Element1D]:
         """
@@ -167,6 +815,120 @@ class Discretization:
                         added_vols.add(vol_id)
         return vol_elements
 
+    def get_element_nodeset_membership(
+        self,
+        nodesets: Sequence[Nodeset],
+        fieldtype: str = ElementContainer.TypeStructure,
+    ) -> np.ndarray:
+        """
+        Returns for all elements of a field, which nodesets contain all nodes of the element. This
+        is the bulk version of Element.get_dpoints(), get_dlines(), get_dsurfs() and get_dvols().
+
+        Args:
+            nodesets: List of nodesets (e.g. dis.surfacenodesets)
+            fieldtype: Type of the element field (e.g. ElementContainer.TypeStructure)
+
+        Returns:
+            np.array((num_ele, num_nodesets), dtype=bool)
+        """
+        elements = self.elements[fieldtype]
+        membership = np.zeros((len(elements), len(nodesets)), dtype=bool)
+
+        self.compute_ids(zero_based=True)
+        groups = ElementContainer.group_by_shape(elements)
+
+        for j, mask in enumerate(self.__get_nodeset_masks(nodesets)):
+            for positions, node_ids in groups.values():
+                membership[positions, j] = np.all(mask[node_ids], axis=1)
+
+        return membership
+
+    def get_face_nodeset_membership(
+        self,
+        nodesets: Sequence[Nodeset],
+        fieldtype: str = ElementContainer.TypeStructure,
+    ) -> np.ndarray:
+        """
+        Returns for all faces of all elements of a field, which nodesets contain all nodes of the
+        face. The faces are ordered as returned by Element.get_faces(). Elements with less faces
+        than the maximum number of faces are padded with False.
+
+        Args:
+            nodesets: List of nodesets (e.g. dis.surfacenodesets)
+            fieldtype: Type of the element field (e.g. ElementContainer.TypeStructure)
+
+        Returns:
+            np.array((num_ele, max_num_faces, num_nodesets), dtype=bool)
+        """
+        elements = self.elements[fieldtype]
+
+        self.compute_ids(zero_based=True)
+        groups = ElementContainer.group_by_shape(elements)
+
+        face_node_ids: Dict[str, List[List[int]]] = {}
+        for shape, (positions, _) in groups.items():
+            faces = type(elements[positions[0]]).FaceNodeIds
+            if faces is None:
+                raise RuntimeError(
+                    "Element of shape {0} does not define its faces".format(shape)
+                )
+            face_node_ids[shape] = faces
+
+        max_num_faces = max([len(f) for f in face_node_ids.values()], default=0)
+        membership = np.zeros((len(elements), max_num_faces, len(nodesets)), dtype=bool)
+
+        for j, mask in enumerate(self.__get_nodeset_masks(nodesets)):
+            for shape, (positions, node_ids) in groups.items():
+                node_mask = mask[node_ids]
+                for k, face in enumerate(face_node_ids[shape]):
+                    membership[positions, k, j] = np.all(node_mask[:, face], axis=1)
+
+        return membership
+
+    def __get_nodeset_masks(self, nodesets: Sequence[Nodeset]) -> Iterator[np.ndarray]:
+        """
+        Yields for each nodeset a mask np.array((num_nodes), dtype=bool) of the nodes within the
+        nodeset. The node ids have to be computed zero based before.
+        """
+        for ns in nodesets:
+            mask = np.zeros(len(self.nodes), dtype=bool)
+            mask[np.fromiter((n.id for n in ns), dtype=int, count=len(ns))] = True
+            yield mask
+
+    def __get_node_lines(self, out=True) -> List[str]:
+        """
+        Returns the lines of the nodes in the dat file. The coordinates of a shared coordinate
+        buffer and the columnwise stored fibers are formatted for all nodes at once.
+        """
+        table = ColumnTable.of(self.nodes)
+        if table is not None and table.coords_complete:
+            coord_texts = [
+                "{0} {1} {2}".format(*coords) for coords in table.coords.tolist()
+            ]
+        else:
+            coord_texts = [
+                " ".join([str(i) for i in node.coords]) for node in self.nodes
+            ]
+
+        lines = []
+        for node, coord_text, fiber_line in tqdm(
+            zip(self.nodes, coord_texts, Fiber.get_item_lines(self.nodes)),
+            total=len(self.nodes),
+            disable=not out,
+            desc="Write Nodes",
+        ):
+            if node.id is None:
+                raise RuntimeError("You have to compute ids before writing")
+
+            if len(fiber_line) > 0:
+                lines.append(
+                    "FNODE {0} COORD {1} {2}".format(node.id, coord_text, fiber_line)
+                )
+            else:
+                lines.append("NODE {0} COORD {1}".format(node.id, coord_text))
+
+        return lines
+
     def get_sections(self, out=True) -> Dict[str, List[str]]:
         self.compute_ids(zero_based=False)
 
@@ -188,10 +950,7 @@ class Discretization:
                 sections[section_name].extend(nsi.get_lines())
 
         # write nodes
-        nodes = []
-        for node in tqdm(self.nodes, disable=not out, desc="Write Nodes"):
-            nodes.append(node.get_line())
-        sections["NODE COORDS"] = nodes
+        sections["NODE COORDS"] = self.__get_node_lines(out=out)
 
         # write elements
         sections.update(self.elements.get_sections(out=out))
@@ -270,6 +1029,8 @@ class Discretization:
         disc = Discretization()
 
         # read nodes
+        node_lines: List[str] = []
+        node_coords: List[List[str]] = []
         for line in tqdm(sections["NODE COORDS"], disable=not out, desc="Nodes"):
             if "FNODE" in line:
                 # this is a fiber node
@@ -282,22 +1043,31 @@ class Discretization:
                 continue
 
             coords_str, _ = read_option_items(line, "COORD", num=3)
-
-            coords = np.array([float(i) for i in coords_str])
-
-            node = Node(coords=coords)
-            disc.nodes.append(node)
+            node_coords.append(coords_str)
+            node_lines.append(line)
 
             # safety check for integrity of the dat file
-            if int(nodeid) != len(disc.nodes):
+            if int(nodeid) != len(node_lines):
                 raise RuntimeError(
                     "Node ids in dat file have a gap at {0} != {1}!".format(
-                        nodeid, len(disc.nodes)
+                        nodeid, len(node_lines)
                     )
                 )
 
-            # read fibers
-            node.fibers = Fiber.parse_fibers(line)
+        # all nodes share one coordinate array
+        disc.nodes = Node.from_coords(
+            np.array(node_coords, dtype=float).reshape((-1, 3))
+        )
+
+        # read fibers: fiber types defined at all nodes are stored columnwise
+        for fiber_type, (positions, fibers) in Fiber.parse_fiber_arrays(
+            node_lines
+        ).items():
+            if len(positions) == len(disc.nodes):
+                disc.set_node_fibers(fiber_type, fibers)
+            else:
+                for i, fiber in zip(positions, fibers):
+                    disc.nodes[i].fibers[fiber_type] = Fiber(fiber)
 
         # read DPOINT topology
         if "DNODE-NODE TOPOLOGY" in sections:
@@ -328,6 +1098,14 @@ class Discretization:
             sections, disc.nodes, out=out
         )
 
+        # the element options and fibers are read columnwise
+        for fieldtype, elements in disc.elements.items():
+            table = ColumnTable.of(elements)
+            if table is not None:
+                disc.element_options[fieldtype] = table.options
+                disc.element_fibers[fieldtype] = table.fibers
+            disc.compress_element_options(fieldtype)
+
         # finalize discretization -> Creates internal references
         disc.finalize()
         return disc
@@ -341,3 +1119,145 @@ class Discretization:
             s += "{0:>10} {1} elements\n".format(len(eles), key)
 
         return s
+
+
+class ElementLocator:
+    """
+    Finds the elements that contain points. The elements of one field are given as plain arrays
+    (the nodal coordinates and the node ids of the elements grouped by shape), such that they can
+    be sent to other processes without the node and element objects. The grid over the bounding
+    boxes of the elements is built on first use and kept for further queries.
+    """
+
+    def __init__(
+        self,
+        coords: np.ndarray,
+        groups: List[Tuple[type, np.ndarray, np.ndarray]],
+        num_ele: int,
+    ):
+        """
+        Initialize the locator
+
+        Args:
+            coords: np.array((num_nodes, 3)) with the nodal coordinates
+            groups: List of the element type, the positions of its elements within the field
+                np.array((num_ele_of_type)) and their node ids np.array((num_ele_of_type,
+                num_nodes_per_ele)) (see ElementContainer.group_by_shape)
+            num_ele: Number of elements of the field
+        """
+        self.coords = coords
+        self.groups = groups
+        self.num_ele = num_ele
+
+        self.__boxes: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self.__grid: Optional[BoundingBoxGrid] = None
+        self.__grid_tol: Optional[float] = None
+
+    @staticmethod
+    def of(
+        dis: Discretization, fieldtype: str = ElementContainer.TypeStructure
+    ) -> "ElementLocator":
+        """
+        Creates the locator of the elements of a field of the discretization
+
+        Args:
+            dis: Discretization
+            fieldtype: Type of the element field (e.g. ElementContainer.TypeStructure)
+
+        Returns:
+            Locator of the elements
+        """
+        elements = dis.elements[fieldtype]
+
+        dis.compute_ids(zero_based=True)
+        groups = [
+            (type(elements[positions[0]]), positions, node_ids)
+            for positions, node_ids in ElementContainer.group_by_shape(
+                elements
+            ).values()
+        ]
+
+        return ElementLocator(dis.get_node_coords(), groups, len(elements))
+
+    def get_bounding_boxes(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the axis aligned bounding boxes of the nodes of the elements
+
+        Returns:
+            Tuple of the lower and upper corners np.array((num_ele, 3))
+        """
+        if self.__boxes is None:
+            lower = np.zeros((self.num_ele, 3))
+            upper = np.zeros((self.num_ele, 3))
+            for _, positions, node_ids in self.groups:
+                ele_coords = self.coords[node_ids]
+                lower[positions] = np.min(ele_coords, axis=1)
+                upper[positions] = np.max(ele_coords, axis=1)
+
+            self.__boxes = (lower, upper)
+
+        return self.__boxes
+
+    def locate(
+        self, points: np.ndarray, tol: float = 1e-10
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Finds the elements that contain the points. The candidate elements of each point are found
+        with a grid over the bounding boxes of the elements (see spatial.BoundingBoxGrid), the
+        local coordinates are only computed for these candidates. All candidates of the same
+        element shape are mapped at once (see Element.get_xi_many). If a point is within several
+        elements (e.g. on a shared face), the first element is returned.
+
+        Args:
+            points: np.array((num_points, 3)) with the coordinates of the points
+            tol: Tolerance in reference coordinates (see Element.is_in_ref), such that points on the
+                boundary are found despite round-off errors
+
+        Returns:
+            Tuple of the positions of the elements within the field np.array((num_points)) (-1 for
+            points outside of all elements) and the local coordinates np.array((num_points, dim))
+            (nan for points outside of all elements)
+        """
+        points = np.asarray(points, dtype=float)
+        if len(points.shape) != 2 or points.shape[1] != 3:
+            raise ValueError(
+                "Expected points of shape (num_points, 3), got {0}".format(points.shape)
+            )
+
+        dim = max(
+            [ele_type.get_space_dim() for ele_type, _, _ in self.groups], default=3
+        )
+
+        # enlarge the boxes slightly, such that points on the boundary are not missed
+        if self.__grid is None or self.__grid_tol != tol:
+            lower, upper = self.get_bounding_boxes()
+            margin = tol * np.max(upper - lower, axis=1, keepdims=True)
+            self.__grid = BoundingBoxGrid(lower - margin, upper + margin)
+            self.__grid_tol = tol
+        point_ids, candidates = self.__grid.query(points)
+
+        is_in = np.zeros((len(point_ids)), dtype=bool)
+        candidate_xi = np.full((len(point_ids), dim), np.nan)
+        ele_index = np.zeros((self.num_ele), dtype=int)
+        for ele_type, positions, node_ids in self.groups:
+            ele_index[positions] = np.arange(len(positions))
+            pairs = np.flatnonzero(np.isin(candidates, positions))
+
+            # limit the memory of the stacked nodal coordinates
+            for start in range(0, len(pairs), _locate_chunk_size):
+                chunk = pairs[start : start + _locate_chunk_size]
+                chunk_xi, converged = ele_type.get_xi_many(
+                    self.coords[node_ids[ele_index[candidates[chunk]]]],
+                    points[point_ids[chunk]],
+                )
+                candidate_xi[chunk, : chunk_xi.shape[1]] = chunk_xi
+                is_in[chunk] = converged & ele_type.is_in_ref_many(chunk_xi, tol=tol)
+
+        # the candidates are sorted by the point and the element
+        found, first = np.unique(point_ids[is_in], return_index=True)
+        ele_positions = np.full((len(points)), -1, dtype=int)
+        ele_positions[found] = candidates[is_in][first]
+        xi = np.full((len(points), dim), np.nan)
+        xi[found] = candidate_xi[is_in][first]
+
+        return ele_positions, xi
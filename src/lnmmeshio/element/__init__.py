@@ -1,4 +1,6 @@
-from typing import List
+from typing import List, Optional
+
+import numpy as np
 
 from .. import node
 from .element import (
@@ -10,10 +12,64 @@ from .element import (
     ElementTet,
     ElementTri,
 )
-from .parse_element import create_element
+from .parse_element import create_element, get_element_type
 
 
 def factory(
     shape: str, nodes: List[node.Node], type: str = None, throw_if_unknown: bool = True
 ) -> Element:
     return create_element(type, shape, nodes, throw_if_unknown=throw_if_unknown)
+
+
+def factory_many(
+    shape: str,
+    connectivity: np.ndarray,
+    nodes: List[node.Node],
+    type: str = None,
+    options: Optional[dict] = None,
+    throw_if_unknown: bool = True,
+) -> List[Element]:
+    """
+    Creates a block of elements of the same shape at once
+
+    Args:
+        shape: shape of the elements (e.g. HEX8)
+        connectivity: np.array((num_ele, num_nodes_per_ele)) with the (zero based) positions of the
+            nodes of each element within nodes
+        nodes: List of nodes
+        type: element type as used by BACI (e.g. SOLID)
+        options: Options of each element (e.g. {"MAT": 1}), each element gets its own copy
+        throw_if_unknown: bool Throw an exception, if element type is not known
+
+    Returns:
+        List of elements
+    """
+    connectivity = np.asarray(connectivity)
+    if len(connectivity.shape) != 2:
+        raise ValueError(
+            "Connectivity needs to be of shape (num_ele, num_nodes_per_ele), got {0}".format(
+                connectivity.shape
+            )
+        )
+
+    cls = get_element_type(shape, throw_if_unknown=throw_if_unknown)
+    if cls is not None and connectivity.shape[1] != cls.get_num_nodes():
+        raise RuntimeError(
+            "You tried to created {0} elements with {1} nodes".format(
+                shape, connectivity.shape[1]
+            )
+        )
+
+    if cls is None:
+        cls = Element
+
+    # the number of nodes is checked once for the whole block, so the elements are initialized
+    # with the base constructor
+    get_node = nodes.__getitem__
+    elements: List[Element] = []
+    for ele_node_ids in connectivity.tolist():
+        ele = cls.__new__(cls)
+        Element.__init__(ele, type, shape, list(map(get_node, ele_node_ids)), options)
+        elements.append(ele)
+
+    return elements
@@ -1,10 +1,11 @@
 import io
 import math
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 import numpy as np
 
-from ..fiber import Fiber
+from ..fiber import Fiber, FiberView
+from ..fielddata import ColumnTable, DataView, OptionView
 from ..ioutils import (
     line_option_list,
     read_option_item,
@@ -14,12 +15,43 @@ from ..ioutils import (
 )
 from ..node import Node
 
+# number of nodes of the element shapes as used in baci .dat file format
+NumNodesByShape: Dict[str, int] = {
+    "VERTEX1": 1,
+    "TET4": 4,
+    "TET10": 10,
+    "PYRAMID5": 5,
+    "HEX8": 8,
+    "HEX20": 20,
+    "HEX27": 27,
+    "WEDGE6": 6,
+    "QUAD4": 4,
+    "TRI3": 3,
+    "TRI6": 6,
+    "LINE2": 2,
+    "LINE3": 3,
+    "QUAD8": 8,
+    "QUAD9": 9,
+}
+
 
 class Element:
     """
     Class holding the data of one element
     """
 
+    # local node ids of each face of the element (None if the element does not define faces)
+    FaceNodeIds: Optional[List[List[int]]] = None
+
+    # table of the columnwise stored variables and the row of the element (see ColumnTable)
+    _table: Optional[ColumnTable] = None
+    _row: int = 0
+
+    # locally stored options, fibers and data (None if there are none)
+    _options: Optional[Dict[str, Any]] = None
+    _fibers: Optional[Dict[str, Fiber]] = None
+    _data: Optional[Dict[str, Any]] = None
+
     def __init__(
         self,
         el_type: Optional[str],
@@ -39,9 +71,45 @@ class Element:
         self.type = el_type
         self.shape = shape
         self.nodes = nodes
-        self.options = options if options is not None else {}
-        self.fibers: Dict[str, Fiber] = {}
-        self.data: Dict[str, Union[np.ndarray, int, float]] = {}
+        if options is not None:
+            self._options = dict(options)
+
+    @property
+    def options(self) -> OptionView:
+        """
+        Options of the element (e.g. MAT or KINEM)
+        """
+        return OptionView(self)
+
+    @options.setter
+    def options(self, options: Mapping[str, Any]) -> None:
+        options = dict(options)
+
+        # the columnwise stored options of the element are replaced as well
+        OptionView(self).clear()
+        self._options = options
+
+    @property
+    def fibers(self) -> FiberView:
+        """
+        Fibers of the element (fiber type as key, Fiber as value)
+        """
+        return FiberView(self)
+
+    @fibers.setter
+    def fibers(self, fibers: Mapping[str, Fiber]) -> None:
+        self._fibers = dict(fibers)
+
+    @property
+    def data(self) -> DataView:
+        """
+        Additional data of the element (variable name as key)
+        """
+        return DataView(self)
+
+    @data.setter
+    def data(self, data: Mapping[str, Any]) -> None:
+        self._data = dict(data)
 
     @classmethod
     def get_num_nodes(cls) -> int:
@@ -191,9 +259,10 @@ class Element:
 
         line.write(line_option_list(options))
 
-        for t, f in self.fibers.items():
+        fiber_line = self.fibers.get_line()
+        if len(fiber_line) > 0:
             line.write(" ")
-            line.write(f.get_line(t))
+            line.write(fiber_line)
 
         return line.getvalue()
 
@@ -212,9 +281,10 @@ class Element:
 
         write_option_list(dest, options, newline=False)
 
-        for t, f in self.fibers.items():
+        fiber_line = self.fibers.get_line()
+        if len(fiber_line) > 0:
             dest.write(" ")
-            f.write(dest, t)
+            dest.write(fiber_line)
 
         dest.write("\n")
 
@@ -243,18 +313,53 @@ class Element:
         raise NotImplementedError("This is currently not implemented for all elements")
 
     @classmethod
-    def is_in_ref(cls, xi, include_boundary=True):
+    def is_in_ref(cls, xi, include_boundary=True, tol=0.0):
         """
         Checkes whether a point in reference coordinates is within the element
 
         Args:
             xi: Point in reference coordinates
+            include_boundary: bool, Whether or not to include the boundary
+            tol: Tolerance in reference coordinates, the element is enlarged by tol
 
         Returns:
             True if the point is within the element (or on the bounrary), otherwise False
         """
         raise NotImplementedError("This is currently not implemented for all elements")
 
+    @classmethod
+    def get_xi_many(cls, coords, x, tol=1e-10, max_iter=20):
+        """
+        Returns the local coordinates of many points in many elements of this type at once
+
+        Args:
+            coords: np.array((k, num_nodes, 3)) with the nodal coordinates of the element of each
+                pair of element and point
+            x: np.array((k, 3)) with the point of each pair
+            tol: Tolerance of the local coordinates
+            max_iter: Maximum number of iterations
+
+        Returns:
+            Tuple of the local coordinates np.array((k, dim)) and a mask np.array((k)) whether
+            they have converged
+        """
+        raise NotImplementedError("This is currently not implemented for all elements")
+
+    @classmethod
+    def is_in_ref_many(cls, xi, include_boundary=True, tol=0.0):
+        """
+        Checkes whether many points in reference coordinates are within the element
+
+        Args:
+            xi: np.array((m, dim)) with the points in reference coordinates
+            include_boundary: bool, Whether or not to include the boundary
+            tol: Tolerance in reference coordinates, the element is enlarged by tol
+
+        Returns:
+            np.array((m)) with True for the points within the element (or on the boundary)
+        """
+        raise NotImplementedError("This is currently not implemented for all elements")
+
     def is_in(self, x, include_boundary=True):
         """
         Check whether a point is within the element
@@ -327,28 +432,10 @@ class Element:
         Returngs:
             int: number of nodes
         """
-        shape_dict = {
-            "VERTEX1": 1,
-            "TET4": 4,
-            "TET10": 10,
-            "PYRAMID5": 5,
-            "HEX8": 8,
-            "HEX20": 20,
-            "HEX27": 27,
-            "WEDGE6": 6,
-            "QUAD4": 4,
-            "TRI3": 3,
-            "TRI6": 6,
-            "LINE2": 2,
-            "LINE3": 3,
-            "QUAD8": 8,
-            "QUAD9": 9,
-        }
-
-        if shape not in shape_dict:
+        if shape not in NumNodesByShape:
             raise ValueError("Element of shape {0} is unknown".format(shape))
 
-        return shape_dict[shape]
+        return NumNodesByShape[shape]
 
     @classmethod
     def shape_fcns(cls, xi):
@@ -357,6 +444,51 @@ class Element:
         """
         raise NotImplementedError("This element has not implemented shape functions")
 
+    @classmethod
+    def shape_fcns_derivs(cls, xi):
+        """
+        Returns the value of the derivatives of the shape functions with respect to the local
+        coordinates at the local coordinate xi
+        """
+        raise NotImplementedError(
+            "This element has not implemented derivatives of the shape functions"
+        )
+
+    @classmethod
+    def shape_fcns_many(cls, xi: np.ndarray) -> np.ndarray:
+        """
+        Returns the values of the shape functions at many local coordinates at once. Elements
+        without a vectorized implementation evaluate shape_fcns point by point.
+
+        Args:
+            xi: np.array((m, dim)) with the local coordinates
+
+        Returns:
+            np.array((m, num_nodes)) with the values of the shape functions
+        """
+        xi = np.asarray(xi, dtype=float)
+        return np.array([np.reshape(cls.shape_fcns(p), (-1)) for p in xi]).reshape(
+            (len(xi), -1)
+        )
+
+    @classmethod
+    def shape_fcns_derivs_many(cls, xi: np.ndarray) -> np.ndarray:
+        """
+        Returns the derivatives of the shape functions with respect to the local coordinates at
+        many local coordinates at once. Elements without a vectorized implementation evaluate
+        shape_fcns_derivs point by point.
+
+        Args:
+            xi: np.array((m, dim)) with the local coordinates
+
+        Returns:
+            np.array((m, dim, num_nodes)) with the derivatives of the shape functions
+        """
+        xi = np.asarray(xi, dtype=float)
+        return np.array(
+            [np.reshape(cls.shape_fcns_derivs(p), (xi.shape[1], -1)) for p in xi]
+        ).reshape((len(xi), xi.shape[1], -1))
+
     @classmethod
     def int_points(cls, num_points):
         """
@@ -402,6 +534,9 @@ class Element2D(Element):
 
 
 class Element3D(Element):
+    # local coordinates of the center of the element, the start of the inverse mapping
+    ReferenceCenter: np.ndarray = np.zeros((3))
+
     @classmethod
     def get_space_dim(cls):
         """
@@ -412,6 +547,89 @@ class Element3D(Element):
         """
         return 3
 
+    def get_xi(self, x):
+        """
+        Returns the local variables from given global variables (see get_xi_many)
+
+        Args:
+            x: Global variable
+
+        Returns:
+            Local variables (xi)
+        """
+        xi, converged = self.get_xi_many(
+            self.get_node_coords()[np.newaxis], np.reshape(x, (1, 3))
+        )
+        if not converged[0]:
+            raise RuntimeError(
+                "The local coordinates of {0} did not converge".format(x)
+            )
+
+        return xi[0]
+
+    @classmethod
+    def get_xi_many(
+        cls,
+        coords: np.ndarray,
+        x: np.ndarray,
+        tol: float = 1e-10,
+        max_iter: int = 20,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the local coordinates of many points in many elements of this type at once. All
+        pairs of elements and points are iterated together with a Newton method, i.e. the
+        Jacobians of all pairs are stacked and solved at once. Converged pairs are removed from
+        the iteration.
+
+        Args:
+            coords: np.array((k, num_nodes, 3)) with the nodal coordinates of the element of each
+                pair of element and point
+            x: np.array((k, 3)) with the point of each pair
+            tol: Tolerance of the Newton increment in local coordinates
+            max_iter: Maximum number of iterations
+
+        Returns:
+            Tuple of the local coordinates np.array((k, 3)) and a mask np.array((k)) whether the
+            Newton method has converged
+        """
+        coords = np.asarray(coords, dtype=float)
+        x = np.asarray(x, dtype=float)
+        if len(coords.shape) != 3 or len(x.shape) != 2 or coords.shape[0] != len(x):
+            raise ValueError(
+                "Expected coordinates of shape (k, num_nodes, 3) and points of shape (k, 3), got "
+                "{0} and {1}".format(coords.shape, x.shape)
+            )
+
+        xi = np.tile(cls.ReferenceCenter, (len(x), 1))
+        converged = np.zeros((len(x)), dtype=bool)
+        active = np.arange(len(x))
+        for _ in range(max_iter):
+            if len(active) == 0:
+                break
+
+            active_coords = coords[active]
+            residual = x[active] - np.einsum(
+                "kn,knd->kd", cls.shape_fcns_many(xi[active]), active_coords
+            )
+            jacobian = np.einsum(
+                "kin,knd->kdi", cls.shape_fcns_derivs_many(xi[active]), active_coords
+            )
+
+            # pairs with a singular Jacobian (e.g. degenerated elements) do not converge
+            det = np.linalg.det(jacobian)
+            is_regular = np.isfinite(det) & (det != 0.0)
+            active = active[is_regular]
+            increment = np.linalg.solve(
+                jacobian[is_regular], residual[is_regular, :, np.newaxis]
+            )[:, :, 0]
+            xi[active] += increment
+
+            is_converged = np.linalg.norm(increment, axis=1) <= tol
+            converged[active[is_converged]] = True
+            active = active[~is_converged & np.all(np.isfinite(xi[active]), axis=1)]
+
+        return xi, converged
+
 
 class ElementTri(Element2D):
     @classmethod
@@ -451,7 +669,7 @@ class ElementQuad(Element2D):
         Returns the integration weights for the integration points
         """
         if num_points == 1:
-            return np.array([2])
+            return np.array([4.0])
         elif num_points == 4:
             return np.array([1.0, 1.0, 1.0, 1.0])
 
@@ -485,17 +703,31 @@ class ElementQuad(Element2D):
 
 
 class ElementTet(Element3D):
+    ReferenceCenter: np.ndarray = np.full((3), 0.25)
+
+    @classmethod
+    def is_in_ref_many(cls, xi, include_boundary=True, tol=0.0):
+        xi = np.asarray(xi, dtype=float)
+        lop = np.greater_equal if include_boundary else np.greater
+
+        return (
+            np.all(lop(xi + tol, 0.0), axis=1)
+            & lop(1.0 + tol, xi[:, 0])
+            & lop(1.0 - xi[:, 0] + tol, xi[:, 1])
+            & lop(1.0 - xi[:, 0] - xi[:, 1] + tol, xi[:, 2])
+        )
+
     @classmethod
-    def is_in_ref(cls, xi, include_boundary=True):
+    def is_in_ref(cls, xi, include_boundary=True, tol=0.0):
         if include_boundary:
 
             def lop(x, y):
-                return x >= y
+                return x + tol >= y
 
         else:
 
             def lop(x, y):
-                return x > y
+                return x + tol > y
 
         if not all([lop(xi[i], 0) for i in range(3)]):
             return False
@@ -551,16 +783,23 @@ class ElementTet(Element3D):
 
 class ElementHex(Element3D):
     @classmethod
-    def is_in_ref(cls, xi, include_boundary=True):
+    def is_in_ref_many(cls, xi, include_boundary=True, tol=0.0):
+        xi = np.asarray(xi, dtype=float)
+        lop = np.greater_equal if include_boundary else np.greater
+
+        return np.all(lop(xi + tol, -1.0), axis=1) & np.all(lop(1.0 + tol, xi), axis=1)
+
+    @classmethod
+    def is_in_ref(cls, xi, include_boundary=True, tol=0.0):
         if include_boundary:
 
             def lop(x, y):
-                return x >= y
+                return x + tol >= y
 
         else:
 
             def lop(x, y):
-                return x > y
+                return x + tol > y
 
         if not all([lop(xi[i], -1.0) for i in range(3)]):
             return False
@@ -606,3 +845,114 @@ class ElementHex(Element3D):
         """
         if num_points == 8:
             return np.ones(8)
+
+
+def _tensor_product_shape_fcns(
+    factors: List[np.ndarray], node_indices: np.ndarray
+) -> np.ndarray:
+    """
+    Returns the shape functions of a tensor product element (e.g. QUAD4, HEX8) as the products of
+    the 1D shape functions of each direction
+
+    Args:
+        factors: List with the 1D shape functions (or their derivatives) np.array((m, num_1d)) of
+            each direction
+        node_indices: np.array((num_nodes, dim)) with the index of the 1D shape function of each
+            node in each direction
+
+    Returns:
+        np.array((m, num_nodes))
+    """
+    result = factors[0][:, node_indices[:, 0]]
+    for d in range(1, len(factors)):
+        result = result * factors[d][:, node_indices[:, d]]
+
+    return result
+
+
+def _tensor_product_shape_fcns_derivs(
+    values: List[np.ndarray], derivs: List[np.ndarray], node_indices: np.ndarray
+) -> np.ndarray:
+    """
+    Returns the derivatives of the shape functions of a tensor product element
+
+    Args:
+        values: List with the 1D shape functions np.array((m, num_1d)) of each direction
+        derivs: List with the derivatives of the 1D shape functions np.array((m, num_1d)) of each
+            direction
+        node_indices: np.array((num_nodes, dim)) with the index of the 1D shape function of each
+            node in each direction
+
+    Returns:
+        np.array((m, dim, num_nodes))
+    """
+    return np.stack(
+        [
+            _tensor_product_shape_fcns(
+                [derivs[d] if d == k else values[d] for d in range(len(values))],
+                node_indices,
+            )
+            for k in range(len(values))
+        ],
+        axis=1,
+    )
+
+
+def _serendipity_shape_fcns(
+    xi: np.ndarray, node_coords: np.ndarray, derivs: bool = False
+) -> np.ndarray:
+    """
+    Returns the shape functions or their derivatives of a quadratic serendipity element (QUAD8,
+    HEX20) with nodes at the corners and at the midpoints of the edges
+
+    Args:
+        xi: np.array((m, dim)) with the local coordinates
+        node_coords: np.array((num_nodes, dim)) with the local coordinates of the nodes
+        derivs: If True, the derivatives are returned
+
+    Returns:
+        np.array((m, num_nodes)) with the values or np.array((m, dim, num_nodes)) with the
+        derivatives of the shape functions
+    """
+    num_dim = node_coords.shape[1]
+    is_corner = np.all(node_coords != 0.0, axis=1)
+
+    # factors of each direction (node-major): 1 - xi^2 along the edge, 1 + xi * xi_node otherwise
+    factors = []
+    factor_derivs = []
+    for d in range(num_dim):
+        is_mid = node_coords[:, d] == 0.0
+        factor = 1.0 + node_coords[:, d, np.newaxis] * xi[:, d]
+        factor[is_mid] = 1.0 - xi[:, d] ** 2
+        factors.append(factor)
+
+        if derivs:
+            factor_deriv = np.repeat(node_coords[:, d, np.newaxis], len(xi), axis=1)
+            factor_deriv[is_mid] = -2.0 * xi[:, d]
+            factor_derivs.append(factor_deriv)
+
+    def product(skip: int = -1) -> np.ndarray:
+        result = np.ones_like(factors[0])
+        for d in range(num_dim):
+            if d != skip:
+                result *= factors[d]
+        return result
+
+    # corner nodes: base * (sum xi * xi_node - (dim - 1)) / 2^dim, edge nodes: base / 2^(dim-1)
+    base = product()
+    corner = node_coords[is_corner] @ xi.T - (num_dim - 1)
+    if not derivs:
+        values = base / 2 ** (num_dim - 1)
+        values[is_corner] = base[is_corner] * corner / 2**num_dim
+        return values.T
+
+    result = np.empty((num_dim,) + base.shape)
+    for k in range(num_dim):
+        base_deriv = factor_derivs[k] * product(skip=k)
+        result[k] = base_deriv / 2 ** (num_dim - 1)
+        result[k, is_corner] = (
+            base_deriv[is_corner] * corner
+            + base[is_corner] * node_coords[is_corner, k, np.newaxis]
+        ) / 2**num_dim
+
+    return np.transpose(result, (2, 0, 1))
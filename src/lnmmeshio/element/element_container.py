@@ -1,11 +1,14 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 from tqdm import tqdm
 
+from ..fiber import Fiber
+from ..fielddata import CategoricalColumn, ColumnTable
 from ..ioutils import write_title
 from ..node import Node
 from .element import Element
-from .parse_element import parse as parse_ele
+from .parse_element import parse_many
 
 
 class ElementContainer:
@@ -296,18 +299,88 @@ class ElementContainer:
     @staticmethod
     def __get_section_lines(elements: List[Element], out=True):
         """
-        Writes the elements into an list of lines
+        Writes the elements into an list of lines. The node ids, the columnwise stored options and
+        fibers are formatted for all elements at once, each distinct combination of options only
+        once.
 
         Args:
             elements: List of elements
         """
-        lines = []
-        if elements is not None:
-            for ele in tqdm(elements, disable=not out, desc="Write Element"):
-                lines.append(ele.get_line())
+        lines: List[str] = []
+        if elements is None or len(elements) == 0:
+            return lines
+
+        node_texts: List[str] = [""] * len(elements)
+        for shape, (positions, node_ids) in ElementContainer.group_by_shape(
+            elements
+        ).items():
+            fmt = shape + " %d" * node_ids.shape[1]
+            for i, ids in zip(positions.tolist(), node_ids.tolist()):
+                node_texts[i] = fmt % tuple(ids)
+
+        table = ColumnTable.of(elements)
+        columns = table.options if table is not None else {}
+        option_texts = ElementContainer.__get_option_texts(columns, len(elements))
+
+        fiber_lines = Fiber.get_item_lines(elements)
+
+        for ele, node_text, option_text, fiber_line in tqdm(
+            zip(elements, node_texts, option_texts, fiber_lines),
+            total=len(elements),
+            disable=not out,
+            desc="Write Element",
+        ):
+            if ele.id is None:
+                raise RuntimeError("You have to compute ids before writing")
+
+            line = "{0} {1} {2}{3}".format(ele.id, ele.type, node_text, option_text)
+
+            local = ele._options
+            if local:
+                line += "".join(
+                    [
+                        " {0} {1}".format(key, CategoricalColumn.text(value))
+                        for key, value in local.items()
+                        if key not in columns
+                    ]
+                )
+
+            if len(fiber_line) > 0:
+                line += " " + fiber_line
+
+            lines.append(line)
 
         return lines
 
+    @staticmethod
+    def __get_option_texts(
+        columns: Dict[str, CategoricalColumn], num_ele: int
+    ) -> List[str]:
+        """
+        Returns the text of the columnwise stored options of each element (with a leading space)
+        """
+        if len(columns) == 0:
+            return [""] * num_ele
+
+        codes = np.stack([column.codes for column in columns.values()], axis=1)
+        combinations, inverse = np.unique(codes, axis=0, return_inverse=True)
+
+        category_texts = [
+            [
+                " {0} {1}".format(key, CategoricalColumn.text(value))
+                for value in column.categories
+            ]
+            for key, column in columns.items()
+        ]
+        combination_texts = [
+            "".join(
+                [texts[code] for texts, code in zip(category_texts, row) if code >= 0]
+            )
+            for row in combinations.tolist()
+        ]
+
+        return [combination_texts[i] for i in inverse.reshape((-1)).tolist()]
+
     @staticmethod
     def read_element_sections(
         sections: Dict[str, List[str]], nodes: List[Node], out=False
@@ -364,37 +437,69 @@ class ElementContainer:
         Returns:
             List of elements
         """
-        eles: List[Element] = []
-
         if fieldtype is None:
             fieldtype = "Elements"
 
-        for line in tqdm(lines, disable=not out, desc=fieldtype):
-            ele = parse_ele(line, nodes)
+        eles = parse_many(tqdm(lines, disable=not out, desc=fieldtype), nodes).items
 
-            if ele is None:
-                continue
+        # safety check for integrity of the dat file:
+        # ids must increase continuously by +1 from first id
+        ids = np.fromiter((ele.id for ele in eles), dtype=int, count=len(eles))
+        gaps = np.flatnonzero(ids[1:] != np.arange(2, len(eles) + 1))
+        if len(gaps) > 0:
+            raise RuntimeError(
+                "Element ids in dat file have a gap at {0}!={1}!".format(
+                    ids[gaps[0] + 1], gaps[0] + 2
+                )
+            )
 
-            eles.append(ele)
+        return eles
 
-            if ele.id is None:
-                raise RuntimeError("Id of the element is None")
-
-            # safety check for integrity of the dat file:
-            # ids must increase continuously by +1 from first id
-            first_id: int = 0
-            id_offset: int = 0
-            if len(eles) == 1:
-                first_id = eles[0].id if eles[0].id is not None else 1
-                id_offset = first_id - 1
-            if int(ele.id) - id_offset != len(eles):
+    @staticmethod
+    def group_by_shape(
+        elements: List[Element],
+    ) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """
+        Groups the elements by their shape in a single pass. The node ids have to be computed
+        before.
+
+        Args:
+            elements: List of elements
+
+        Returns:
+            dict with the shape as key and a tuple of the positions of the elements within the list
+            np.array((num_ele)) and their node ids np.array((num_ele, num_nodes_per_ele)) as value
+        """
+        groups: Dict[str, List[int]] = {}
+        for i, ele in enumerate(elements):
+            groups.setdefault(ele.shape, []).append(i)
+
+        grouped: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        for shape, positions in groups.items():
+            num_nodes = len(elements[positions[0]].nodes)
+            if any(len(elements[i].nodes) != num_nodes for i in positions):
                 raise RuntimeError(
-                    "Element ids in dat file have a gap at {0}!={1}!".format(
-                        ele.id, len(eles)
+                    "The elements of shape {0} have different numbers of nodes".format(
+                        shape
                     )
                 )
 
-        return eles
+            # gather the node ids of all elements of the shape at once
+            try:
+                node_ids = np.fromiter(
+                    (n.id for i in positions for n in elements[i].nodes),
+                    dtype=int,
+                    count=len(positions) * num_nodes,
+                )
+            except TypeError:
+                raise RuntimeError("You need to compute ids first")
+
+            grouped[shape] = (
+                np.array(positions, dtype=int),
+                node_ids.reshape((len(positions), num_nodes)),
+            )
+
+        return grouped
 
     @staticmethod
     def get_section_name(fieldtype):
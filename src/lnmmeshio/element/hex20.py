@@ -3,7 +3,7 @@ from typing import List
 import numpy as np
 
 from ..node import Node
-from .element import ElementHex
+from .element import ElementHex, _serendipity_shape_fcns
 from .line3 import Line3
 from .quad8 import Quad8
 
@@ -14,6 +14,14 @@ class Hex20(ElementHex):
     """
 
     ShapeName: str = "HEX20"
+    FaceNodeIds: List[List[int]] = [
+        [0, 1, 2, 3, 8, 9, 10, 11],
+        [0, 1, 5, 4, 8, 13, 16, 12],
+        [1, 2, 6, 5, 9, 14, 17, 13],
+        [2, 3, 7, 6, 10, 15, 18, 14],
+        [3, 0, 4, 7, 11, 12, 19, 15],
+        [4, 5, 6, 7, 15, 17, 18, 19],
+    ]
 
     def __init__(self, el_type: str, nodes: List[Node]):
         """
@@ -43,17 +51,10 @@ class Hex20(ElementHex):
         Returns:
             List of faces
         """
-        face_node_ids = [
-            [0, 1, 2, 3, 8, 9, 10, 11],
-            [0, 1, 5, 4, 8, 13, 16, 12],
-            [1, 2, 6, 5, 9, 14, 17, 13],
-            [2, 3, 7, 6, 10, 15, 18, 14],
-            [3, 0, 4, 7, 11, 12, 19, 15],
-            [4, 5, 6, 7, 15, 17, 18, 19],
+        return [
+            Quad8(None, [self.nodes[i] for i in nodes]) for nodes in self.FaceNodeIds
         ]
 
-        return [Quad8(None, [self.nodes[i] for i in nodes]) for nodes in face_node_ids]
-
     def get_edges(self) -> List[Line3]:
         """
         Returns the list of all edges
@@ -121,3 +122,64 @@ class Hex20(ElementHex):
                 0.25 * rm * ssm * tp,
             ]
         )
+
+    @staticmethod
+    def shape_fcns_derivs(xi):
+        """
+        Returns the value of the derivatives of the shape functions with respect to the local coordinates at the local coordinate xi
+        +-                                  -+
+        |  dN_1 / dxi_1   dN_2 / dxi_1, ...  |
+        |  dN_1 / dxi_2   dN_2 / dxi_2, ...  |
+        |  dN_1 / dxi_3   dN_2 / dxi_3, ...  |
+        +-                                  -+
+        """
+        return Hex20.shape_fcns_derivs_many(np.reshape(xi, (1, 3)))[0]
+
+    @staticmethod
+    def shape_fcns_many(xi):
+        """
+        Returns the values of the shape functions at the local coordinates xi np.array((m, 3)) as
+        np.array((m, 20))
+        """
+        return _serendipity_shape_fcns(
+            np.asarray(xi, dtype=float), Hex20.nodal_reference_coordinates()
+        )
+
+    @staticmethod
+    def shape_fcns_derivs_many(xi):
+        """
+        Returns the derivatives of the shape functions at the local coordinates xi np.array((m, 3))
+        as np.array((m, 3, 20))
+        """
+        return _serendipity_shape_fcns(
+            np.asarray(xi, dtype=float),
+            Hex20.nodal_reference_coordinates(),
+            derivs=True,
+        )
+
+    @staticmethod
+    def nodal_reference_coordinates():
+        return np.array(
+            [
+                [-1.0, -1.0, -1.0],
+                [1.0, -1.0, -1.0],
+                [1.0, 1.0, -1.0],
+                [-1.0, 1.0, -1.0],
+                [-1.0, -1.0, 1.0],
+                [1.0, -1.0, 1.0],
+                [1.0, 1.0, 1.0],
+                [-1.0, 1.0, 1.0],
+                [0.0, -1.0, -1.0],
+                [1.0, 0.0, -1.0],
+                [0.0, 1.0, -1.0],
+                [-1.0, 0.0, -1.0],
+                [-1.0, -1.0, 0.0],
+                [1.0, -1.0, 0.0],
+                [1.0, 1.0, 0.0],
+                [-1.0, 1.0, 0.0],
+                [0.0, -1.0, 1.0],
+                [1.0, 0.0, 1.0],
+                [0.0, 1.0, 1.0],
+                [-1.0, 0.0, 1.0],
+            ]
+        )
@@ -3,7 +3,11 @@ from typing import List
 import numpy as np
 
 from ..node import Node
-from .element import ElementHex
+from .element import (
+    ElementHex,
+    _tensor_product_shape_fcns,
+    _tensor_product_shape_fcns_derivs,
+)
 from .line3 import Line3
 from .quad9 import Quad9
 
@@ -14,6 +18,47 @@ class Hex27(ElementHex):
     """
 
     ShapeName: str = "HEX27"
+    FaceNodeIds: List[List[int]] = [
+        [0, 1, 2, 3, 8, 9, 10, 11, 20],
+        [0, 1, 5, 4, 8, 13, 16, 12, 21],
+        [1, 2, 6, 5, 9, 14, 17, 13, 22],
+        [2, 3, 7, 6, 10, 15, 18, 14, 23],
+        [3, 0, 4, 7, 11, 12, 19, 15, 24],
+        [4, 5, 6, 7, 15, 17, 18, 19, 25],
+    ]
+
+    # index of the LINE3 shape function of each node in each direction
+    TensorProductIndices: np.ndarray = np.array(
+        [
+            [0, 0, 0],
+            [1, 0, 0],
+            [1, 1, 0],
+            [0, 1, 0],
+            [0, 0, 1],
+            [1, 0, 1],
+            [1, 1, 1],
+            [0, 1, 1],
+            [2, 0, 0],
+            [1, 2, 0],
+            [2, 1, 0],
+            [0, 2, 0],
+            [0, 0, 2],
+            [1, 0, 2],
+            [1, 1, 2],
+            [0, 1, 2],
+            [2, 0, 1],
+            [1, 2, 1],
+            [2, 1, 1],
+            [0, 2, 1],
+            [2, 2, 0],
+            [2, 0, 2],
+            [1, 2, 2],
+            [2, 1, 2],
+            [0, 2, 2],
+            [2, 2, 1],
+            [2, 2, 2],
+        ]
+    )
 
     def __init__(self, el_type: str, nodes: List[Node]):
         """
@@ -43,17 +88,10 @@ class Hex27(ElementHex):
         Returns:
             List of faces
         """
-        face_node_ids = [
-            [0, 1, 2, 3, 8, 9, 10, 11, 20],
-            [0, 1, 5, 4, 8, 13, 16, 12, 21],
-            [1, 2, 6, 5, 9, 14, 17, 13, 22],
-            [2, 3, 7, 6, 10, 15, 18, 14, 23],
-            [3, 0, 4, 7, 11, 12, 19, 15, 24],
-            [4, 5, 6, 7, 15, 17, 18, 19, 25],
+        return [
+            Quad9(None, [self.nodes[i] for i in nodes]) for nodes in self.FaceNodeIds
         ]
 
-        return [Quad9(None, [self.nodes[i] for i in nodes]) for nodes in face_node_ids]
-
     def get_edges(self) -> List[Line3]:
         """
         Returns the list of all edges
@@ -167,3 +205,40 @@ class Hex27(ElementHex):
                 * Line3.shape_fcns(xi[2])[2],
             ]
         )
+
+    @staticmethod
+    def shape_fcns_derivs(xi):
+        """
+        Returns the value of the derivatives of the shape functions with respect to the local coordinates at the local coordinate xi
+        +-                                  -+
+        |  dN_1 / dxi_1   dN_2 / dxi_1, ...  |
+        |  dN_1 / dxi_2   dN_2 / dxi_2, ...  |
+        |  dN_1 / dxi_3   dN_2 / dxi_3, ...  |
+        +-                                  -+
+        """
+        return Hex27.shape_fcns_derivs_many(np.reshape(xi, (1, 3)))[0]
+
+    @staticmethod
+    def shape_fcns_many(xi):
+        """
+        Returns the values of the shape functions at the local coordinates xi np.array((m, 3)) as
+        np.array((m, 27))
+        """
+        xi = np.asarray(xi, dtype=float)
+        return _tensor_product_shape_fcns(
+            [Line3.shape_fcns_many(xi[:, d]) for d in range(3)],
+            Hex27.TensorProductIndices,
+        )
+
+    @staticmethod
+    def shape_fcns_derivs_many(xi):
+        """
+        Returns the derivatives of the shape functions at the local coordinates xi np.array((m, 3))
+        as np.array((m, 3, 27))
+        """
+        xi = np.asarray(xi, dtype=float)
+        return _tensor_product_shape_fcns_derivs(
+            [Line3.shape_fcns_many(xi[:, d]) for d in range(3)],
+            [Line3.shape_fcns_derivs_many(xi[:, d])[:, 0] for d in range(3)],
+            Hex27.TensorProductIndices,
+        )
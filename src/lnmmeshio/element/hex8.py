@@ -3,7 +3,11 @@ from typing import List
 import numpy as np
 
 from ..node import Node
-from .element import ElementHex
+from .element import (
+    ElementHex,
+    _tensor_product_shape_fcns,
+    _tensor_product_shape_fcns_derivs,
+)
 from .line2 import Line2
 from .quad4 import Quad4
 
@@ -14,6 +18,28 @@ class Hex8(ElementHex):
     """
 
     ShapeName: str = "HEX8"
+    FaceNodeIds: List[List[int]] = [
+        [0, 1, 2, 3],
+        [0, 1, 5, 4],
+        [1, 2, 6, 5],
+        [2, 3, 7, 6],
+        [3, 0, 4, 7],
+        [4, 5, 6, 7],
+    ]
+
+    # index of the LINE2 shape function of each node in each direction
+    TensorProductIndices: np.ndarray = np.array(
+        [
+            [0, 0, 0],
+            [1, 0, 0],
+            [1, 1, 0],
+            [0, 1, 0],
+            [0, 0, 1],
+            [1, 0, 1],
+            [1, 1, 1],
+            [0, 1, 1],
+        ]
+    )
 
     def __init__(self, el_type: str, nodes: List[Node]):
         """
@@ -43,17 +69,10 @@ class Hex8(ElementHex):
         Returns:
             List of faces
         """
-        face_node_ids = [
-            [0, 1, 2, 3],
-            [0, 1, 5, 4],
-            [1, 2, 6, 5],
-            [2, 3, 7, 6],
-            [3, 0, 4, 7],
-            [4, 5, 6, 7],
+        return [
+            Quad4(None, [self.nodes[i] for i in nodes]) for nodes in self.FaceNodeIds
         ]
 
-        return [Quad4(None, [self.nodes[i] for i in nodes]) for nodes in face_node_ids]
-
     def get_edges(self) -> List[Line2]:
         """
         Returns the list of all edges
@@ -173,3 +192,28 @@ class Hex8(ElementHex):
                 [-1.0, 1.0, 1.0],
             ]
         )
+
+    @staticmethod
+    def shape_fcns_many(xi):
+        """
+        Returns the values of the shape functions at the local coordinates xi np.array((m, 3)) as
+        np.array((m, 8))
+        """
+        xi = np.asarray(xi, dtype=float)
+        return _tensor_product_shape_fcns(
+            [Line2.shape_fcns_many(xi[:, d]) for d in range(3)],
+            Hex8.TensorProductIndices,
+        )
+
+    @staticmethod
+    def shape_fcns_derivs_many(xi):
+        """
+        Returns the derivatives of the shape functions at the local coordinates xi np.array((m, 3))
+        as np.array((m, 3, 8))
+        """
+        xi = np.asarray(xi, dtype=float)
+        return _tensor_product_shape_fcns_derivs(
+            [Line2.shape_fcns_many(xi[:, d]) for d in range(3)],
+            [Line2.shape_fcns_derivs_many(xi[:, d])[:, 0] for d in range(3)],
+            Hex8.TensorProductIndices,
+        )
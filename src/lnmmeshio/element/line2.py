@@ -12,6 +12,7 @@ class Line2(Element1D):
     """
 
     ShapeName: str = "LINE2"
+    FaceNodeIds: List[List[int]] = []
 
     def __init__(self, el_type: str, nodes: List[Node]):
         """
@@ -69,3 +70,20 @@ class Line2(Element1D):
         +-                             -+
         """
         return np.array([-0.5, 0.5])
+
+    @staticmethod
+    def shape_fcns_many(xi):
+        """
+        Returns the values of the shape functions at the local coordinates xi np.array((m, 1)) as
+        np.array((m, 2))
+        """
+        r = np.reshape(np.asarray(xi, dtype=float), (-1))
+        return np.stack([(1 - r) / 2.0, (1 + r) / 2.0], axis=1)
+
+    @staticmethod
+    def shape_fcns_derivs_many(xi):
+        """
+        Returns the derivatives of the shape functions at the local coordinates xi np.array((m, 1))
+        as np.array((m, 1, 2))
+        """
+        return np.tile(np.array([[[-0.5, 0.5]]]), (np.size(xi), 1, 1))
@@ -12,6 +12,7 @@ class Line3(Element1D):
     """
 
     ShapeName: str = "LINE3"
+    FaceNodeIds: List[List[int]] = []
 
     def __init__(self, el_type: Optional[str], nodes: List[Node]):
         """
@@ -58,3 +59,33 @@ class Line3(Element1D):
         Returns the value of the shape functions at the local coordinate xi
         """
         return np.array([xi * (xi - 1) / 2.0, xi * (xi + 1) / 2.0, (1 + xi) * (1 - xi)])
+
+    @staticmethod
+    def shape_fcns_derivs(xi):
+        """
+        Returns the value of the derivatives of the shape functions with respect to the local coordinates at the local coordinate xi
+        +-                                           -+
+        |  dN_1 / dxi_1   dN_2 / dxi_1   dN_3 / dxi_1  |
+        +-                                           -+
+        """
+        return np.array([xi - 0.5, xi + 0.5, -2.0 * xi])
+
+    @staticmethod
+    def shape_fcns_many(xi):
+        """
+        Returns the values of the shape functions at the local coordinates xi np.array((m, 1)) as
+        np.array((m, 3))
+        """
+        r = np.reshape(np.asarray(xi, dtype=float), (-1))
+        return np.stack(
+            [r * (r - 1) / 2.0, r * (r + 1) / 2.0, (1 + r) * (1 - r)], axis=1
+        )
+
+    @staticmethod
+    def shape_fcns_derivs_many(xi):
+        """
+        Returns the derivatives of the shape functions at the local coordinates xi np.array((m, 1))
+        as np.array((m, 1, 3))
+        """
+        r = np.reshape(np.asarray(xi, dtype=float), (-1))
+        return np.stack([r - 0.5, r + 0.5, -2.0 * r], axis=1)[:, np.newaxis, :]
@@ -1,7 +1,12 @@
 import re
-from typing import List, Optional
+import sys
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple, Type
+
+import numpy as np
 
 from ..fiber import Fiber
+from ..fielddata import CategoricalColumn, ColumnTable
 from ..ioutils import (
     read_key_values,
     read_option_items,
@@ -16,6 +21,7 @@ from .hex20 import Hex20
 from .hex27 import Hex27
 from .line2 import Line2
 from .line3 import Line3
+from .pyramid5 import Pyramid5
 from .quad4 import Quad4
 from .quad8 import Quad8
 from .quad9 import Quad9
@@ -24,9 +30,51 @@ from .tet10 import Tet10
 from .tri3 import Tri3
 from .tri6 import Tri6
 from .vertex import Vertex
+from .wedge6 import Wedge6
 
 RegExEle = re.compile(r"^[ ]*([0-9]+)[ ]+(\S+)[ ]+(\S+)[ ]+")
 
+# element classes by shape name
+ElementTypes: Dict[str, Type[Element]] = {
+    cls.ShapeName: cls
+    for cls in [
+        Vertex,
+        Line2,
+        Line3,
+        Tri3,
+        Tri6,
+        Quad4,
+        Quad8,
+        Quad9,
+        Tet4,
+        Tet10,
+        Hex8,
+        Hex20,
+        Hex27,
+        Wedge6,
+        Pyramid5,
+    ]
+}
+
+
+def get_element_type(ele_shape: str, throw_if_unknown=False) -> Optional[Type[Element]]:
+    """
+    Returns the element class of a given element shape
+
+    Args:
+        ele_shape: str shape of the element (e.g. HEX8)
+        throw_if_unknown: bool Throw an exception, if element type is not known
+
+    Return:
+        Element class of the shape or None, if the shape is not known
+    """
+    cls = ElementTypes.get(ele_shape, None)
+
+    if cls is None and throw_if_unknown:
+        raise RuntimeError("The element type {0} is unknown".format(ele_shape))
+
+    return cls
+
 
 def create_element(
     ele_type: str, ele_shape: str, ele_nodes: List[Node], throw_if_unknown=False
@@ -43,40 +91,12 @@ def create_element(
     Return:
         Element of the specific type
     """
+    cls = get_element_type(ele_shape, throw_if_unknown=throw_if_unknown)
 
-    ele: Optional[Element] = None
-    if ele_shape == Vertex.ShapeName:
-        ele = Vertex(ele_type, ele_nodes)
-    elif ele_shape == Line2.ShapeName:
-        ele = Line2(ele_type, ele_nodes)
-    elif ele_shape == Line3.ShapeName:
-        ele = Line3(ele_type, ele_nodes)
-    elif ele_shape == Tri3.ShapeName:
-        ele = Tri3(ele_type, ele_nodes)
-    elif ele_shape == Tri6.ShapeName:
-        ele = Tri6(ele_type, ele_nodes)
-    elif ele_shape == Quad4.ShapeName:
-        ele = Quad4(ele_type, ele_nodes)
-    elif ele_shape == Quad8.ShapeName:
-        ele = Quad8(ele_type, ele_nodes)
-    elif ele_shape == Quad9.ShapeName:
-        ele = Quad9(ele_type, ele_nodes)
-    elif ele_shape == Tet4.ShapeName:
-        ele = Tet4(ele_type, ele_nodes)
-    elif ele_shape == Tet10.ShapeName:
-        ele = Tet10(ele_type, ele_nodes)
-    elif ele_shape == Hex8.ShapeName:
-        ele = Hex8(ele_type, ele_nodes)
-    elif ele_shape == Hex20.ShapeName:
-        ele = Hex20(ele_type, ele_nodes)
-    elif ele_shape == Hex27.ShapeName:
-        ele = Hex27(ele_type, ele_nodes)
-    else:
-        if throw_if_unknown:
-            raise RuntimeError("The element type {0} is unknown".format(ele_shape))
-        ele = Element(ele_type, ele_shape, ele_nodes)
+    if cls is None:
+        return Element(ele_type, ele_shape, ele_nodes)
 
-    return ele
+    return cls(ele_type, ele_nodes)
 
 
 def parse(line: str, nodes: List[Node], throw_if_unknown=False):
@@ -112,18 +132,172 @@ def parse(line: str, nodes: List[Node], throw_if_unknown=False):
     ele.id = ele_id
 
     # read fibers
-    ele.fibers = Fiber.parse_fibers(line)
+    fibers = Fiber.parse_fibers(line)
+    if len(fibers) > 0:
+        ele.fibers = fibers
 
-    # read remaining options
+    # read remaining options (fibers are already read)
     # assume only one value per option, which must not be the case in general
+    # the strings are interned since most elements share the same options
     line = line[span[1] :]
 
     for key, values in read_key_values(
         line, lambda key: 3 if Fiber.is_fiber_type(key) else 1
     ):
+        if Fiber.is_fiber_type(key):
+            continue
+
         if len(values) == 1:
-            ele.options[key] = values[0]
+            ele.options[sys.intern(key)] = sys.intern(values[0])
         else:
-            ele.options[key] = values
+            ele.options[sys.intern(key)] = [sys.intern(v) for v in values]
 
     return ele
+
+
+def parse_many(
+    lines: Iterable[str], nodes: List[Node], throw_if_unknown=False
+) -> ColumnTable:
+    """
+    Parses the elements of many lines at once. The lines are split into tokens instead of being
+    searched with regular expressions. The options are stored in categorical columns and the
+    fiber types that are defined for all elements are stored columnwise, the remaining fibers are
+    stored locally in the elements.
+
+    Args:
+        lines: linedefinitions of the elements
+        nodes: List of nodes
+
+    Raises:
+        RuntimeError: If an element has fewer node ids than its shape needs or refers to a node id
+            that does not exist
+
+    Returns:
+        Table of the elements (the elements are bound to the table)
+    """
+    elements: List[Element] = []
+    get_node = ([None] + nodes).__getitem__
+    shapes: Dict[str, Tuple[Optional[Type[Element]], int]] = {}
+
+    # rows and node ids of the elements of each shape, the nodes are assigned after all node ids
+    # of a shape were checked at once
+    shape_rows: Dict[str, List[int]] = {}
+    shape_node_ids: Dict[str, array] = {}
+
+    option_rows: Dict[str, List[int]] = {}
+    option_values: Dict[str, List[str]] = {}
+    fiber_rows: Dict[str, List[int]] = {}
+    fiber_values: Dict[str, List[str]] = {}
+
+    for line in lines:
+        tokens = line.split("//", 1)[0].split()
+        if len(tokens) < 4 or not tokens[0].isdigit():
+            # this is not an element, probably a comment
+            continue
+
+        ele_shape = tokens[2]
+        shape = shapes.get(ele_shape, None)
+        if shape is None:
+            shape = (
+                get_element_type(ele_shape, throw_if_unknown=throw_if_unknown),
+                Element.num_nodes_by_shape(ele_shape),
+            )
+            shapes[ele_shape] = shape
+        cls, num_nodes = shape
+
+        end = 3 + num_nodes
+        node_ids = shape_node_ids.setdefault(ele_shape, array("q"))
+        num_node_ids = len(node_ids)
+        try:
+            node_ids.extend(map(int, tokens[3:end]))
+        except ValueError:
+            # an option follows the node ids
+            pass
+        if len(node_ids) != num_node_ids + num_nodes:
+            raise RuntimeError(
+                "Element {0} has fewer node ids than its shape {1} needs ({2})".format(
+                    tokens[0], ele_shape, num_nodes
+                )
+            )
+
+        if cls is None:
+            ele = Element(tokens[1], ele_shape, [])
+        else:
+            # the number of nodes is given by the shape, so the base constructor is sufficient
+            ele = cls.__new__(cls)
+            Element.__init__(ele, tokens[1], ele_shape, [])
+        ele.id = int(tokens[0])
+
+        row = len(elements)
+        elements.append(ele)
+        shape_rows.setdefault(ele_shape, []).append(row)
+
+        # remaining options and fibers (one value per option, three per fiber)
+        found: Optional[set] = None
+        while end < len(tokens):
+            key = tokens[end]
+            if Fiber.is_fiber_type(key):
+                if end + 3 >= len(tokens):
+                    raise RuntimeError("Error reading option {0}".format(key))
+
+                if found is None:
+                    found = set()
+                if key not in found:
+                    found.add(key)
+                    fiber_rows.setdefault(key, []).append(row)
+                    fiber_values.setdefault(key, []).extend(tokens[end + 1 : end + 4])
+                end += 4
+            else:
+                if end + 1 >= len(tokens):
+                    raise RuntimeError("Error reading option {0}".format(key))
+
+                option_rows.setdefault(key, []).append(row)
+                option_values.setdefault(key, []).append(tokens[end + 1])
+                end += 2
+
+    for ele_shape, rows in shape_rows.items():
+        node_ids = np.frombuffer(shape_node_ids[ele_shape], dtype=np.int64).reshape(
+            (len(rows), shapes[ele_shape][1])
+        )
+        invalid = np.flatnonzero(
+            np.any((node_ids < 1) | (node_ids > len(nodes)), axis=1)
+        )
+        if len(invalid) > 0:
+            raise RuntimeError(
+                "Element {0} refers to a node id outside of 1, ..., {1}".format(
+                    elements[rows[invalid[0]]].id, len(nodes)
+                )
+            )
+
+        for row, ids in zip(rows, node_ids.tolist()):
+            elements[row].nodes = list(map(get_node, ids))
+
+    table = ColumnTable(elements)
+    table.bind()
+
+    # each distinct value is stored once, the categories are in the order of their appearance
+    for key, rows in option_rows.items():
+        values, first, inverse = np.unique(
+            option_values[key], return_index=True, return_inverse=True
+        )
+        order = np.argsort(first)
+        column = CategoricalColumn(len(elements))
+        codes = np.array(
+            [column.encode(sys.intern(str(v))) for v in values[order].tolist()]
+        )
+        codes = codes[np.argsort(order)]
+
+        # the last value of an option given twice in a line wins
+        column.codes[rows] = codes[inverse.reshape((-1))]
+        table.options[sys.intern(key)] = column
+
+    for key, rows in fiber_rows.items():
+        fiber_type = Fiber.get_fiber_type(key)
+        fibers = np.array(fiber_values[key], dtype=float).reshape((-1, 3))
+        if len(rows) == len(elements):
+            table.fibers[fiber_type] = fibers
+        else:
+            for row, fiber in zip(rows, fibers):
+                elements[row].fibers[fiber_type] = Fiber(fiber)
+
+    return table
@@ -14,6 +14,13 @@ class Pyramid5(Element3D):
     """
 
     ShapeName: str = "PYRAMID5"
+    FaceNodeIds: List[List[int]] = [
+        [0, 1, 2, 3],
+        [0, 1, 4],
+        [1, 2, 4],
+        [2, 3, 4],
+        [3, 0, 4],
+    ]
 
     def __init__(self, el_type: str, nodes: List[Node]):
         """
@@ -45,7 +52,6 @@ class Pyramid5(Element3D):
         Returns:
             List of faces
         """
-        face_node_ids = [[0, 1, 2, 3], [0, 1, 4], [1, 2, 4], [2, 3, 4], [3, 0, 4]]
 
         def gen_face(nodes):
             if len(nodes) == 3:
@@ -53,4 +59,4 @@ class Pyramid5(Element3D):
             else:
                 return Quad4(None, nodes)
 
-        return [gen_face([self.nodes[i] for i in nodes]) for nodes in face_node_ids]
+        return [gen_face([self.nodes[i] for i in nodes]) for nodes in self.FaceNodeIds]
@@ -4,7 +4,11 @@ from typing import List
 import numpy as np
 
 from ..node import Node
-from .element import ElementQuad
+from .element import (
+    ElementQuad,
+    _tensor_product_shape_fcns,
+    _tensor_product_shape_fcns_derivs,
+)
 from .line2 import Line2
 
 
@@ -14,6 +18,17 @@ class Quad4(ElementQuad):
     """
 
     ShapeName: str = "QUAD4"
+    FaceNodeIds: List[List[int]] = [[0, 1, 2, 3]]
+
+    # index of the LINE2 shape function of each node in each direction
+    TensorProductIndices: np.ndarray = np.array(
+        [
+            [0, 0],
+            [1, 0],
+            [1, 1],
+            [0, 1],
+        ]
+    )
 
     def __init__(self, el_type: str, nodes: List[Node]):
         """
@@ -135,3 +150,28 @@ class Quad4(ElementQuad):
         v = self.nodes[2].coords - self.nodes[0].coords
         n = np.cross(u, v)
         return n / np.linalg.norm(n)
+
+    @staticmethod
+    def shape_fcns_many(xi):
+        """
+        Returns the values of the shape functions at the local coordinates xi np.array((m, 2)) as
+        np.array((m, 4))
+        """
+        xi = np.asarray(xi, dtype=float)
+        return _tensor_product_shape_fcns(
+            [Line2.shape_fcns_many(xi[:, d]) for d in range(2)],
+            Quad4.TensorProductIndices,
+        )
+
+    @staticmethod
+    def shape_fcns_derivs_many(xi):
+        """
+        Returns the derivatives of the shape functions at the local coordinates xi np.array((m, 2))
+        as np.array((m, 2, 4))
+        """
+        xi = np.asarray(xi, dtype=float)
+        return _tensor_product_shape_fcns_derivs(
+            [Line2.shape_fcns_many(xi[:, d]) for d in range(2)],
+            [Line2.shape_fcns_derivs_many(xi[:, d])[:, 0] for d in range(2)],
+            Quad4.TensorProductIndices,
+        )
@@ -3,7 +3,7 @@ from typing import List
 import numpy as np
 
 from ..node import Node
-from .element import ElementQuad
+from .element import ElementQuad, _serendipity_shape_fcns
 from .line3 import Line3
 
 
@@ -13,6 +13,7 @@ class Quad8(ElementQuad):
     """
 
     ShapeName: str = "QUAD8"
+    FaceNodeIds: List[List[int]] = [[0, 1, 2, 3, 4, 5, 6, 7]]
 
     def __init__(self, el_type: str, nodes: List[Node]):
         """
@@ -86,3 +87,51 @@ class Quad8(ElementQuad):
                 0.5 * s2 * rm,
             ]
         )
+
+    @staticmethod
+    def shape_fcns_derivs(xi):
+        """
+        Returns the value of the derivatives of the shape functions with respect to the local coordinates at the local coordinate xi
+        +-                                  -+
+        |  dN_1 / dxi_1   dN_2 / dxi_1, ...  |
+        |  dN_1 / dxi_2   dN_2 / dxi_2, ...  |
+        +-                                  -+
+        """
+        return Quad8.shape_fcns_derivs_many(np.reshape(xi, (1, 2)))[0]
+
+    @staticmethod
+    def shape_fcns_many(xi):
+        """
+        Returns the values of the shape functions at the local coordinates xi np.array((m, 2)) as
+        np.array((m, 8))
+        """
+        return _serendipity_shape_fcns(
+            np.asarray(xi, dtype=float), Quad8.nodal_reference_coordinates()
+        )
+
+    @staticmethod
+    def shape_fcns_derivs_many(xi):
+        """
+        Returns the derivatives of the shape functions at the local coordinates xi np.array((m, 2))
+        as np.array((m, 2, 8))
+        """
+        return _serendipity_shape_fcns(
+            np.asarray(xi, dtype=float),
+            Quad8.nodal_reference_coordinates(),
+            derivs=True,
+        )
+
+    @staticmethod
+    def nodal_reference_coordinates():
+        return np.array(
+            [
+                [-1.0, -1.0],
+                [1.0, -1.0],
+                [1.0, 1.0],
+                [-1.0, 1.0],
+                [0.0, -1.0],
+                [1.0, 0.0],
+                [0.0, 1.0],
+                [-1.0, 0.0],
+            ]
+        )
@@ -3,7 +3,11 @@ from typing import List
 import numpy as np
 
 from ..node import Node
-from .element import ElementQuad
+from .element import (
+    ElementQuad,
+    _tensor_product_shape_fcns,
+    _tensor_product_shape_fcns_derivs,
+)
 from .line3 import Line3
 
 
@@ -13,6 +17,22 @@ class Quad9(ElementQuad):
     """
 
     ShapeName: str = "QUAD9"
+    FaceNodeIds: List[List[int]] = [[0, 1, 2, 3, 4, 5, 6, 7, 8]]
+
+    # index of the LINE3 shape function of each node in each direction
+    TensorProductIndices: np.ndarray = np.array(
+        [
+            [0, 0],
+            [1, 0],
+            [1, 1],
+            [0, 1],
+            [2, 0],
+            [1, 2],
+            [2, 1],
+            [0, 2],
+            [2, 2],
+        ]
+    )
 
     def __init__(self, el_type: str, nodes: List[Node]):
         """
@@ -77,3 +97,39 @@ class Quad9(ElementQuad):
                 Line3.shape_fcns(xi[0])[2] * Line3.shape_fcns(xi[1])[2],
             ]
         )
+
+    @staticmethod
+    def shape_fcns_derivs(xi):
+        """
+        Returns the value of the derivatives of the shape functions with respect to the local coordinates at the local coordinate xi
+        +-                                  -+
+        |  dN_1 / dxi_1   dN_2 / dxi_1, ...  |
+        |  dN_1 / dxi_2   dN_2 / dxi_2, ...  |
+        +-                                  -+
+        """
+        return Quad9.shape_fcns_derivs_many(np.reshape(xi, (1, 2)))[0]
+
+    @staticmethod
+    def shape_fcns_many(xi):
+        """
+        Returns the values of the shape functions at the local coordinates xi np.array((m, 2)) as
+        np.array((m, 9))
+        """
+        xi = np.asarray(xi, dtype=float)
+        return _tensor_product_shape_fcns(
+            [Line3.shape_fcns_many(xi[:, d]) for d in range(2)],
+            Quad9.TensorProductIndices,
+        )
+
+    @staticmethod
+    def shape_fcns_derivs_many(xi):
+        """
+        Returns the derivatives of the shape functions at the local coordinates xi np.array((m, 2))
+        as np.array((m, 2, 9))
+        """
+        xi = np.asarray(xi, dtype=float)
+        return _tensor_product_shape_fcns_derivs(
+            [Line3.shape_fcns_many(xi[:, d]) for d in range(2)],
+            [Line3.shape_fcns_derivs_many(xi[:, d])[:, 0] for d in range(2)],
+            Quad9.TensorProductIndices,
+        )
@@ -16,6 +16,12 @@ Implementation of a tet4 element
 
 class Tet10(ElementTet):
     ShapeName: str = "TET10"
+    FaceNodeIds: List[List[int]] = [
+        [0, 1, 3, 4, 8, 7],
+        [1, 2, 3, 5, 9, 8],
+        [2, 0, 3, 6, 7, 9],
+        [0, 2, 1, 6, 5, 4],
+    ]
 
     """
     Base constructor of a tet10 element
@@ -47,15 +53,10 @@ class Tet10(ElementTet):
     """
 
     def get_faces(self) -> List[Tri6]:
-        face_node_ids = [
-            [0, 1, 3, 4, 8, 7],
-            [1, 2, 3, 5, 9, 8],
-            [2, 0, 3, 6, 7, 9],
-            [0, 2, 1, 6, 5, 4],
+        return [
+            Tri6(None, [self.nodes[i] for i in nodes]) for nodes in self.FaceNodeIds
         ]
 
-        return [Tri6(None, [self.nodes[i] for i in nodes]) for nodes in face_node_ids]
-
     """
     Returns the list of all edges
 
@@ -74,19 +75,6 @@ class Tet10(ElementTet):
         ]
         return [Line3(None, [self.nodes[i] for i in nodes]) for nodes in edge_node_ids]
 
-    def get_xi(self, x):
-        """
-        Returns the local variables from given global variables
-
-        Args:
-            x: Global variable
-
-        Returns:
-            Local variables (xi)
-        """
-        coords = np.transpose(np.array([n.coords for n in self.nodes]))
-        raise NotImplementedError("This is currently not implemented for all elements")
-
     @staticmethod
     def shape_fcns(xi):
         """
@@ -180,3 +168,60 @@ class Tet10(ElementTet):
                 [0.0, 0.5, 0.5],
             ]
         )
+
+    @staticmethod
+    def shape_fcns_many(xi):
+        """
+        Returns the values of the shape functions at the local coordinates xi np.array((m, 3)) as
+        np.array((m, 10))
+        """
+        xi = np.asarray(xi, dtype=float)
+        r = xi[:, 0]
+        s = xi[:, 1]
+        t = xi[:, 2]
+        u = 1.0 - r - s - t
+        return np.stack(
+            [
+                u * (2.0 * u - 1.0),
+                r * (2.0 * r - 1.0),
+                s * (2.0 * s - 1.0),
+                t * (2.0 * t - 1.0),
+                4.0 * r * u,
+                4.0 * r * s,
+                4.0 * s * u,
+                4.0 * t * u,
+                4.0 * r * t,
+                4.0 * s * t,
+            ],
+            axis=1,
+        )
+
+    @staticmethod
+    def shape_fcns_derivs_many(xi):
+        """
+        Returns the derivatives of the shape functions at the local coordinates xi np.array((m, 3))
+        as np.array((m, 3, 10))
+        """
+        xi = np.asarray(xi, dtype=float)
+        u = 1 - xi[:, 0] - xi[:, 1] - xi[:, 2]
+
+        derivs = np.zeros((len(xi), 3, 10))
+        derivs[:, :, 0] = (-4 * u + 1)[:, np.newaxis]
+        for d in range(3):
+            # vertex node and edge node towards the first vertex in the direction d
+            derivs[:, d, d + 1] = 4 * xi[:, d] - 1
+            derivs[:, d, (4, 6, 7)[d]] = 4 * (u - xi[:, d])
+
+            # edge nodes towards the first vertex in the other directions
+            for e in range(3):
+                if e != d:
+                    derivs[:, d, (4, 6, 7)[e]] = -4 * xi[:, e]
+
+        # edge nodes between the other vertices
+        derivs[:, 0, 5] = 4 * xi[:, 1]
+        derivs[:, 1, 5] = 4 * xi[:, 0]
+        derivs[:, 0, 8] = 4 * xi[:, 2]
+        derivs[:, 2, 8] = 4 * xi[:, 0]
+        derivs[:, 1, 9] = 4 * xi[:, 2]
+        derivs[:, 2, 9] = 4 * xi[:, 1]
+        return derivs
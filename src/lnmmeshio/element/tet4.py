@@ -14,6 +14,7 @@ class Tet4(ElementTet):
     """
 
     ShapeName: str = "TET4"
+    FaceNodeIds: List[List[int]] = [[0, 1, 3], [1, 2, 3], [2, 0, 3], [0, 2, 1]]
     ShapeFunctionsN: np.ndarray = np.array(
         [[-1.0, -1.0, -1.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
     )
@@ -50,9 +51,9 @@ class Tet4(ElementTet):
         Returns:
             List of faces
         """
-        face_node_ids = [[0, 1, 3], [1, 2, 3], [2, 0, 3], [0, 2, 1]]
-
-        return [Tri3(None, [self.nodes[i] for i in nodes]) for nodes in face_node_ids]
+        return [
+            Tri3(None, [self.nodes[i] for i in nodes]) for nodes in self.FaceNodeIds
+        ]
 
     def get_edges(self) -> List[Line2]:
         """
@@ -119,3 +120,20 @@ class Tet4(ElementTet):
     @staticmethod
     def nodal_reference_coordinates():
         return Tet4.NodalReferenceCoordinates
+
+    @staticmethod
+    def shape_fcns_many(xi):
+        """
+        Returns the values of the shape functions at the local coordinates xi np.array((m, 3)) as
+        np.array((m, 4))
+        """
+        N, b = Tet4.shape_fcns_mv()
+        return np.asarray(xi, dtype=float) @ N.T + b
+
+    @staticmethod
+    def shape_fcns_derivs_many(xi):
+        """
+        Returns the derivatives of the shape functions at the local coordinates xi np.array((m, 3))
+        as np.array((m, 3, 4))
+        """
+        return np.tile(Tet4.shape_fcns_derivs(None).astype(float), (len(xi), 1, 1))
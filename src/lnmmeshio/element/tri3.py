@@ -14,6 +14,7 @@ class Tri3(ElementTri):
     """
 
     ShapeName: str = "TRI3"
+    FaceNodeIds: List[List[int]] = [[0, 1, 2]]
 
     def __init__(self, el_type: str, nodes: List[Node]):
         """
@@ -133,3 +134,20 @@ class Tri3(ElementTri):
         +-                                  -+
         """
         return np.array([[-1.0, 1.0, 0.0], [-1.0, 0.0, 1.0]])
+
+    @staticmethod
+    def shape_fcns_many(xi):
+        """
+        Returns the values of the shape functions at the local coordinates xi np.array((m, 2)) as
+        np.array((m, 3))
+        """
+        xi = np.asarray(xi, dtype=float)
+        return np.stack([1 - xi[:, 0] - xi[:, 1], xi[:, 0], xi[:, 1]], axis=1)
+
+    @staticmethod
+    def shape_fcns_derivs_many(xi):
+        """
+        Returns the derivatives of the shape functions at the local coordinates xi np.array((m, 2))
+        as np.array((m, 2, 3))
+        """
+        return np.tile(Tri3.shape_fcns_derivs(None), (len(xi), 1, 1))
@@ -14,6 +14,7 @@ class Tri6(ElementTri):
     """
 
     ShapeName: str = "TRI6"
+    FaceNodeIds: List[List[int]] = [[0, 1, 2, 3, 4, 5]]
 
     def __init__(self, el_type: str, nodes: List[Node]):
         """
@@ -169,3 +170,48 @@ class Tri6(ElementTri):
                 ],
             ]
         )
+
+    @staticmethod
+    def shape_fcns_many(xi):
+        """
+        Returns the values of the shape functions at the local coordinates xi np.array((m, 2)) as
+        np.array((m, 6))
+        """
+        xi = np.asarray(xi, dtype=float)
+        t1 = 1.0 - xi[:, 0] - xi[:, 1]
+        t2 = xi[:, 0]
+        t3 = xi[:, 1]
+        return np.stack(
+            [
+                t1 * (2.0 * t1 - 1.0),
+                t2 * (2.0 * t2 - 1.0),
+                t3 * (2.0 * t3 - 1.0),
+                4.0 * t2 * t1,
+                4.0 * t2 * t3,
+                4.0 * t3 * t1,
+            ],
+            axis=1,
+        )
+
+    @staticmethod
+    def shape_fcns_derivs_many(xi):
+        """
+        Returns the derivatives of the shape functions at the local coordinates xi np.array((m, 2))
+        as np.array((m, 2, 6))
+        """
+        xi = np.asarray(xi, dtype=float)
+        t1 = 1.0 - xi[:, 0] - xi[:, 1]
+        t2 = xi[:, 0]
+        t3 = xi[:, 1]
+
+        derivs = np.zeros((len(xi), 2, 6))
+        derivs[:, :, 0] = (-(4.0 * t1 - 1))[:, np.newaxis]
+        derivs[:, 0, 1] = 4.0 * t2 - 1
+        derivs[:, 0, 3] = 4.0 * t1 - 4.0 * t2
+        derivs[:, 0, 4] = 4.0 * t3
+        derivs[:, 0, 5] = -4.0 * t3
+        derivs[:, 1, 2] = 4.0 * t3 - 1
+        derivs[:, 1, 3] = -4.0 * t2
+        derivs[:, 1, 4] = 4.0 * t2
+        derivs[:, 1, 5] = 4.0 * t1 - 4.0 * t3
+        return derivs
@@ -10,6 +10,7 @@ class Vertex(Element0D):
     """
 
     ShapeName: str = "VERTEX1"
+    FaceNodeIds: List[List[int]] = []
 
     def __init__(self, el_type: str, nodes: List[Node]):
         """
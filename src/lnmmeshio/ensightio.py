@@ -1,11 +1,17 @@
 import os
-from typing import IO, Any, Dict, List, Tuple
+import re
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO, StringIO
+from typing import IO, Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 from tqdm import tqdm
 
 from . import ioutils as io
 from .discretization import Discretization
+from .element.element import NumNodesByShape
+from .element.element_container import ElementContainer
+from .node import Node
 
 shape_to_eletype: Dict[str, str] = {
     "TET4": "tetra4",
@@ -38,7 +44,24 @@ def write_case(
     binary: bool = True,
     override: bool = False,
     out: bool = True,
+    parts: Optional[str] = None,
+    num_threads: Optional[int] = None,
 ) -> None:
+    """
+    Writes the discretization with its nodal and element data as EnSight Gold case
+
+    Args:
+        filename: Path to the .case file
+        dis: Discretization
+        binary: If true, the files are written in the C Binary format, otherwise as ASCII
+        override: If true, existing files are overwritten, otherwise unique filenames are used
+        out: If true, the progress is shown
+        parts: None to write all elements into one part, "field" for one part per field
+            (structure, fluid, ...) or "material" for one part per field and MAT id. Each part
+            only contains the nodes of its elements.
+        num_threads: Maximum number of threads that write the parts (default of
+            concurrent.futures.ThreadPoolExecutor if None)
+    """
     dis.compute_ids(False)
     filedir = os.path.dirname(filename)
 
@@ -52,57 +75,15 @@ def write_case(
             os.path.join(filedir, "{0}_geometry.geo".format(basename))
         )
 
+    # group the elements of all fields by their EnSight element type and split them into parts
+    geometry_parts = _get_parts(dis, _group_elements(dis), parts)
+
     with open(geofile, "w{0}".format("b" if binary else "")) as f:
-        write_geometry(f, dis, binary=binary, out=out)
+        _write_geometry(f, dis, geometry_parts, binary=binary, num_threads=num_threads)
 
     # A variable is supposed to be transient if len(shape) == 3 (time component is first index)
-    # write element variables
-    ele_count = {}
-    # get number of elements for each type
-    for eles in dis.elements.values():
-        for ele in eles:
-            if ele.shape not in shape_to_eletype:
-                raise NotImplementedError(
-                    "This kind of element is not known: {0}".format(ele.shape)
-                )
-            eletype = shape_to_eletype[ele.shape]
-
-            if eletype not in ele_count:
-                ele_count[eletype] = 0
-
-            ele_count[eletype] += 1
-
     # build element variables
-    ele_vars = {}
-    ele_cur_count = {}
-    for eles in tqdm(
-        dis.elements.values(), disable=not out, desc="Prepare element data"
-    ):
-        for ele in eles:
-            if ele.shape not in shape_to_eletype:
-                raise NotImplementedError(
-                    "This kind of element is not known: {0}".format(ele.shape)
-                )
-            eletype = shape_to_eletype[ele.shape]
-
-            if eletype not in ele_cur_count:
-                ele_cur_count[eletype] = 0
-
-            for varname, data in ele.data.items():
-                data = np.array(data)
-                if len(data.shape) == 0:
-                    data = data.reshape((1))
-
-                if varname not in ele_vars:
-                    ele_vars[varname] = {}
-                    for elt, eltc in ele_count.items():
-                        ele_vars[varname][elt] = np.zeros(
-                            tuple([eltc] + list(data.shape)), dtype=data.dtype
-                        )
-
-                ele_vars[varname][eletype][ele_cur_count[eletype]] = data
-
-            ele_cur_count[eletype] += 1
+    ele_vars = _gather_element_variables(dis, geometry_parts)
 
     # write them finally
     ele_vars_props = {}
@@ -123,30 +104,18 @@ def write_case(
             (
                 ele_vars_props[varname]["timesteps"],
                 ele_vars_props[varname]["dim"],
-            ) = write_element_variable(f, dis, varname, data, binary=binary)
+            ) = _write_element_variable(
+                f, varname, data, binary=binary, num_threads=num_threads
+            )
 
     # write nodal variables
-    nodal_vars = {}
-    for i, node in tqdm(
-        enumerate(dis.nodes), disable=not out, desc="Prepare nodal data"
-    ):
-        for varname, data in node.data.items():
-            # ensure that data is a np array
-            data = np.array(data)
-            if len(data.shape) == 0:
-                data = data.reshape((1))
-            if varname not in nodal_vars:
-                nodal_vars[varname] = np.zeros(
-                    tuple([len(dis.nodes)] + list(data.shape)),
-                    dtype=data.dtype,
-                )
-
-            nodal_vars[varname][i] = data
-
     nodal_vars_props = {}
     for varname, data in tqdm(
-        nodal_vars.items(), disable=not out, desc="Write nodal data"
+        dis.get_node_data().items(), disable=not out, desc="Write nodal data"
     ):
+        if len(data.shape) == 1:
+            data = data.reshape((-1, 1))
+
         if override:
             varfile = os.path.join(
                 filedir, "{0}_variable.{1}".format(basename, varname)
@@ -161,7 +130,15 @@ def write_case(
             (
                 nodal_vars_props[varname]["timesteps"],
                 nodal_vars_props[varname]["dim"],
-            ) = write_node_variable(f, dis, varname, data, binary=binary)
+            ) = _write_node_variable(
+                f,
+                dis,
+                varname,
+                data,
+                geometry_parts,
+                binary=binary,
+                num_threads=num_threads,
+            )
 
     # write case file
     if override:
@@ -177,6 +154,7 @@ def _write_case(
     geofile: str,
     ele_vars_props: Dict[str, Dict[str, Any]],
     nodal_vars_props: Dict[str, Dict[str, Any]],
+    times: Optional[np.ndarray] = None,
 ) -> None:
     sets = {1: 1}
     dim_to_type = {1: "scalar", 3: "vector", 6: "tensor symm"}
@@ -227,24 +205,29 @@ def _write_case(
 
     fstream.write("\n")
     fstream.write("TIME\n\n")
-    for id, count in sets.items():
-        fstream.write(get_timeset_entry(id, count))
+    for count, id in sets.items():
+        fstream.write(
+            get_timeset_entry(id, count, times[:count] if times is not None else None)
+        )
         fstream.write("\n")
 
     fstream.write("\n")
     fstream.write("FILE\n\n")
-    for id, count in sets.items():
+    for count, id in sets.items():
         fstream.write("file set:\t\t{0}\nnumber of steps:\t\t{1}\n".format(id, count))
     fstream.write("\n")
 
 
-def get_timeset_entry(id, count):
+def get_timeset_entry(id, count, times: Optional[np.ndarray] = None):
     entry: str = "time set:\t\t{0}\nnumber of steps:\t\t{1}\ntime values: ".format(
         id, count
     )
 
+    if times is None:
+        times = range(count)
+
     i: int = 0
-    for item in range(count):
+    for item in times:
         if i > 0 and i % 8 == 0:
             entry += "\n"
 
@@ -255,8 +238,68 @@ def get_timeset_entry(id, count):
     return entry
 
 
+class _OutputPart:
+    """
+    Part of the geometry that is written. The node ids of the connectivity are local to the part
+    (one-based).
+    """
+
+    def __init__(
+        self,
+        description: str,
+        node_indices: Optional[np.ndarray],
+        groups: Dict[str, List[Tuple[str, np.ndarray, np.ndarray]]],
+    ):
+        """
+        Args:
+            description: Description of the part
+            node_indices: Indices of the nodes of the part within the nodes of the discretization
+                (None for all nodes)
+            groups: dict with the EnSight element type as key and a list of the blocks of each
+                field as value. A block consists of the field type, the positions of the elements
+                within the field and their local node ids np.array((num_ele, num_nodes_per_ele)).
+        """
+        self.description = description
+        self.node_indices = node_indices
+        self.groups = groups
+
+    def get_node_values(self, values: np.ndarray) -> np.ndarray:
+        """
+        Returns the rows of the nodes of the part
+
+        Args:
+            values: Values of all nodes np.array((num_nodes, ...))
+
+        Returns:
+            np.array((num_part_nodes, ...))
+        """
+        if self.node_indices is None:
+            return values
+
+        return values[self.node_indices]
+
+
 def write_geometry(
     fstream: IO, dis: Discretization, binary: bool = True, out: bool = True
+) -> None:
+    """
+    Writes the geometry file of all elements as one part. The node ids have to be computed before.
+
+    Args:
+        fstream: Stream to write the geometry into
+        dis: Discretization
+        binary: If true, the file is written in the C Binary format, otherwise as ASCII
+        out: Unused, kept for compatibility
+    """
+    _write_geometry(fstream, dis, _get_parts(dis, _group_elements(dis)), binary=binary)
+
+
+def _write_geometry(
+    fstream: IO,
+    dis: Discretization,
+    parts: List[_OutputPart],
+    binary: bool = True,
+    num_threads: Optional[int] = None,
 ) -> None:
     if binary:
         io.ens_write_string(fstream, "C Binary", binary=True)
@@ -266,38 +309,244 @@ def write_geometry(
     io.ens_write_string(fstream, "Comment", binary=binary)
     io.ens_write_string(fstream, "node id given", binary=binary)
     io.ens_write_string(fstream, "element id off", binary=binary)  # should I switch on?
-    io.ens_write_string(fstream, "part", binary=binary)
-    io.ens_write_int(fstream, 1, binary=binary)
-    io.ens_write_string(fstream, "field", binary=binary)
-    io.ens_write_string(fstream, "coordinates", binary=binary)
-    io.ens_write_int(fstream, len(dis.nodes), binary=binary)
-    io.ens_write_ints(fstream, np.array([n.id for n in dis.nodes]), binary=binary)
-    io.ens_write_floats(fstream, dis.get_node_coords(), binary=binary)
-
-    # build eletype array
-    elegroups = {}
-    for eles in tqdm(
-        dis.elements.values(), disable=not out, desc="Prepare element geometry"
-    ):
-        for ele in eles:
-            if ele.shape not in shape_to_eletype:
+
+    coords = dis.get_node_coords()
+
+    def write_part(fstream: IO, number: int, part: _OutputPart) -> None:
+        node_ids = part.get_node_values(np.arange(1, len(dis.nodes) + 1))
+
+        io.ens_write_string(fstream, "part", binary=binary)
+        io.ens_write_int(fstream, number, binary=binary)
+        io.ens_write_string(fstream, part.description, binary=binary)
+        io.ens_write_string(fstream, "coordinates", binary=binary)
+        io.ens_write_int(fstream, len(node_ids), binary=binary)
+        io.ens_write_ints(fstream, node_ids, binary=binary)
+        io.ens_write_floats(fstream, part.get_node_values(coords), binary=binary)
+
+        for eletype, blocks in part.groups.items():
+            node_ids = np.concatenate([ids for _, _, ids in blocks])
+            io.ens_write_string(fstream, eletype, binary=binary)
+            io.ens_write_int(fstream, len(node_ids), binary=binary)
+            io.ens_write_ints(fstream, node_ids, binary=binary)
+
+    _write_parts(fstream, write_part, parts, binary, num_threads)
+
+    io.ens_write_string(fstream, "END TIME STEP", binary=binary)
+
+
+def _write_parts(
+    fstream: IO,
+    write_part: Callable[[IO, int, Any], None],
+    parts: List[Any],
+    binary: bool = True,
+    num_threads: Optional[int] = None,
+) -> None:
+    """
+    Writes the parts (numbered from 1) one after another. Multiple parts are written by a thread
+    pool into separate buffers, which are concatenated in the order of the parts.
+
+    Args:
+        fstream: Stream to write the parts into
+        write_part: Function that writes a part into a stream, called with the stream, the part
+            number and the part
+        parts: List of parts
+        binary: If true, the parts are written in the C Binary format, otherwise as ASCII
+        num_threads: Maximum number of threads
+    """
+    if len(parts) == 1:
+        write_part(fstream, 1, parts[0])
+        return
+
+    def write_buffer(number: int, part: Any) -> Any:
+        buffer: IO = BytesIO() if binary else StringIO()
+        write_part(buffer, number, part)
+        return buffer.getvalue()
+
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        for content in executor.map(write_buffer, range(1, len(parts) + 1), parts):
+            fstream.write(content)
+
+
+def _group_elements(
+    dis: Discretization,
+) -> Dict[str, List[Tuple[str, np.ndarray, np.ndarray]]]:
+    """
+    Groups the elements of all fields by their EnSight element type (in the order of their first
+    appearance). The node ids have to be computed before.
+
+    Returns:
+        dict with the EnSight element type as key and a list of the blocks of each field as value.
+        A block consists of the field type, the positions of the elements within the field and
+        their node ids np.array((num_ele, num_nodes_per_ele)).
+    """
+    groups: Dict[str, List[Tuple[str, np.ndarray, np.ndarray]]] = {}
+    for fieldtype, eles in dis.elements.items():
+        for shape, (positions, node_ids) in ElementContainer.group_by_shape(
+            eles
+        ).items():
+            if shape not in shape_to_eletype:
                 raise NotImplementedError(
-                    "This kind of element is not known: {0}".format(ele.shape)
+                    "This kind of element is not known: {0}".format(shape)
                 )
-            eletype = shape_to_eletype[ele.shape]
 
-            if eletype not in elegroups:
-                # np.zeros((0,len(ele.nodes)), dtype=int)
-                elegroups[eletype] = []
+            groups.setdefault(shape_to_eletype[shape], []).append(
+                (fieldtype, positions, node_ids)
+            )
 
-            elegroups[eletype].append(np.array([n.id for n in ele.nodes]))
+    return groups
 
-    for eletype, eles in elegroups.items():
-        io.ens_write_string(fstream, eletype, binary=binary)
-        io.ens_write_int(fstream, len(eles), binary=binary)
-        io.ens_write_ints(fstream, np.array(eles, dtype=int), binary=binary)
 
-    io.ens_write_string(fstream, "END TIME STEP", binary=binary)
+def _get_parts(
+    dis: Discretization,
+    groups: Dict[str, List[Tuple[str, np.ndarray, np.ndarray]]],
+    parts: Optional[str] = None,
+) -> List[_OutputPart]:
+    """
+    Splits the grouped elements into the parts of the geometry
+
+    Args:
+        dis: Discretization
+        groups: Elements grouped by their EnSight element type (see _group_elements)
+        parts: None for one part with all elements and nodes, "field" for one part per field or
+            "material" for one part per field and MAT id
+
+    Returns:
+        List of the parts (without empty parts)
+    """
+    if parts is None:
+        return [_OutputPart("field", None, groups)]
+
+    if parts not in ("field", "material"):
+        raise ValueError(
+            "Unknown kind of parts {0}, expected field or material".format(parts)
+        )
+
+    # material id of the elements of each field
+    materials: Dict[str, np.ndarray] = {}
+    if parts == "material":
+        from .meshio_to_discretization import _get_materials
+
+        field_offsets: Dict[str, int] = {}
+        num_eles = 0
+        for fieldtype, eles in dis.elements.items():
+            field_offsets[fieldtype] = num_eles
+            num_eles += len(eles)
+
+        all_materials = _get_materials(dis, field_offsets, num_eles)
+        if all_materials is not None:
+            for fieldtype, eles in dis.elements.items():
+                materials[fieldtype] = all_materials[
+                    field_offsets[fieldtype] : field_offsets[fieldtype] + len(eles)
+                ]
+
+    output_parts: List[_OutputPart] = []
+    for fieldtype in dis.elements.keys():
+        matids: List[Optional[int]] = [None]
+        if fieldtype in materials:
+            matids = [int(matid) for matid in np.unique(materials[fieldtype])]
+
+        for matid in matids:
+            part_groups: Dict[str, List[Tuple[str, np.ndarray, np.ndarray]]] = {}
+            for eletype, blocks in groups.items():
+                for block_fieldtype, positions, node_ids in blocks:
+                    if block_fieldtype != fieldtype:
+                        continue
+
+                    if matid is not None:
+                        is_in_part = materials[fieldtype][positions] == matid
+                        positions = positions[is_in_part]
+                        node_ids = node_ids[is_in_part]
+
+                    if len(positions) > 0:
+                        part_groups.setdefault(eletype, []).append(
+                            (fieldtype, positions, node_ids)
+                        )
+
+            if len(part_groups) == 0:
+                continue
+
+            # nodes of the part and the connectivity local to the part
+            node_indices = (
+                np.unique(
+                    np.concatenate(
+                        [
+                            ids.reshape((-1))
+                            for blocks in part_groups.values()
+                            for _, _, ids in blocks
+                        ]
+                    )
+                )
+                - 1
+            )
+            for blocks in part_groups.values():
+                for i, (block_fieldtype, positions, node_ids) in enumerate(blocks):
+                    blocks[i] = (
+                        block_fieldtype,
+                        positions,
+                        np.searchsorted(node_indices, node_ids - 1) + 1,
+                    )
+
+            output_parts.append(
+                _OutputPart(
+                    (
+                        fieldtype
+                        if matid is None
+                        else "{0} MAT {1}".format(fieldtype, matid)
+                    ),
+                    node_indices,
+                    part_groups,
+                )
+            )
+
+    return output_parts
+
+
+def _gather_element_variables(
+    dis: Discretization, parts: List[_OutputPart]
+) -> Dict[str, List[Dict[str, np.ndarray]]]:
+    """
+    Returns the element data of all fields grouped by the parts and EnSight element types.
+    Elements of fields without the variable get zeros.
+
+    Returns:
+        dict with the variable name as key and a list with a dict per part with the EnSight element
+        type as key and the values np.array((num_ele, ...)) as value
+    """
+    ele_data = {
+        fieldtype: dis.get_element_data(fieldtype) for fieldtype in dis.elements.keys()
+    }
+
+    ele_vars: Dict[str, List[Dict[str, np.ndarray]]] = {}
+    for field_data in ele_data.values():
+        for varname, data in field_data.items():
+            if varname in ele_vars:
+                continue
+
+            # shape and dtype of the data of one element
+            shape = data.shape[1:] if len(data.shape) > 1 else tuple([1])
+
+            ele_vars[varname] = []
+            for part in parts:
+                part_values: Dict[str, np.ndarray] = {}
+                for eletype, blocks in part.groups.items():
+                    values = np.zeros(
+                        tuple([sum([len(p) for _, p, _ in blocks])]) + shape,
+                        dtype=data.dtype,
+                    )
+
+                    offset = 0
+                    for fieldtype, positions, _ in blocks:
+                        if varname in ele_data[fieldtype]:
+                            values[offset : offset + len(positions)] = ele_data[
+                                fieldtype
+                            ][varname][positions].reshape(tuple([-1]) + shape)
+                        offset += len(positions)
+
+                    part_values[eletype] = values
+
+                ele_vars[varname].append(part_values)
+
+    return ele_vars
 
 
 def write_element_variable(
@@ -306,6 +555,16 @@ def write_element_variable(
     varname: str,
     data: Dict[str, np.ndarray],
     binary: bool = True,
+) -> Tuple[int, int]:
+    return _write_element_variable(fstream, varname, [data], binary=binary)
+
+
+def _write_element_variable(
+    fstream: IO,
+    varname: str,
+    part_data: List[Dict[str, np.ndarray]],
+    binary: bool = True,
+    num_threads: Optional[int] = None,
 ) -> Tuple[int, int]:
     if binary:
         io.ens_write_string(fstream, "C Binary", binary=True)
@@ -313,38 +572,41 @@ def write_element_variable(
     dim = None
     ts = None
 
-    for key, edata in data.items():
-        if len(edata.shape) > 3:
-            raise RuntimeError("This kind of data is not supported. To many dimensions")
-
-        if len(edata.shape) == 3:
-            # This will be interpreted as transient vector data
-            data[key] = np.transpose(edata, (1, 0, 2))
-
-        if len(edata.shape) == 2:
-            # This will be interpreted as non transient vector data
-            data[key] = edata.reshape(tuple([1] + list(edata.shape)))
-
-        if len(edata.shape) == 1:
-            # This will be interpreted as non transient scalar data
-            data[key] = edata.reshape(tuple([1] + list(edata.shape) + [1]))
+    for data in part_data:
+        for key, edata in data.items():
+            if len(edata.shape) > 3:
+                raise RuntimeError(
+                    "This kind of data is not supported. To many dimensions"
+                )
 
-        # safety check
-        if dim is None:
-            dim = data[key].shape[2]
-            ts = data[key].shape[0]
-        elif dim != data[key].shape[2]:
-            raise RuntimeError(
-                "The elemnt data of variable {0} have not the correct dimesion accross all elements".format(
-                    varname
+            if len(edata.shape) == 3:
+                # This will be interpreted as transient vector data
+                data[key] = np.transpose(edata, (1, 0, 2))
+
+            if len(edata.shape) == 2:
+                # This will be interpreted as non transient vector data
+                data[key] = edata.reshape(tuple([1] + list(edata.shape)))
+
+            if len(edata.shape) == 1:
+                # This will be interpreted as non transient scalar data
+                data[key] = edata.reshape(tuple([1] + list(edata.shape) + [1]))
+
+            # safety check
+            if dim is None:
+                dim = data[key].shape[2]
+                ts = data[key].shape[0]
+            elif dim != data[key].shape[2]:
+                raise RuntimeError(
+                    "The elemnt data of variable {0} have not the correct dimesion accross all elements".format(
+                        varname
+                    )
                 )
-            )
-        elif ts != data[key].shape[0]:
-            raise RuntimeError(
-                "The elemnt data of variable {0} have not the correct num_timesteps accross all elements".format(
-                    varname
+            elif ts != data[key].shape[0]:
+                raise RuntimeError(
+                    "The elemnt data of variable {0} have not the correct num_timesteps accross all elements".format(
+                        varname
+                    )
                 )
-            )
 
     if ts is None:
         raise RuntimeError("Timestep is None")
@@ -352,16 +614,12 @@ def write_element_variable(
         raise RuntimeError("dim is None")
 
     for t in range(ts):
-        io.ens_write_string(fstream, "BEGIN TIME STEP", binary=binary)
-        io.ens_write_string(fstream, "description", binary=binary)
-        io.ens_write_string(fstream, "part", binary=binary)
-        io.ens_write_int(fstream, 1, binary=binary)
-
-        for k, d in data.items():
-            io.ens_write_string(fstream, k, binary=binary)
-            io.ens_write_floats(fstream, d[t], binary=binary)
-
-        io.ens_write_string(fstream, "END TIME STEP", binary=binary)
+        _write_variable_step(
+            fstream,
+            [{k: d[t] for k, d in data.items()} for data in part_data],
+            binary=binary,
+            num_threads=num_threads,
+        )
 
     return ts, dim
 
@@ -372,6 +630,20 @@ def write_node_variable(
     varname: str,
     data: np.ndarray,
     binary: bool = True,
+) -> Tuple[int, int]:
+    return _write_node_variable(
+        fstream, dis, varname, data, [_OutputPart("field", None, {})], binary=binary
+    )
+
+
+def _write_node_variable(
+    fstream: IO,
+    dis: Discretization,
+    varname: str,
+    data: np.ndarray,
+    parts: List[_OutputPart],
+    binary: bool = True,
+    num_threads: Optional[int] = None,
 ) -> Tuple[int, int]:
     if binary:
         io.ens_write_string(fstream, "C Binary", binary=True)
@@ -398,12 +670,874 @@ def write_node_variable(
         )
 
     for tdata in data:
-        io.ens_write_string(fstream, "BEGIN TIME STEP", binary=binary)
-        io.ens_write_string(fstream, "description", binary=binary)
-        io.ens_write_string(fstream, "part", binary=binary)
-        io.ens_write_int(fstream, 1, binary=binary)
-        io.ens_write_string(fstream, "coordinates", binary=binary)
-        io.ens_write_floats(fstream, tdata, binary=binary)
-        io.ens_write_string(fstream, "END TIME STEP", binary=binary)
+        _write_variable_step(
+            fstream,
+            [{"coordinates": part.get_node_values(tdata)} for part in parts],
+            binary=binary,
+            num_threads=num_threads,
+        )
 
     return data.shape[0], data.shape[2]
+
+
+def _write_variable_step(
+    fstream: IO,
+    part_blocks: List[Dict[str, np.ndarray]],
+    binary: bool = True,
+    num_threads: Optional[int] = None,
+) -> None:
+    """
+    Writes one time step of a variable
+
+    Args:
+        fstream: Stream of the variable file
+        part_blocks: List with a dict per part with the EnSight element type (or coordinates for
+            nodal variables) as key and the values np.array((num_items, dim)) as value
+        binary: If true, the values are written in the C Binary format, otherwise as ASCII
+        num_threads: Maximum number of threads that write the parts
+    """
+    io.ens_write_string(fstream, "BEGIN TIME STEP", binary=binary)
+    io.ens_write_string(fstream, "description", binary=binary)
+
+    def write_part(fstream: IO, number: int, blocks: Dict[str, np.ndarray]) -> None:
+        io.ens_write_string(fstream, "part", binary=binary)
+        io.ens_write_int(fstream, number, binary=binary)
+
+        for k, d in blocks.items():
+            io.ens_write_string(fstream, k, binary=binary)
+            io.ens_write_floats(fstream, d, binary=binary)
+
+    _write_parts(fstream, write_part, part_blocks, binary, num_threads)
+
+    io.ens_write_string(fstream, "END TIME STEP", binary=binary)
+
+
+class EnsightWriter:
+    """
+    Writes a transient EnSight Gold case step by step. The geometry is written once, every call of
+    add_timestep appends one time step to the variable files and rewrites the (small) case file,
+    i.e. only the data of one time step has to be kept in memory.
+
+    Example:
+        writer = EnsightWriter("result/result.case", dis)
+        for time, disp in simulation:
+            writer.add_timestep(time, node_vars={"displacement": disp})
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        dis: Discretization,
+        binary: bool = True,
+        override: bool = False,
+        parts: Optional[str] = None,
+        num_threads: Optional[int] = None,
+    ):
+        """
+        Writes the geometry of the discretization
+
+        Args:
+            filename: Path to the .case file
+            dis: Discretization
+            binary: If true, the files are written in the C Binary format, otherwise as ASCII
+            override: If true, existing files are overwritten, otherwise unique filenames are used
+            parts: None to write all elements into one part, "field" for one part per field
+                (structure, fluid, ...) or "material" for one part per field and MAT id
+            num_threads: Maximum number of threads that write the parts
+        """
+        dis.compute_ids(False)
+        self.binary = binary
+        self.override = override
+        self.num_threads = num_threads
+        self.num_nodes = len(dis.nodes)
+        self.times: List[float] = []
+
+        self.filedir = os.path.dirname(filename)
+        self.basename = os.path.splitext(os.path.basename(self.filedir))[0]
+        self.casefile = filename if override else get_unique_filename(filename)
+
+        self.parts = _get_parts(dis, _group_elements(dis), parts)
+        self.geofile = self.__get_filename("{0}_geometry.geo".format(self.basename))
+        with open(self.geofile, "w{0}".format("b" if binary else "")) as f:
+            _write_geometry(f, dis, self.parts, binary=binary, num_threads=num_threads)
+
+        # rows of the elements of each part and EnSight element type within the elements of all
+        # fields
+        field_offsets: Dict[str, int] = {}
+        num_eles = 0
+        for fieldtype, eles in dis.elements.items():
+            field_offsets[fieldtype] = num_eles
+            num_eles += len(eles)
+
+        self.num_eles = num_eles
+        self.ele_rows: List[Dict[str, np.ndarray]] = [
+            {
+                eletype: np.concatenate(
+                    [
+                        field_offsets[fieldtype] + positions
+                        for fieldtype, positions, _ in blocks
+                    ]
+                )
+                for eletype, blocks in part.groups.items()
+            }
+            for part in self.parts
+        ]
+
+        self.ele_vars_props: Dict[str, Dict[str, Any]] = {}
+        self.nodal_vars_props: Dict[str, Dict[str, Any]] = {}
+
+    def add_timestep(
+        self,
+        time: float,
+        node_vars: Optional[Dict[str, np.ndarray]] = None,
+        ele_vars: Optional[Dict[str, np.ndarray]] = None,
+    ) -> None:
+        """
+        Appends a time step to the variable files and updates the case file. All time steps need
+        the same variables with the same dimensions.
+
+        Args:
+            time: Time value of the step
+            node_vars: dict with the variable name as key and the values
+                np.array((num_nodes)) or np.array((num_nodes, dim)) as value
+            ele_vars: dict with the variable name as key and the values
+                np.array((num_ele)) or np.array((num_ele, dim)) as value. The elements are in
+                the order of the fields of the discretization (structure, fluid, ...).
+        """
+        if node_vars is None:
+            node_vars = {}
+        if ele_vars is None:
+            ele_vars = {}
+
+        if len(self.times) > 0 and (
+            node_vars.keys() != self.nodal_vars_props.keys()
+            or ele_vars.keys() != self.ele_vars_props.keys()
+        ):
+            raise RuntimeError(
+                "The variables of time {0} differ from the previous time steps".format(
+                    time
+                )
+            )
+
+        for varname, values in node_vars.items():
+            values = self.__check_variable(
+                varname, values, self.num_nodes, self.nodal_vars_props
+            )
+            self.__append(
+                varname,
+                [{"coordinates": part.get_node_values(values)} for part in self.parts],
+                values.shape[1],
+                self.nodal_vars_props,
+            )
+
+        for varname, values in ele_vars.items():
+            values = self.__check_variable(
+                varname, values, self.num_eles, self.ele_vars_props
+            )
+            self.__append(
+                varname,
+                [
+                    {eletype: values[rows] for eletype, rows in part_rows.items()}
+                    for part_rows in self.ele_rows
+                ],
+                values.shape[1],
+                self.ele_vars_props,
+            )
+
+        self.times.append(float(time))
+
+        for props in list(self.ele_vars_props.values()) + list(
+            self.nodal_vars_props.values()
+        ):
+            props["timesteps"] = len(self.times)
+
+        with open(self.casefile, "w") as f:
+            _write_case(
+                f,
+                os.path.basename(self.geofile),
+                self.ele_vars_props,
+                self.nodal_vars_props,
+                times=np.array(self.times),
+            )
+
+    def __get_filename(self, name: str) -> str:
+        filename = os.path.join(self.filedir, name)
+        if self.override:
+            return filename
+
+        return get_unique_filename(filename)
+
+    def __check_variable(
+        self,
+        varname: str,
+        values: np.ndarray,
+        num_items: int,
+        props: Dict[str, Dict[str, Any]],
+    ) -> np.ndarray:
+        values = np.asarray(values)
+        if len(values.shape) == 1:
+            values = values.reshape((-1, 1))
+
+        if len(values.shape) != 2 or values.shape[0] != num_items:
+            raise RuntimeError(
+                "The data of variable {0} does not fit, expected {1} rows got {2}".format(
+                    varname, num_items, values.shape
+                )
+            )
+
+        if varname in props and props[varname]["dim"] != values.shape[1]:
+            raise RuntimeError(
+                "The dimension of variable {0} changed from {1} to {2}".format(
+                    varname, props[varname]["dim"], values.shape[1]
+                )
+            )
+
+        return values
+
+    def __append(
+        self,
+        varname: str,
+        part_blocks: List[Dict[str, np.ndarray]],
+        dim: int,
+        props: Dict[str, Dict[str, Any]],
+    ) -> None:
+        mode = "a"
+        if varname not in props:
+            varfile = self.__get_filename(
+                "{0}_variable.{1}".format(self.basename, varname)
+            )
+            props[varname] = {
+                "filename": os.path.basename(varfile),
+                "dim": dim,
+                "timesteps": 0,
+            }
+            mode = "w"
+
+        with open(
+            os.path.join(self.filedir, props[varname]["filename"]),
+            "{0}{1}".format(mode, "b" if self.binary else ""),
+        ) as f:
+            if mode == "w" and self.binary:
+                io.ens_write_string(f, "C Binary", binary=True)
+
+            _write_variable_step(
+                f, part_blocks, binary=self.binary, num_threads=self.num_threads
+            )
+
+
+# EnSight element types that can be read
+eletype_to_shape: Dict[str, str] = {
+    "point": "VERTEX1",
+    "bar2": "LINE2",
+    "bar3": "LINE3",
+    "tria3": "TRI3",
+    "tria6": "TRI6",
+    "quad4": "QUAD4",
+    "quad8": "QUAD8",
+    "tetra4": "TET4",
+    "tetra10": "TET10",
+    "pyramid5": "PYRAMID5",
+    "penta6": "WEDGE6",
+    "hexa8": "HEX8",
+    "hexa20": "HEX20",
+    "hexa27": "HEX27",
+}
+
+# number of components of the EnSight variable types
+vartype_num_components: Dict[str, int] = {
+    "scalar": 1,
+    "vector": 3,
+    "tensor symm": 6,
+    "tensor asym": 9,
+}
+
+
+class EnsightPart:
+    """
+    Class holding the geometry of one part of an EnSight geometry file
+    """
+
+    def __init__(
+        self,
+        number: int,
+        description: str,
+        coords: np.ndarray,
+        blocks: List[Tuple[str, np.ndarray]],
+    ):
+        """
+        Args:
+            number: Number of the part
+            description: Description of the part
+            coords: np.array((num_nodes, 3)) Coordinates of the nodes
+            blocks: List of element blocks with EnSight element type and the (one based, local
+                within the part) node ids np.array((num_ele, num_nodes_per_ele))
+        """
+        self.number = number
+        self.description = description
+        self.coords = coords
+        self.blocks = blocks
+
+    def get_num_nodes(self) -> int:
+        return self.coords.shape[0]
+
+    def get_block_sizes(self, eletype: str) -> List[int]:
+        return [len(conn) for t, conn in self.blocks if t == eletype]
+
+
+class EnsightVariable:
+    """
+    Variable of an EnSight case. The values of a time step are read on access only, i.e.
+    variable[k] only maps the data of time step k. If the geometry consists of one part (and one
+    element block for element variables), the values are a read-only view into the memory mapped
+    file.
+    """
+
+    def __init__(
+        self,
+        case: "EnsightCase",
+        name: str,
+        location: str,
+        num_components: int,
+        filename: str,
+        times: np.ndarray,
+        timeset: Optional[Dict[str, List[str]]],
+    ):
+        self.case = case
+        self.name = name
+        self.location = location
+        self.num_components = num_components
+        self.filename = filename
+        self.times = times
+        self.timeset = timeset
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def __getitem__(self, step: int) -> np.ndarray:
+        """
+        Returns the values of the time step
+
+        Args:
+            step: Index of the time step
+
+        Returns:
+            np.array((num_nodes or num_ele, num_components)) or np.array((num_nodes or num_ele))
+            for scalar variables in the order of the nodes or elements of the discretization
+        """
+        if step < 0:
+            step += len(self)
+        if step < 0 or step >= len(self):
+            raise IndexError("Time step {0} is out of range".format(step))
+
+        parts = {part.number: part for part in self.case.parts}
+        buffer, pos = self.case._locate_step(
+            self.filename,
+            self.timeset,
+            step,
+            lambda buffer, pos: _read_variable_step(
+                buffer, pos, parts, self.location, self.num_components
+            )[1],
+        )
+        values, _ = _read_variable_step(
+            buffer, pos, parts, self.location, self.num_components
+        )
+
+        blocks: List[np.ndarray] = []
+        for part in self.case.parts:
+            part_values = values.get(part.number, {})
+            if self.location == "node":
+                keys = ["coordinates"]
+            else:
+                keys = [eletype for eletype, _ in part.blocks]
+
+            for key in keys:
+                if len(part_values.get(key, [])) == 0:
+                    raise NotImplementedError(
+                        "Variable {0} is not defined on all parts".format(self.name)
+                    )
+                blocks.append(part_values[key].pop(0))
+
+        data = blocks[0] if len(blocks) == 1 else np.concatenate(blocks)
+
+        if self.num_components == 1:
+            return data.reshape((-1))
+
+        return data
+
+
+class EnsightCase:
+    """
+    Reader of EnSight Gold cases with binary (C Binary) geometry and variable files. The files are
+    memory mapped, i.e. only the accessed parts of the files are read.
+
+    Transient files can either be single files (with BEGIN TIME STEP/END TIME STEP) or one file
+    per time step (with wildcards * in the filename).
+    """
+
+    def __init__(self, filename: str, geometry_step: int = 0):
+        """
+        Reads the case file and the geometry
+
+        Args:
+            filename: Path to the .case file
+            geometry_step: Time step of the geometry (if the geometry is transient)
+        """
+        self.filedir = os.path.dirname(filename)
+        self.__buffers: Dict[str, np.ndarray] = {}
+        self.__step_offsets: Dict[str, List[int]] = {}
+
+        with open(filename, "r") as f:
+            sections = _read_case_sections(f)
+
+        if "FORMAT" not in sections or not any(
+            ["ensight gold" in line for line in sections["FORMAT"]]
+        ):
+            raise NotImplementedError("Only EnSight Gold case files can be read")
+
+        self.timesets = _read_sets(sections.get("TIME", []), "time set")
+
+        geometry = [
+            line.split(":", 1)[1].split()
+            for line in sections.get("GEOMETRY", [])
+            if line.split(":", 1)[0].strip() == "model"
+        ]
+        if len(geometry) == 0:
+            raise RuntimeError("The case file does not define the geometry (model)")
+        geometry_ts, (self.geometry_file,) = _read_set_and_filename(geometry[0])
+        geometry_timeset = self.timesets.get(geometry_ts, None)
+
+        # the time steps of the variables have a constant size over a static geometry
+        self.static_geometry: bool = (
+            int(_get_set_value(geometry_timeset, "number of steps", "1")) <= 1
+        )
+
+        self.parts, _ = _read_geometry_step(
+            *self._locate_step(
+                self.geometry_file,
+                geometry_timeset,
+                geometry_step,
+                lambda buffer, pos: _read_geometry_step(buffer, pos)[1],
+            )
+        )
+
+        self.variables: Dict[str, EnsightVariable] = {}
+        for line in sections.get("VARIABLE", []):
+            key, values = line.split(":", 1)
+            vartype, _, location = key.strip().rpartition(" per ")
+            if vartype not in vartype_num_components or location not in (
+                "node",
+                "element",
+            ):
+                # e.g. constants or complex variables
+                continue
+
+            ts, tokens = _read_set_and_filename(values.split(), num_names=2)
+            timeset = self.timesets.get(ts, None)
+            self.variables[tokens[0]] = EnsightVariable(
+                self,
+                tokens[0],
+                location,
+                vartype_num_components[vartype],
+                tokens[1],
+                _get_times(timeset),
+                timeset,
+            )
+
+    def get_discretization(self) -> Discretization:
+        """
+        Returns the geometry as discretization. All elements are structural elements in the order
+        of the parts and element blocks. Variables with only one time step are stored as nodal and
+        element data.
+
+        Returns:
+            Discretization
+        """
+        from .element import factory_many
+        from .meshio_to_discretization import cell_disc_eles, disc_shape_cell
+
+        dis = Discretization()
+        dis.nodes = Node.from_coords(
+            np.concatenate([part.coords for part in self.parts])
+            if len(self.parts) > 0
+            else np.zeros((0, 3))
+        )
+
+        dis.elements.structure = []
+        node_offset = 0
+        for part in self.parts:
+            for eletype, conn in part.blocks:
+                shape = eletype_to_shape[eletype]
+                dis.elements.structure.extend(
+                    factory_many(
+                        shape,
+                        conn - 1 + node_offset,
+                        dis.nodes,
+                        type=cell_disc_eles.get(
+                            disc_shape_cell.get(shape, ""), "UNKNOWN"
+                        ),
+                        throw_if_unknown=False,
+                    )
+                )
+            node_offset += part.get_num_nodes()
+
+        for name, variable in self.variables.items():
+            if len(variable) != 1:
+                continue
+
+            if variable.location == "node":
+                dis.set_node_data(name, np.array(variable[0], dtype=float))
+            else:
+                dis.set_element_data(name, np.array(variable[0], dtype=float))
+
+        dis.finalize()
+        return dis
+
+    def _locate_step(
+        self,
+        filename: str,
+        timeset: Optional[Dict[str, List[str]]],
+        step: int,
+        skip_step: Callable[[np.ndarray, int], int],
+        fixed_size: bool = False,
+    ) -> Tuple[np.ndarray, int]:
+        """
+        Returns the memory mapped file and the position of the data of the time step (after BEGIN
+        TIME STEP). Steps in single files are located via the file index, or by the size of the
+        first step without reading the previous steps, if the steps are known to have a constant
+        size or the steps of the time set fill the file exactly.
+
+        Args:
+            filename: Filename as in the case file
+            timeset: Time set of the file
+            step: Index of the time step
+            skip_step: Function that returns the position of END TIME STEP of the step starting at
+                the position
+            fixed_size: Whether all steps of the file have the same size (e.g. variables over a
+                static geometry)
+
+        Returns:
+            Tuple of the memory mapped file and the position of the time step
+        """
+        if "*" in filename:
+            # one file per time step
+            start = int(_get_set_value(timeset, "filename start number", "0"))
+            increment = int(_get_set_value(timeset, "filename increment", "1"))
+            wildcard = re.search(r"\*+", filename)
+            assert wildcard is not None
+            filename = "{0}{1:0{2}d}{3}".format(
+                filename[: wildcard.start()],
+                start + step * increment,
+                wildcard.end() - wildcard.start(),
+                filename[wildcard.end() :],
+            )
+            step = 0
+            num_steps = 1
+        else:
+            num_steps = int(_get_set_value(timeset, "number of steps", "1"))
+
+        buffer = self.__get_buffer(filename)
+        first = _get_first_step(buffer)
+
+        if first is None:
+            # file without time steps
+            if step != 0:
+                raise IndexError("The file {0} has only one time step".format(filename))
+            return buffer, 80
+
+        if filename not in self.__step_offsets:
+            self.__step_offsets[filename] = _read_file_index(buffer)
+
+        offsets = self.__step_offsets[filename]
+        if step < len(offsets) and _is_step(buffer, offsets[step]):
+            return buffer, offsets[step] + 80
+
+        # steps of constant size
+        size = skip_step(buffer, first + 80) + 80 - first
+        if (fixed_size or first + num_steps * size == len(buffer)) and _is_step(
+            buffer, first + step * size
+        ):
+            return buffer, first + step * size + 80
+
+        # go through all steps
+        pos = first
+        for _ in range(step):
+            pos = skip_step(buffer, pos + 80) + 80
+            if not _is_step(buffer, pos):
+                raise IndexError(
+                    "The file {0} has less than {1} time steps".format(
+                        filename, step + 1
+                    )
+                )
+
+        return buffer, pos + 80
+
+    def __get_buffer(self, filename: str) -> np.ndarray:
+        if filename not in self.__buffers:
+            path = os.path.join(self.filedir, filename)
+            if os.path.getsize(path) < 80:
+                raise RuntimeError("The EnSight file {0} is empty".format(path))
+
+            buffer = np.memmap(path, dtype=np.uint8, mode="r")
+            file_format, _ = io.ens_read_string(buffer, 0)
+            if file_format.lower() != "c binary":
+                raise NotImplementedError(
+                    "Only C Binary EnSight files can be read, {0} is {1}".format(
+                        path,
+                        (
+                            "Fortran Binary"
+                            if file_format.lower().startswith("fortran")
+                            else "ASCII"
+                        ),
+                    )
+                )
+
+            self.__buffers[filename] = buffer
+
+        return self.__buffers[filename]
+
+
+def read_case(filename: str) -> Discretization:
+    """
+    Reads the geometry of a binary EnSight Gold case as discretization. Variables with only one time
+    step are stored as nodal and element data. Use EnsightCase to access transient variables.
+
+    Args:
+        filename: Path to the .case file
+
+    Returns:
+        Discretization
+    """
+    return EnsightCase(filename).get_discretization()
+
+
+def _read_case_sections(fstream: IO) -> Dict[str, List[str]]:
+    """
+    Returns the lines of each section of the case file (without comments and empty lines)
+    """
+    sections: Dict[str, List[str]] = {}
+    current: List[str] = []
+    for line in fstream:
+        line = line.split("#", 1)[0].strip()
+        if len(line) == 0:
+            continue
+
+        if line in ("FORMAT", "GEOMETRY", "VARIABLE", "TIME", "FILE", "MATERIAL"):
+            current = sections.setdefault(line, [])
+        elif ":" not in line and len(current) > 0:
+            # continuation of the previous line (e.g. time values)
+            current[-1] += " " + line
+        else:
+            current.append(line)
+
+    return sections
+
+
+def _read_sets(lines: List[str], key: str) -> Dict[int, Dict[str, List[str]]]:
+    """
+    Returns the entries of the time or file sets with the set number as key
+    """
+    sets: Dict[int, Dict[str, List[str]]] = {}
+    current: Dict[str, List[str]] = {}
+    for line in lines:
+        name, values = line.split(":", 1)
+        name = name.strip()
+        if name == key:
+            current = sets.setdefault(int(values.split()[0]), {})
+        else:
+            current[name] = values.split()
+
+    return sets
+
+
+def _get_set_value(
+    timeset: Optional[Dict[str, List[str]]], key: str, default: str
+) -> str:
+    if timeset is None or key not in timeset or len(timeset[key]) == 0:
+        return default
+
+    return timeset[key][0]
+
+
+def _get_times(timeset: Optional[Dict[str, List[str]]]) -> np.ndarray:
+    if timeset is None:
+        return np.zeros((1))
+
+    num_steps = int(_get_set_value(timeset, "number of steps", "1"))
+    return np.array(timeset.get("time values", [])[:num_steps], dtype=float)
+
+
+def _read_set_and_filename(
+    tokens: List[str], num_names: int = 1
+) -> Tuple[Optional[int], List[str]]:
+    """
+    Splits the tokens of a geometry or variable line of the case file into the time set and the
+    names (description and filename for variables, filename for the geometry)
+    """
+    if num_names == 1:
+        # model: [ts] [fs] filename [change_coords_only [cstep]]
+        numbers = []
+        for token in tokens:
+            if not token.isdigit() or len(numbers) == 2:
+                break
+            numbers.append(int(token))
+        names = tokens[len(numbers) : len(numbers) + 1]
+    else:
+        numbers = [int(t) for t in tokens[: len(tokens) - num_names]]
+        names = tokens[len(tokens) - num_names :]
+
+    if len(names) != num_names:
+        raise RuntimeError("Could not read the case file line {0}".format(tokens))
+
+    return (numbers[0] if len(numbers) > 0 else None), names
+
+
+def _get_first_step(buffer: np.ndarray) -> Optional[int]:
+    """
+    Returns the position of the first BEGIN TIME STEP or None, if the file has no time steps
+    """
+    if _is_step(buffer, 80):
+        return 80
+
+    return None
+
+
+def _is_step(buffer: np.ndarray, pos: int) -> bool:
+    return io.ens_read_string(buffer, pos)[0] == "BEGIN TIME STEP"
+
+
+def _read_file_index(buffer: np.ndarray) -> List[int]:
+    """
+    Returns the positions of the time steps from the file index at the end of a single file. If
+    there is no file index, an empty list is returned.
+    """
+    if len(buffer) < 88 or io.ens_read_string(buffer, len(buffer) - 88)[0] != (
+        "FILE_INDEX"
+    ):
+        return []
+
+    index = int(buffer[len(buffer) - 8 :].view("<i8")[0])
+    if index < 0 or index + 4 > len(buffer):
+        return []
+
+    num_steps = int(buffer[index : index + 4].view("<i4")[0])
+    if num_steps < 0 or index + 4 + 8 * num_steps > len(buffer):
+        return []
+
+    return buffer[index + 4 : index + 4 + 8 * num_steps].view("<i8").tolist()
+
+
+def _read_geometry_step(buffer: np.ndarray, pos: int) -> Tuple[List[EnsightPart], int]:
+    """
+    Reads the parts of the geometry starting at the position (after BEGIN TIME STEP)
+
+    Returns:
+        Tuple of the parts and the position after the geometry (END TIME STEP or end of file)
+    """
+    _, pos = io.ens_read_string(buffer, pos)
+    _, pos = io.ens_read_string(buffer, pos)
+    node_id, pos = io.ens_read_string(buffer, pos)
+    element_id, pos = io.ens_read_string(buffer, pos)
+    has_node_ids = node_id.split()[-1] in ("given", "ignore")
+    has_element_ids = element_id.split()[-1] in ("given", "ignore")
+
+    end = pos
+    key, pos = io.ens_read_string(buffer, pos)
+    if key == "extents":
+        end = pos + 6 * 4
+        key, pos = io.ens_read_string(buffer, end)
+
+    parts: List[EnsightPart] = []
+    while key == "part":
+        number, pos = io.ens_read_ints(buffer, pos, 1)
+        description, pos = io.ens_read_string(buffer, pos)
+        key, pos = io.ens_read_string(buffer, pos)
+        if key != "coordinates":
+            raise NotImplementedError(
+                "Only unstructured parts can be read, got {0}".format(key)
+            )
+
+        num_nodes, pos = io.ens_read_ints(buffer, pos, 1)
+        if has_node_ids:
+            pos += 4 * int(num_nodes[0])
+        coords, pos = io.ens_read_floats(buffer, pos, 3 * int(num_nodes[0]))
+
+        blocks: List[Tuple[str, np.ndarray]] = []
+        end = pos
+        key, pos = io.ens_read_string(buffer, pos)
+        while key not in ("part", "END TIME STEP", ""):
+            if key not in eletype_to_shape:
+                raise NotImplementedError(
+                    "The EnSight element type {0} is not implemented".format(key)
+                )
+
+            num_eles, pos = io.ens_read_ints(buffer, pos, 1)
+            if has_element_ids:
+                pos += 4 * int(num_eles[0])
+            num_nodes_per_ele = NumNodesByShape[eletype_to_shape[key]]
+            conn, pos = io.ens_read_ints(
+                buffer, pos, int(num_eles[0]) * num_nodes_per_ele
+            )
+            blocks.append((key, conn.reshape((-1, num_nodes_per_ele))))
+
+            end = pos
+            key, pos = io.ens_read_string(buffer, pos)
+
+        parts.append(
+            EnsightPart(int(number[0]), description, coords.reshape((3, -1)).T, blocks)
+        )
+
+    return parts, end
+
+
+def _read_variable_step(
+    buffer: np.ndarray,
+    pos: int,
+    parts: Dict[int, EnsightPart],
+    location: str,
+    num_components: int,
+) -> Tuple[Dict[int, Dict[str, np.ndarray]], int]:
+    """
+    Reads the values of a variable starting at the position (after BEGIN TIME STEP)
+
+    Returns:
+        Tuple of the values (part number as key and dict of coordinates or EnSight element type
+        with the list of values np.array((num_items, num_components)) of each block as value) and
+        the position after the values (END TIME STEP or end of file)
+    """
+    _, pos = io.ens_read_string(buffer, pos)
+
+    values: Dict[int, Dict[str, List[np.ndarray]]] = {}
+    end = pos
+    key, pos = io.ens_read_string(buffer, pos)
+    while key == "part":
+        number, pos = io.ens_read_ints(buffer, pos, 1)
+        part = parts[int(number[0])]
+        part_values = values.setdefault(part.number, {})
+
+        end = pos
+        key, pos = io.ens_read_string(buffer, pos)
+        while key not in ("part", "END TIME STEP", ""):
+            block_values = part_values.setdefault(key, [])
+            if location == "node" and key == "coordinates":
+                sizes = [part.get_num_nodes()]
+            elif location == "element" and key in eletype_to_shape:
+                # blocks of the same element type are in the order of the geometry
+                sizes = part.get_block_sizes(key)
+            else:
+                raise NotImplementedError(
+                    "Variables with {0} are not implemented".format(key)
+                )
+
+            if len(block_values) >= len(sizes):
+                raise RuntimeError(
+                    "The variable has more {0} blocks than the geometry".format(key)
+                )
+            count = sizes[len(block_values)]
+
+            data, pos = io.ens_read_floats(buffer, pos, count * num_components)
+            block_values.append(data.reshape((num_components, count)).T)
+
+            end = pos
+            key, pos = io.ens_read_string(buffer, pos)
+
+    return values, end
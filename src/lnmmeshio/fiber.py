@@ -1,8 +1,14 @@
-from typing import IO, Dict, Optional
+import re
+from typing import IO, Any, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 
-from .ioutils import line_option_list, read_option_items
+from .fielddata import ColumnTable, DataView
+from .ioutils import line_option_list
+
+RegExFiber = re.compile(
+    r"(?:^| )(FIBER[1-9]|CIR|TAN|RAD|AXI)[ ]+(\S+)[ ]+(\S+)[ ]+(\S+)(?=\s|$)"
+)
 
 
 class Fiber:
@@ -41,6 +47,19 @@ class Fiber:
         Args:
             inp_type: type of fiber (defined as static variable)
         """
+        return line_option_list({Fiber.get_fiber_key(inp_type): self.fiber})
+
+    @staticmethod
+    def get_fiber_key(inp_type: str) -> str:
+        """
+        Returns the name of the fiber as defined in the dat file
+
+        Args:
+            inp_type: type of fiber (defined as static variable)
+
+        Returns:
+            Fiber name as defined in the dat file
+        """
         ftype: Optional[str] = None
 
         if inp_type == Fiber.TypeFiber1:
@@ -72,7 +91,72 @@ class Fiber:
         else:
             raise ValueError("Unknown fiber type {0}".format(inp_type))
 
-        return line_option_list({ftype: self.fiber})
+        return ftype
+
+    @staticmethod
+    def get_lines(inp_type: str, fibers: np.ndarray) -> List[str]:
+        """
+        Gets the corresponding line definitions in the dat file of many fibers at once
+
+        Args:
+            inp_type: type of fiber (defined as static variable)
+            fibers: np.array((num_fibers, 3)) with the fiber vectors
+
+        Returns:
+            List of lines, one for each fiber
+        """
+        ftype = Fiber.get_fiber_key(inp_type)
+
+        if fibers.dtype == np.float64:
+            # python floats are formatted exactly like numpy doubles
+            return [
+                "{0} {1} {2} {3}".format(ftype, *fiber) for fiber in fibers.tolist()
+            ]
+
+        return [
+            "{0} {1}".format(ftype, " ".join([str(i) for i in fiber]))
+            for fiber in fibers
+        ]
+
+    @staticmethod
+    def get_item_lines(items: Sequence[Any]) -> List[str]:
+        """
+        Gets the fiber definitions in the dat file of many nodes or elements at once. The
+        columnwise stored fibers are formatted per fiber type, followed by the locally stored
+        fibers of each item (same order as item.fibers).
+
+        Args:
+            items: List of nodes or elements
+
+        Returns:
+            List of the fiber definitions, one for each item (empty if the item has no fibers)
+        """
+        table = ColumnTable.of(items)
+        if table is None:
+            return [item.fibers.get_line() for item in items]
+
+        columns = table.fibers
+        if len(columns) > 0:
+            lines = [
+                " ".join(fibers)
+                for fibers in zip(
+                    *[Fiber.get_lines(t, fibers) for t, fibers in columns.items()]
+                )
+            ]
+        else:
+            lines = [""] * len(items)
+
+        for i, item in enumerate(items):
+            local = item._fibers
+            if not local:
+                continue
+
+            texts = [f.get_line(t) for t, f in local.items() if t not in columns]
+            if len(lines[i]) > 0:
+                texts.insert(0, lines[i])
+            lines[i] = " ".join(texts)
+
+        return lines
 
     def write(self, dest: IO, inp_type: str) -> None:
         """
@@ -167,87 +251,150 @@ class Fiber:
             dict with fiber type as key and fiber object as value
         """
         fibs: dict = {}
-        if "FIBER1" in line:
-            fibs[Fiber.TypeFiber1] = Fiber(
-                np.array(
-                    [float(i) for i in read_option_items(line, "FIBER1", num=3)[0]]
+        for match in RegExFiber.finditer(line.split("//", 1)[0]):
+            ftype = Fiber.get_fiber_type(match.group(1))
+            if ftype not in fibs:
+                fibs[ftype] = Fiber(
+                    np.array([float(match.group(i)) for i in range(2, 5)])
                 )
-            )
 
-        if "FIBER2" in line:
-            fibs[Fiber.TypeFiber2] = Fiber(
-                np.array(
-                    [float(i) for i in read_option_items(line, "FIBER2", num=3)[0]]
-                )
-            )
+        return fibs
 
-        if "FIBER3" in line:
-            fibs[Fiber.TypeFiber3] = Fiber(
-                np.array(
-                    [float(i) for i in read_option_items(line, "FIBER3", num=3)[0]]
-                )
-            )
+    @staticmethod
+    def parse_fiber_arrays(
+        lines: List[str],
+    ) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """
+        Parses the fibers of many lines at once
 
-        if "FIBER4" in line:
-            fibs[Fiber.TypeFiber4] = Fiber(
-                np.array(
-                    [float(i) for i in read_option_items(line, "FIBER4", num=3)[0]]
-                )
-            )
+        Args:
+            lines: List of lines
 
-        if "FIBER5" in line:
-            fibs[Fiber.TypeFiber5] = Fiber(
-                np.array(
-                    [float(i) for i in read_option_items(line, "FIBER5", num=3)[0]]
-                )
+        Returns:
+            dict with fiber type as key and a tuple of the line indices np.array((num_fibers)) and
+            the fiber vectors np.array((num_fibers, 3)) as value
+        """
+        positions: Dict[str, List[int]] = {}
+        values: Dict[str, List[Tuple[str, str, str]]] = {}
+
+        for i, line in enumerate(lines):
+            found = set()
+            for match in RegExFiber.finditer(line.split("//", 1)[0]):
+                key = match.group(1)
+                if key in found:
+                    continue
+                found.add(key)
+
+                positions.setdefault(key, []).append(i)
+                values.setdefault(key, []).append(match.group(2, 3, 4))
+
+        return {
+            Fiber.get_fiber_type(key): (
+                np.array(positions[key], dtype=int),
+                np.array(values[key], dtype=float).reshape((-1, 3)),
             )
+            for key in positions.keys()
+        }
 
-        if "FIBER6" in line:
-            fibs[Fiber.TypeFiber6] = Fiber(
-                np.array(
-                    [float(i) for i in read_option_items(line, "FIBER6", num=3)[0]]
-                )
-            )
+    @staticmethod
+    def normalize(fibers: np.ndarray) -> np.ndarray:
+        """
+        Scales many fibers to unit length. Fibers with zero length are kept.
 
-        if "FIBER7" in line:
-            fibs[Fiber.TypeFiber7] = Fiber(
-                np.array(
-                    [float(i) for i in read_option_items(line, "FIBER7", num=3)[0]]
-                )
-            )
+        Args:
+            fibers: np.array((num_fibers, 3))
 
-        if "FIBER8" in line:
-            fibs[Fiber.TypeFiber8] = Fiber(
-                np.array(
-                    [float(i) for i in read_option_items(line, "FIBER8", num=3)[0]]
-                )
-            )
+        Returns:
+            np.array((num_fibers, 3)) with normalized fibers
+        """
+        norm = np.linalg.norm(fibers, axis=-1, keepdims=True)
+        return np.divide(
+            fibers, norm, out=np.array(fibers, dtype=float), where=norm > 0.0
+        )
+
+    @staticmethod
+    def orthogonalize(
+        fibers1: np.ndarray, fibers2: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Orthonormalizes pairs of fibers (Gram-Schmidt). The direction of the first fibers is kept,
+        the second fibers are made orthogonal to the first ones.
+
+        Args:
+            fibers1: np.array((num_fibers, 3))
+            fibers2: np.array((num_fibers, 3))
+
+        Returns:
+            Tuple of the orthonormalized fibers np.array((num_fibers, 3))
+        """
+        e1 = Fiber.normalize(fibers1)
+        e2 = fibers2 - np.sum(fibers2 * e1, axis=-1, keepdims=True) * e1
 
-        if "FIBER9" in line:
-            fibs[Fiber.TypeFiber9] = Fiber(
-                np.array(
-                    [float(i) for i in read_option_items(line, "FIBER9", num=3)[0]]
+        return e1, Fiber.normalize(e2)
+
+    @staticmethod
+    def transform(fibers: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+        """
+        Applies a linear transformation (e.g. a rotation) to many fibers. For an affine
+        transformation, only the linear part acts on the fiber directions.
+
+        Args:
+            fibers: np.array((num_fibers, 3))
+            matrix: np.array((3, 3)) linear transformation or np.array((4, 4)) affine
+                transformation in homogeneous coordinates
+
+        Returns:
+            np.array((num_fibers, 3)) with the transformed fibers
+        """
+        matrix = np.asarray(matrix)
+        if matrix.shape == (4, 4):
+            matrix = matrix[:3, :3]
+
+        if matrix.shape != (3, 3):
+            raise ValueError(
+                "Expecting a 3x3 or 4x4 transformation matrix, got {0}".format(
+                    matrix.shape
                 )
             )
 
-        if "CIR" in line:
-            fibs[Fiber.TypeCir] = Fiber(
-                np.array([float(i) for i in read_option_items(line, "CIR", num=3)[0]])
-            )
+        return np.matmul(fibers, matrix.T)
 
-        if "TAN" in line:
-            fibs[Fiber.TypeTan] = Fiber(
-                np.array([float(i) for i in read_option_items(line, "TAN", num=3)[0]])
-            )
 
-        if "RAD" in line:
-            fibs[Fiber.TypeRad] = Fiber(
-                np.array([float(i) for i in read_option_items(line, "RAD", num=3)[0]])
-            )
+class FiberView(DataView):
+    """
+    Dict-like access to the fibers of one node or element. Fiber types that are stored columnwise
+    in the discretization are returned as fibers whose vector is a view into the row of the item.
+    """
 
-        if "AXI" in line:
-            fibs[Fiber.TypeAxi] = Fiber(
-                np.array([float(i) for i in read_option_items(line, "AXI", num=3)[0]])
-            )
+    __slots__ = ()
 
-        return fibs
+    table_attribute: str = "fibers"
+    local_attribute: str = "_fibers"
+
+    def __getitem__(self, key: str) -> Fiber:
+        columns = self.columns
+        if key in columns:
+            return Fiber(columns[key][self.item._row])
+
+        return self.local[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        columns = self.columns
+        if key in columns:
+            columns[key][self.item._row] = value.fiber
+        else:
+            self._set_local(key, value)
+
+    def get_line(self) -> str:
+        """
+        Returns the fiber definitions of the item in the dat file (empty if there are no fibers)
+        """
+        columns = self.columns
+        row = self.item._row
+        texts = [
+            Fiber.get_lines(t, fibers[row : row + 1])[0]
+            for t, fibers in columns.items()
+        ]
+        texts.extend([f.get_line(t) for t, f in self.local.items() if t not in columns])
+
+        return " ".join(texts)
@@ -0,0 +1,505 @@
+from itertools import repeat
+from operator import attrgetter, is_
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Sequence,
+)
+
+import numpy as np
+
+# shared empty dict of unbound views and of items without local variables (never modified)
+_Empty: Dict[str, Any] = {}
+
+
+class ColumnTable:
+    """
+    Columnwise stored variables of a list of items (the nodes or the elements of one field). Each
+    item only refers to the table and to its row, the views into the columns (item.data,
+    item.fibers and item.options) are created on access. The table of nodes may also hold the
+    coordinate buffer of the nodes.
+    """
+
+    __slots__ = (
+        "items",
+        "size",
+        "coords",
+        "coords_complete",
+        "data",
+        "fibers",
+        "options",
+        "owner",
+    )
+
+    def __init__(self, items: Sequence[Any], coords: Optional[np.ndarray] = None):
+        """
+        Initialize a table without any columns
+
+        Args:
+            items: List of nodes or elements
+            coords: Coordinate buffer of the nodes np.array((num_nodes, 3)), node.coords of each
+                node is a view into its row
+        """
+        self.items = items
+        self.size = len(items)
+        self.coords: Optional[np.ndarray] = coords
+
+        # whether the buffer holds the coordinates of all nodes (false after a node got own
+        # coordinates assigned)
+        self.coords_complete: bool = coords is not None
+        self.data: Dict[str, np.ndarray] = {}
+        self.fibers: Dict[str, np.ndarray] = {}
+        self.options: Dict[str, "CategoricalColumn"] = {}
+
+        # discretization that stores its variables in the columns (None if not bound to one)
+        self.owner: Any = None
+
+    @staticmethod
+    def of(items: Sequence[Any]) -> Optional["ColumnTable"]:
+        """
+        Returns the table of the items or None, if the items are not bound to a table as a whole,
+        i.e. the table was not bound to exactly this list or the items were reordered since.
+
+        Args:
+            items: List of nodes or elements
+
+        Returns:
+            Table of the items or None
+        """
+        if len(items) == 0:
+            return None
+
+        table = items[0]._table
+        if table is None or table.items is not items or table.size != len(items):
+            return None
+
+        rows = table.rows_of(items)
+        if rows is None or np.any(rows != np.arange(len(items))):
+            return None
+
+        return table
+
+    def rows_of(self, items: Sequence[Any]) -> Optional[np.ndarray]:
+        """
+        Returns the rows of the items within the table or None, if not all items are bound to the
+        table
+
+        Args:
+            items: List of nodes or elements
+
+        Returns:
+            np.array((num_items)) with the rows or None
+        """
+        if not all(map(is_, map(attrgetter("_table"), items), repeat(self))):
+            return None
+
+        return np.fromiter(
+            map(attrgetter("_row"), items), dtype=np.int64, count=len(items)
+        )
+
+    @staticmethod
+    def gather_columns(items: Sequence[Any], attribute: str) -> Dict[str, Any]:
+        """
+        Gathers the columns of the tables the items are bound to into new columns in the order of
+        the items, e.g. after the items were reordered or moved into another list. Items without
+        a value of a categorical column get no value (code -1).
+
+        Args:
+            items: List of nodes or elements
+            attribute: Name of the columns (data, fibers or options)
+
+        Raises:
+            RuntimeError: If a variable is not stored for all items
+
+        Returns:
+            dict with the gathered columns
+        """
+        num_items = len(items)
+        tables = list(map(attrgetter("_table"), items))
+        rows = np.fromiter(
+            map(attrgetter("_row"), items), dtype=np.int64, count=num_items
+        )
+
+        columns: Dict[str, Any] = {}
+        is_filled: Dict[str, np.ndarray] = {}
+        for table in dict.fromkeys(tables):
+            if table is None or len(getattr(table, attribute)) == 0:
+                continue
+
+            mask = np.fromiter(
+                map(is_, tables, repeat(table)), dtype=bool, count=num_items
+            )
+            table_rows = rows[mask]
+            for name, values in getattr(table, attribute).items():
+                if isinstance(values, CategoricalColumn):
+                    column = columns.setdefault(name, CategoricalColumn(num_items))
+
+                    # the categories of the tables may differ, -1 stays -1
+                    codes = np.array(
+                        [column.encode(c) for c in values.categories] + [-1],
+                        dtype=column.codes.dtype,
+                    )
+                    column.codes[mask] = codes[values.codes[table_rows]]
+                    continue
+
+                if name not in columns:
+                    columns[name] = np.zeros(
+                        (num_items,) + values.shape[1:], dtype=values.dtype
+                    )
+                    is_filled[name] = np.zeros(num_items, dtype=bool)
+                columns[name][mask] = values[table_rows]
+                is_filled[name] |= mask
+
+        for name, filled in is_filled.items():
+            if not np.all(filled):
+                raise RuntimeError(
+                    "Variable {0} is only stored for {1} of {2} items, items were added or "
+                    "replaced since it was set".format(name, np.sum(filled), num_items)
+                )
+
+        return columns
+
+    def bind(self) -> None:
+        """
+        Binds all items to their row of the table. Nodes that leave a table with a coordinate
+        buffer keep a view into their row as their own coordinates.
+        """
+        has_coords = self.coords is not None
+        for i, item in enumerate(self.items):
+            if has_coords:
+                item._coords = None
+            else:
+                old = item._table
+                if old is not None and old.coords is not None and item._coords is None:
+                    item._coords = old.coords[item._row]
+
+            item._table = self
+            item._row = i
+
+
+class DataView(MutableMapping):
+    """
+    Dict-like access to the data of one node or element. Variables that are stored columnwise in
+    the discretization (one array per variable) are read from and written into the row of the
+    item. All other variables are stored locally in the item.
+    """
+
+    __slots__ = ("item",)
+
+    # name of the columns within the table and of the local variables within the item
+    table_attribute: str = "data"
+    local_attribute: str = "_data"
+
+    def __init__(self, item: Any):
+        """
+        Initialize the view of an item
+
+        Args:
+            item: Node or element
+        """
+        self.item = item
+
+    @property
+    def columns(self) -> Dict[str, Any]:
+        table = self.item._table
+        if table is None:
+            return _Empty
+
+        return getattr(table, self.table_attribute)
+
+    @property
+    def index(self) -> int:
+        return self.item._row
+
+    @property
+    def local(self) -> Dict[str, Any]:
+        local = getattr(self.item, self.local_attribute)
+        if local is None:
+            return _Empty
+
+        return local
+
+    def _set_local(self, key: str, value: Any) -> None:
+        local = getattr(self.item, self.local_attribute)
+        if local is None:
+            local = {}
+            setattr(self.item, self.local_attribute, local)
+
+        local[key] = value
+
+    def __getitem__(self, key: str) -> Any:
+        columns = self.columns
+        if key in columns:
+            return columns[key][self.item._row]
+
+        return self.local[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        columns = self.columns
+        if key in columns:
+            columns[key][self.item._row] = value
+        else:
+            self._set_local(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        if key in self.columns:
+            raise RuntimeError(
+                "Variable {0} is stored columnwise and can only be removed for all items".format(
+                    key
+                )
+            )
+
+        del self.local[key]
+
+    def __iter__(self) -> Iterator[str]:
+        columns = self.columns
+        yield from columns
+        for key in self.local:
+            if key not in columns:
+                yield key
+
+    def __len__(self) -> int:
+        return len(self.columns) + len(self.local.keys() - self.columns.keys())
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+
+class CategoricalColumn:
+    """
+    Column of a variable with only a few distinct values (e.g. the options of the elements like
+    MAT or KINEM). Each row stores an integer code into the list of distinct values (categories).
+    Rows without a value have the code -1. Values like lists are copied when they are stored and
+    returned, since one category is shared by many rows.
+    """
+
+    __slots__ = ("codes", "categories", "_lookup")
+
+    def __init__(self, num_items: int):
+        """
+        Initialize a column without any values
+
+        Args:
+            num_items: Number of rows
+        """
+        self.codes: np.ndarray = np.full(num_items, -1, dtype=np.int32)
+        self.categories: List[Any] = []
+        self._lookup: Dict[Any, int] = {}
+
+    @staticmethod
+    def _hashable(value: Any) -> Any:
+        if isinstance(value, (list, np.ndarray)):
+            return tuple(value)
+
+        return value
+
+    @staticmethod
+    def _copy(value: Any) -> Any:
+        # the categories are shared by many rows and must not be changed through one of them
+        if isinstance(value, list):
+            return list(value)
+        if isinstance(value, np.ndarray):
+            return value.copy()
+
+        return value
+
+    @staticmethod
+    def text(value: Any) -> str:
+        if hasattr(value, "__iter__") and not isinstance(value, str):
+            return " ".join([str(i) for i in value])
+
+        return str(value)
+
+    def encode(self, value: Any) -> int:
+        """
+        Returns the code of the value. Unknown values are added to the categories.
+
+        Args:
+            value: Value of the variable (None for no value)
+
+        Returns:
+            code of the value
+        """
+        if value is None:
+            return -1
+
+        key = CategoricalColumn._hashable(value)
+        code = self._lookup.get(key, None)
+        if code is None:
+            code = len(self.categories)
+            self.categories.append(CategoricalColumn._copy(value))
+            self._lookup[key] = code
+
+        return code
+
+    def resize(self, num_items: int) -> None:
+        """
+        Changes the number of rows. New rows have no value.
+
+        Args:
+            num_items: New number of rows
+        """
+        codes = np.full(num_items, -1, dtype=np.int32)
+        num = min(num_items, len(self.codes))
+        codes[:num] = self.codes[:num]
+        self.codes = codes
+
+    def has_value(self, index: int) -> bool:
+        return self.codes[index] >= 0
+
+    def find(self, value: Any) -> np.ndarray:
+        """
+        Returns the rows with the value. Values are compared by their text representation in the
+        input file, i.e. 3 and "3" are equal.
+
+        Args:
+            value: Value of the variable
+
+        Returns:
+            np.array((num_found)) with the rows
+        """
+        text = CategoricalColumn.text(value)
+        codes = [
+            code
+            for code, category in enumerate(self.categories)
+            if CategoricalColumn.text(category) == text
+        ]
+
+        return np.flatnonzero(np.isin(self.codes, codes))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index: int) -> Any:
+        code = self.codes[index]
+        if code < 0:
+            return None
+
+        return CategoricalColumn._copy(self.categories[code])
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        self.codes[index] = self.encode(value)
+
+
+class OptionView(DataView):
+    """
+    Dict-like access to the options of one element. Options that are stored columnwise in the
+    discretization are read from and written into the row of the element in the categorical
+    columns.
+    """
+
+    __slots__ = ()
+
+    table_attribute: str = "options"
+    local_attribute: str = "_options"
+
+    def __getitem__(self, key: str) -> Any:
+        columns = self.columns
+        if key in columns:
+            column = columns[key]
+            if column.has_value(self.item._row):
+                return column[self.item._row]
+            if key not in self.local:
+                raise KeyError(key)
+
+        return self.local[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        columns = self.columns
+        if key in columns:
+            columns[key][self.item._row] = value
+        else:
+            self._set_local(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        columns = self.columns
+        if key in columns and columns[key].has_value(self.item._row):
+            columns[key][self.item._row] = None
+        else:
+            del self.local[key]
+
+    def __iter__(self) -> Iterator[str]:
+        columns = self.columns
+        row = self.item._row
+        for key, column in columns.items():
+            if column.has_value(row):
+                yield key
+        for key in self.local:
+            if key not in columns:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+def gather(
+    items: Sequence[Any],
+    columns: Dict[str, np.ndarray],
+    attribute: str = "_data",
+    value_of: Optional[Callable[[Any], Any]] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Returns all variables of the items as arrays. Columnwise stored variables are returned without
+    copying, all other variables are gathered from the items. Items without a value of a gathered
+    variable are filled with zeros.
+
+    Args:
+        items: List of nodes or elements
+        columns: Dictionary with variable name as key and np.array((num_items, ...)) as value
+        attribute: Name of the attribute of the items that holds the local variables
+        value_of: Optional function that converts a locally stored value into an array
+
+    Returns:
+        Dictionary with variable name as key and np.array((num_items, ...)) as value
+    """
+    data: Dict[str, np.ndarray] = dict(columns)
+
+    for i, local in enumerate(map(attrgetter(attribute), items)):
+        if not local:
+            continue
+
+        for key, value in local.items():
+            if key in columns:
+                continue
+
+            if value_of is not None:
+                value = value_of(value)
+
+            if key not in data:
+                value_arr = np.asarray(value)
+                data[key] = np.zeros(
+                    tuple([len(items)] + list(value_arr.shape)), dtype=value_arr.dtype
+                )
+
+            data[key][i] = value
+
+    return data
+
+
+def check_column(name: str, values: np.ndarray, num_items: int) -> np.ndarray:
+    """
+    Checks that a column has one row per item
+
+    Args:
+        name: Name of the variable
+        values: Values of the variable np.array((num_items, ...))
+        num_items: Number of items
+
+    Returns:
+        The values as np.array
+    """
+    values = np.asarray(values)
+
+    if len(values.shape) == 0 or values.shape[0] != num_items:
+        raise ValueError(
+            "Variable {0} needs one row per item, expected {1} got {2}".format(
+                name, num_items, values.shape[0] if len(values.shape) > 0 else 0
+            )
+        )
+
+    return values
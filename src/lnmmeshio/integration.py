@@ -0,0 +1,140 @@
+from typing import Callable, Dict, List, Optional, Tuple, Type
+
+import numpy as np
+
+from .element.element import Element, ElementHex, ElementQuad, ElementTet, ElementTri
+
+# default number of Gauss points of the element families
+_default_numgp: Dict[Type[Element], int] = {
+    ElementTri: 3,
+    ElementQuad: 4,
+    ElementTet: 4,
+    ElementHex: 8,
+}
+
+
+def get_default_numgp(ele_type: Type[Element]) -> int:
+    """
+    Returns the default number of Gauss points of an element type
+
+    Args:
+        ele_type: Type of the element (e.g. Hex8)
+
+    Returns:
+        Number of Gauss points
+    """
+    for family, numgp in _default_numgp.items():
+        if issubclass(ele_type, family):
+            return numgp
+
+    raise NotImplementedError(
+        "Integration is not implemented for {0}".format(ele_type.ShapeName)
+    )
+
+
+def integrate_coords(
+    ele_type: Type[Element],
+    coords: np.ndarray,
+    integrand: Optional[Callable] = None,
+    numgp: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Integrates over many elements of the same type at once. The Jacobians of all elements at all
+    Gauss points are evaluated together. For volume elements, the absolute value of the
+    determinant of the Jacobian is used, for surface elements the length of the normal vector.
+
+    Args:
+        ele_type: Type of the elements (e.g. Hex8)
+        coords: np.array((num_ele, num_nodes, 3)) with the nodal coordinates of the elements
+        integrand: Vectorized function integrand(x, normals) of the coordinates of the Gauss points
+            np.array((num_ele, numgp, 3)) and, for surface elements, the unit normals
+            np.array((num_ele, numgp, 3)) (None otherwise). It returns np.array((num_ele, numgp,
+            ...)). If None, the volumes (areas) of the elements are computed.
+        numgp: Number of Gauss points (default see get_default_numgp)
+
+    Returns:
+        np.array((num_ele, ...)) with the integral over each element
+    """
+    coords = np.asarray(coords, dtype=float)
+    if len(coords.shape) != 3 or coords.shape[2] != 3:
+        raise ValueError(
+            "Expected coordinates of shape (num_ele, num_nodes, 3), got {0}".format(
+                coords.shape
+            )
+        )
+
+    if numgp is None:
+        numgp = get_default_numgp(ele_type)
+
+    xi = np.atleast_2d(ele_type.int_points(numgp))
+    weights = np.reshape(ele_type.int_weights(numgp), (-1))
+
+    # Jacobians np.array((num_ele, numgp, dim, 3)) at all Gauss points
+    jacobians = np.einsum("gin,end->egid", ele_type.shape_fcns_derivs_many(xi), coords)
+
+    normals = None
+    dim = ele_type.get_space_dim()
+    if dim == 3:
+        det = np.abs(np.linalg.det(jacobians))
+    elif dim == 2:
+        normals = np.cross(jacobians[:, :, 0], jacobians[:, :, 1])
+        det = np.linalg.norm(normals, axis=2)
+        normals = normals / det[:, :, np.newaxis]
+    else:
+        raise NotImplementedError(
+            "Integration is not implemented for {0}".format(ele_type.ShapeName)
+        )
+
+    if integrand is None:
+        values = np.ones((len(coords), len(weights)))
+    else:
+        x = np.einsum("gn,end->egd", ele_type.shape_fcns_many(xi), coords)
+        values = np.asarray(integrand(x, normals))
+        if values.shape[:2] != (len(coords), len(weights)):
+            raise ValueError(
+                "Expected one value per element and Gauss point, expected {0} got {1}".format(
+                    (len(coords), len(weights)), values.shape[:2]
+                )
+            )
+
+    return np.einsum("eg...,eg->e...", values, det * weights)
+
+
+def integrate(
+    elements: List[Element],
+    integrand: Optional[Callable] = None,
+    numgp: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Integrates over a list of elements (e.g. the surface elements of a DSURF, see
+    Discretization.get_dsurf_elements). The elements are integrated shape by shape (see
+    integrate_coords), i.e. the integrand is called once per element shape.
+
+    Args:
+        elements: List of elements
+        integrand: Vectorized integrand (see integrate_coords). If None, the volumes (areas) of
+            the elements are computed.
+        numgp: Number of Gauss points (default see get_default_numgp)
+
+    Returns:
+        Tuple of the integrals over each element np.array((num_ele, ...)) and their sum
+    """
+    groups: Dict[Type[Element], List[int]] = {}
+    for i, ele in enumerate(elements):
+        groups.setdefault(type(ele), []).append(i)
+
+    per_element: Optional[np.ndarray] = None
+    for ele_type, positions in groups.items():
+        coords = np.array(
+            [[n.coords for n in elements[i].nodes] for i in positions], dtype=float
+        )
+        result = integrate_coords(ele_type, coords, integrand, numgp)
+
+        if per_element is None:
+            per_element = np.zeros((len(elements),) + result.shape[1:])
+        per_element[positions] = result
+
+    if per_element is None:
+        per_element = np.zeros((0))
+
+    return per_element, np.sum(per_element, axis=0)
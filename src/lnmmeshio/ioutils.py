@@ -243,29 +243,48 @@ def write_comment(dest: IO, comment: str, newline: bool = True) -> None:
     dest.write("{0}{1}".format(line_comment(comment), "\n" if newline else ""))
 
 
+# number of values that are formatted and written at once into ascii EnSight files
+_ens_ascii_chunk_size = 1 << 16
+
+
 def ens_write_floats(file_handle: IO, arr: np.ndarray, binary: bool = True) -> None:
-    """reads array of length floats"""
+    """writes the array of floats in Fortran order"""
     if binary:
-        np.ravel(arr, "F").astype("<f").tofile(file_handle)
+        file_handle.write(np.ravel(arr, "F").astype("<f").data)
     else:
-        for f in np.ravel(arr, "F").astype("<f"):
-            ens_write_float(file_handle, f, binary)
+        values = np.ravel(arr, "F").astype("<f")
+        for start in range(0, len(values), _ens_ascii_chunk_size):
+            chunk = values[start : start + _ens_ascii_chunk_size]
+
+            # %12.5e only differs from ens_write_float for -0.0, nan and inf
+            if np.all(np.isfinite(chunk)) and not np.any(
+                np.signbit(chunk) & (chunk == 0)
+            ):
+                file_handle.write(("%12.5e\n" * len(chunk)) % tuple(chunk.tolist()))
+            else:
+                for f in chunk:
+                    ens_write_float(file_handle, f, binary)
 
 
 def ens_write_ints(file_handle: IO, arr: np.ndarray, binary: bool = True) -> None:
     if binary:
-        np.ravel(arr).astype("<i").tofile(file_handle)
+        file_handle.write(np.ravel(arr).astype("<i").data)
     else:
         if len(arr.shape) == 2:
-            for i in range(arr.shape[0]):
-                for j in range(arr.shape[1]):
-                    ens_write_int(
-                        file_handle, int(arr[i, j]), binary=binary, newline=False
-                    )
-                ens_write_string(file_handle, "", False)
+            # one row per line
+            values = np.asarray(arr).astype(np.int64)
+            num_rows = max(1, _ens_ascii_chunk_size // max(1, values.shape[1]))
+            row_format = "%10d" * values.shape[1] + "\n"
         else:
-            for i in np.ravel(arr, "F").astype("<i"):
-                ens_write_int(file_handle, i, binary=binary)
+            values = np.ravel(arr, "F").astype("<i")
+            num_rows = _ens_ascii_chunk_size
+            row_format = "%10d\n"
+
+        for start in range(0, len(values), num_rows):
+            chunk = values[start : start + num_rows]
+            file_handle.write(
+                (row_format * len(chunk)) % tuple(np.ravel(chunk).tolist())
+            )
 
 
 def ens_write_int(
@@ -300,3 +319,66 @@ def ens_write_string(file_handle: IO, s: str, binary: bool = True) -> None:
         ws = s + "\n"
 
     file_handle.write(ws)
+
+
+def ens_read_string(buffer: np.ndarray, pos: int) -> Tuple[str, int]:
+    """
+    Reads an 80 character string of a binary EnSight file
+
+    Args:
+        buffer: np.array of bytes (e.g. np.memmap of the file)
+        pos: Position of the string in bytes
+
+    Returns:
+        Tuple of the string (without trailing null characters and whitespaces) and the position
+        after the string. At the end of the buffer, an empty string is returned.
+    """
+    if pos + 80 > len(buffer):
+        return "", len(buffer)
+
+    return (
+        buffer[pos : pos + 80]
+        .tobytes()
+        .split(b"\0", 1)[0]
+        .decode("ascii", errors="replace")
+        .strip(),
+        pos + 80,
+    )
+
+
+def ens_read_ints(buffer: np.ndarray, pos: int, count: int) -> Tuple[np.ndarray, int]:
+    """
+    Reads count integers of a binary EnSight file without copying
+
+    Args:
+        buffer: np.array of bytes (e.g. np.memmap of the file)
+        pos: Position of the first integer in bytes
+        count: Number of integers
+
+    Returns:
+        Tuple of the integers as np.array((count)) and the position after the integers
+    """
+    end = pos + 4 * count
+    if end > len(buffer):
+        raise RuntimeError("Unexpected end of the EnSight file")
+
+    return buffer[pos:end].view("<i4"), end
+
+
+def ens_read_floats(buffer: np.ndarray, pos: int, count: int) -> Tuple[np.ndarray, int]:
+    """
+    Reads count floats of a binary EnSight file without copying
+
+    Args:
+        buffer: np.array of bytes (e.g. np.memmap of the file)
+        pos: Position of the first float in bytes
+        count: Number of floats
+
+    Returns:
+        Tuple of the floats as np.array((count)) and the position after the floats
+    """
+    end = pos + 4 * count
+    if end > len(buffer):
+        raise RuntimeError("Unexpected end of the EnSight file")
+
+    return buffer[pos:end].view("<f4"), end
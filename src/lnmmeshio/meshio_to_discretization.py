@@ -2,22 +2,24 @@
 # This is the interface between the meshio package and our Discretization description
 # May not work perfectly
 #
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import meshio
 import numpy as np
-from tqdm import tqdm
 
 from .discretization import Discretization, Node
+from .element import factory_many, get_element_type
+from .element.element import Element
+from .element.element_container import ElementContainer
 from .element.line2 import Line2
 from .element.line3 import Line3
-from .element.parse_element import create_element
 from .element.quad4 import Quad4
 from .element.tri3 import Tri3
 from .element.tri6 import Tri6
 from .nodeset import (
     LineNodeset,
     LineNodesetBuilder,
+    Nodeset,
     PointNodeset,
     PointNodesetBuilder,
     SurfaceNodeset,
@@ -40,6 +42,7 @@ cell_nodes = {
     "hexahedron27": 27,
     "wedge": 6,
     "quad": 4,
+    "quad8": 8,
     "quad9": 9,
     "vertex": 1,
 }
@@ -58,6 +61,7 @@ cell_disc_eles = {
     "hexahedron27": "SOLID",
     "wedge": "UNKNOWN",
     "quad": "UNKNOWN",
+    "quad8": "UNKNOWN",
     "quad9": "UNKNOWN",
 }
 
@@ -75,11 +79,23 @@ cell_disc_shape = {
     "hexahedron27": "HEX27",
     "wedge": "WEDGE6",
     "quad": "QUAD4",
+    "quad8": "QUAD8",
     "quad9": "QUAD9",
 }
 
 _cell_data_id_names = ["medit:ref", "gmsh:geometrical"]
 
+# name of the cell data with the nodeset ids of the exported nodeset cells
+_nodeset_id_name = "nodeset_id"
+
+# prefix of the point set names of the nodesets
+_nodeset_point_set_prefix = {
+    "pointnodesets": "point",
+    "linenodesets": "line",
+    "surfacenodesets": "surface",
+    "volumenodesets": "volume",
+}
+
 # invert cell_disc_shape
 disc_shape_cell = {v: k for k, v in cell_disc_shape.items()}
 
@@ -97,6 +113,7 @@ cell_to_dim = {
     "hexahedron27": 3,
     "wedge": 3,
     "quad": 2,
+    "quad8": 2,
     "quad9": 2,
 }
 
@@ -105,7 +122,7 @@ cell_to_dim = {
 ele_node_order_vtk2baci = {
     "VERTEX1": list(range(0, 1)),
     "LINE2": list(range(0, 2)),
-    "LINE3": list(range(0, 2)),
+    "LINE3": list(range(0, 3)),
     "TRI3": list(range(0, 3)),
     "TRI6": list(range(0, 6)),
     "TET4": list(range(0, 4)),
@@ -147,27 +164,34 @@ ele_node_order_vtk2baci = {
         9,
         10,
         11,
-        12,
-        13,
-        14,
-        15,
         16,
         17,
         18,
         19,
-        21,
-        25,
+        12,
+        13,
+        14,
+        15,
         24,
-        26,
-        23,
         22,
+        21,
+        23,
         20,
+        25,
+        26,
     ],
     "WEDGE6": list(range(0, 6)),
     "QUAD4": list(range(0, 4)),
+    "QUAD8": list(range(0, 8)),
     "QUAD9": list(range(0, 9)),
 }
 
+# inverse of ele_node_order_vtk2baci to reorder the nodes from baci to vtk ordering
+ele_node_order_baci2vtk = {
+    shape: np.argsort(order).tolist()
+    for shape, order in ele_node_order_vtk2baci.items()
+}
+
 
 def mesh2Discretization(mesh: meshio.Mesh) -> Discretization:
     # create empty discretization
@@ -177,14 +201,14 @@ def mesh2Discretization(mesh: meshio.Mesh) -> Discretization:
     # mesh.cells -> disc.elements[Element.FieldTypeStructure]
     # node_sets -> are stored in disc.nodes
 
-    # create Nodes from points
-    for i, coord in tqdm(enumerate(mesh.points), desc="Create nodes"):
-        n = Node(coord)
-
-        for key, v in mesh.point_data.items():
-            n.data[key] = v[i]
+    # create Nodes from points (the coordinates are views into the points)
+    points = np.asarray(mesh.points, dtype=float)
+    if points.shape[1] < 3:
+        points = np.hstack((points, np.zeros((points.shape[0], 3 - points.shape[1]))))
+    disc.nodes = Node.from_coords(points)
 
-        disc.nodes.append(n)
+    for key, v in mesh.point_data.items():
+        disc.set_node_data(key, v)
 
     # get the maximum element dimension, which is the dimension of the mesh
     maxdim = max([cell_to_dim[cell_block.type] for cell_block in mesh.cells])
@@ -196,102 +220,105 @@ def mesh2Discretization(mesh: meshio.Mesh) -> Discretization:
     surfnsbuilder = SurfaceNodesetBuilder()
     volumensbuilder = VolumeNodesetBuilder()
 
+    # cell groups that are converted into elements
+    element_groups: List[int] = []
+    materials: List[np.ndarray] = []
+
+    # nodeset cells exported by discretization2mesh are only used if the point sets got lost (e.g.
+    # in file formats that do not support point sets)
+    use_nodeset_cells = len(mesh.point_sets) == 0 and _nodeset_id_name in mesh.cell_data
+
     for cellgroupid, cellblock in enumerate(mesh.cells):
         if cellblock.type not in cell_nodes:
             raise Exception(
                 "The cell type {0} is currently not implemented".format(cellblock.type)
             )
 
-        for cellid, cell in enumerate(cellblock.data):
-            # read nodes that belong to the cells
-            nodes = []
-
-            # in case of a vertex, cell is just an integer
-            cell = np.array(cell).reshape((-1))
-
-            for nodeids in cell:
-                nodes.append(disc.nodes[nodeids])
-
-            # cells with the same dimension as the mesh dimensions are normal cells
-            # cells with a lower dimension are treated as surface, line or node
-            # definitions
-            element_dim = cell_to_dim[cellblock.type]
-            if maxdim == element_dim:
-                # this is a normal element
-                ele = create_element(
-                    cell_disc_eles[cellblock.type],
-                    cell_disc_shape[cellblock.type],
+        # in case of a vertex, a cell is just an integer
+        cells = np.asarray(cellblock.data).reshape((len(cellblock.data), -1))
+
+        # ids of the cells (material or nodeset id) from cell data
+        ids: Optional[np.ndarray] = _get_ids_from_cell_data(mesh.cell_data, cellgroupid)
+
+        # cells with the same dimension as the mesh dimensions are normal cells
+        # cells with a lower dimension are treated as surface, line or node
+        # definitions
+        element_dim = cell_to_dim[cellblock.type]
+        if maxdim == element_dim:
+            # this is a block of normal elements
+            shape = cell_disc_shape[cellblock.type]
+            disc.elements.structure.extend(
+                factory_many(
+                    shape,
                     # also need to reorder nodes in a few element types
-                    [
-                        nodes[i]
-                        for i in ele_node_order_vtk2baci[
-                            cell_disc_shape[cellblock.type]
-                        ]
-                    ],
-                )
-                disc.elements.structure.append(ele)
-
-                # extract material info from cell data
-                matid: Optional[int] = _get_material_from_cell_data(
-                    mesh.cell_data, cellgroupid, cellid
+                    cells[:, ele_node_order_vtk2baci[shape]],
+                    disc.nodes,
+                    type=cell_disc_eles[cellblock.type],
+                    throw_if_unknown=False,
                 )
-                if matid == None:
-                    matid = 1
-                ele.options["MAT"] = matid
-
-                # extract cell data
-                for key, data in mesh.cell_data.items():
-                    ele.data[key] = data[cellgroupid][cellid]
-
-                # explicitly append the cell group id (block id) to the cell data
-                ele.data["GROUP_ID"] = cellgroupid
-
-                # create surface-nodesets
-                if maxdim == 2 and len(mesh.cell_data) > 0:
-                    nsid: Optional[int] = _get_nodesetid_from_cell_data(
-                        mesh.cell_data, cellgroupid, cellid
-                    )
+            )
+            element_groups.append(cellgroupid)
 
-                    if nsid is not None:
-                        for node in nodes:
-                            surfnsbuilder.add(node, nsid)
+            # extract material info from cell data
+            materials.append(
+                ids if ids is not None else np.ones((len(cells)), dtype=int)
+            )
 
-            else:
-                # this is a lower-dimensional element
-                # treat as surface-, line- or point-nodeset definition
+            # create surface-nodesets
+            if maxdim == 2 and ids is not None:
+                surfnsbuilder.add_groups(disc.nodes, cells, ids)
 
-                # extract nodeset info from cell data
-                nsid: Optional[int] = _get_nodesetid_from_cell_data(
-                    mesh.cell_data, cellgroupid, cellid
+        else:
+            if ids is None and use_nodeset_cells:
+                ids = np.asarray(mesh.cell_data[_nodeset_id_name][cellgroupid]).astype(
+                    int
                 )
 
-                if nsid is not None:
-                    for node in nodes:
-                        if element_dim == 0:
-                            pointnsbuilder.add(node, nsid)
-                        elif element_dim == 1:
-                            linensbuilder.add(node, nsid)
-                        elif element_dim == 2:
-                            surfnsbuilder.add(node, nsid)
+            if ids is None:
+                continue
+
+            # this is a block of lower-dimensional elements
+            # treat as surface-, line- or point-nodeset definition
+            if element_dim == 0:
+                pointnsbuilder.add_groups(disc.nodes, cells, ids)
+            elif element_dim == 1:
+                linensbuilder.add_groups(disc.nodes, cells, ids)
+            elif element_dim == 2:
+                surfnsbuilder.add_groups(disc.nodes, cells, ids)
+
+    if len(element_groups) > 0:
+        # assign the materials
+        materials = np.concatenate(materials)
+        for matid in np.unique(materials):
+            disc.set_element_option("MAT", int(matid), materials == matid)
+
+        # extract cell data
+        for key, data in mesh.cell_data.items():
+            if key == _nodeset_id_name:
+                continue
+
+            disc.set_element_data(
+                key, np.concatenate([np.asarray(data[i]) for i in element_groups])
+            )
+
+        # explicitly append the cell group id (block id) to the cell data
+        disc.set_element_data(
+            "GROUP_ID",
+            np.concatenate(
+                [np.full(len(mesh.cells[i].data), i) for i in element_groups]
+            ),
+        )
 
     # go through nodesets
     for name, nodes in mesh.point_sets.items():
         if "volume" in name:
-            nsid = volumensbuilder.get_unused_id()
-            for n in nodes:
-                volumensbuilder.add(disc.nodes[n], nsid)
+            volumensbuilder.add_many(disc.nodes, nodes, volumensbuilder.get_unused_id())
         if "surface" in name:
-            nsid = surfnsbuilder.get_unused_id()
-            for n in nodes:
-                surfnsbuilder.add(disc.nodes[n], nsid)
+            surfnsbuilder.add_many(disc.nodes, nodes, surfnsbuilder.get_unused_id())
         elif "line" in name:
-            nsid = linensbuilder.get_unused_id()
-            for n in nodes:
-                linensbuilder.add(disc.nodes[n], nsid)
+            linensbuilder.add_many(disc.nodes, nodes, linensbuilder.get_unused_id())
         elif "point" in name:
-            nsid = pointnsbuilder.get_unused_id()
-            for n in nodes:
-                pointnsbuilder.add(disc.nodes[n], nsid)
+            pointnsbuilder.add_many(disc.nodes, nodes, pointnsbuilder.get_unused_id())
 
     disc.volumenodesets = volumensbuilder.finalize()
     disc.pointnodesets = pointnsbuilder.finalize()
@@ -302,109 +329,330 @@ def mesh2Discretization(mesh: meshio.Mesh) -> Discretization:
     return disc
 
 
-def discretization2mesh(dis: Discretization) -> meshio.Mesh:
+def discretization2mesh(
+    dis: Discretization, keep_order: bool = True, nodeset_cells: bool = False
+) -> meshio.Mesh:
+    """
+    Converts the discretization into a meshio mesh. By default, the cells are in the same order as
+    the elements, i.e. a new cell block starts whenever the shape of consecutive elements changes.
+    With keep_order=False, the elements of all fields are grouped by their shape, i.e. there is one
+    cell block per shape (within a block, the elements keep their order).
+
+    All nodesets are exported as point sets named point1, line1, surface1, volume1, ... in the
+    order of the nodesets.
+
+    Args:
+        dis: Discretization
+        keep_order: If false, the cells are grouped into one cell block per shape, which avoids many
+            small cell blocks for meshes with interleaved shapes
+        nodeset_cells: If true, the point, line and surface nodesets of a lower dimension than the
+            elements are additionally exported as vertex, line and surface cells (after the
+            element cells). The cell data nodeset_id contains the (one based) id of the nodeset and
+            0 for the element cells. This keeps the nodesets in file formats without point sets.
+
+    Returns:
+        meshio mesh
+    """
     dis.compute_ids(zero_based=True)
 
     points = dis.get_node_coords()
 
-    point_data = {}
-
-    for i, n in enumerate(dis.nodes):
-        for k, v in n.data.items():
-            if k not in point_data:
-                point_data[k] = np.zeros(
-                    tuple([len(dis.nodes)] + list(np.array(v).shape))
-                )
-
-            point_data[k][i] = v
-
-    cells = []
+    point_data = dis.get_node_data()
+
+    # group the elements of all fields by their shape
+    num_eles, field_offsets, shape_groups = _group_elements_by_shape(dis)
+
+    # cell blocks with the positions of their elements (over all fields)
+    blocks: List[Tuple[str, np.ndarray, np.ndarray]] = []
+    for shape, (positions, node_ids) in shape_groups.items():
+        if not keep_order:
+            blocks.append((disc_shape_cell[shape], node_ids, positions))
+            continue
+
+        # split into runs of consecutive elements
+        split = np.flatnonzero(np.diff(positions) != 1) + 1
+        for run_positions, run_node_ids in zip(
+            np.split(positions, split), np.split(node_ids, split)
+        ):
+            blocks.append((disc_shape_cell[shape], run_node_ids, run_positions))
+
+    if keep_order:
+        blocks.sort(key=lambda block: block[2][0])
+
+    # point sets of all nodesets
+    point_sets: Dict[str, np.ndarray] = {}
+    for attribute, prefix in _nodeset_point_set_prefix.items():
+        for i, ns in enumerate(getattr(dis, attribute), start=1):
+            point_sets["{0}{1}".format(prefix, i)] = _get_nodeset_node_ids(ns)
+
+    # cells of the nodesets with their nodeset ids
+    ns_blocks: List[Tuple[str, np.ndarray, np.ndarray]] = []
+    if nodeset_cells:
+        maxdim = max(
+            [get_element_type(shape).get_space_dim() for shape in shape_groups.keys()],
+            default=0,
+        )
+        for dim, nodesets in enumerate(
+            [dis.pointnodesets, dis.linenodesets, dis.surfacenodesets]
+        ):
+            if dim < maxdim:
+                ns_blocks.extend(_get_nodeset_cells(dis, nodesets, dim))
+
+    cells = [(celltype, node_ids) for celltype, node_ids, _ in blocks] + [
+        (celltype, node_ids) for celltype, node_ids, _ in ns_blocks
+    ]
     cell_data = {}
 
-    id_to_index = {}
-
-    # store cells
-    for eletype in dis.elements.values():
-        for ele in eletype:
-            celltype = disc_shape_cell[ele.shape]
+    # store the material
+    materials = _get_materials(dis, field_offsets, num_eles)
+    if materials is not None:
+        cell_data["material"] = [materials[positions] for _, _, positions in blocks] + [
+            np.zeros((len(ids)), dtype=materials.dtype) for _, _, ids in ns_blocks
+        ]
+
+    # scatter the element data into the cell blocks
+    for variable_name, values in _get_element_data(
+        dis, field_offsets, num_eles
+    ).items():
+        cell_data[variable_name] = [values[positions] for _, _, positions in blocks] + [
+            np.zeros(tuple([len(ids)] + list(values.shape[1:])), dtype=values.dtype)
+            for _, _, ids in ns_blocks
+        ]
+
+    if nodeset_cells:
+        cell_data[_nodeset_id_name] = [
+            np.zeros((len(positions)), dtype=int) for _, _, positions in blocks
+        ] + [ids for _, _, ids in ns_blocks]
 
-            newgroup = False
+    mesh: meshio.Mesh = meshio.Mesh(
+        points,
+        cells,
+        cell_data=cell_data,
+        point_data=point_data,
+        point_sets=point_sets,
+    )
 
-            if len(cells) == 0 or cells[-1][0] != celltype:
-                cell_nodes = []
-                cells.append((celltype, cell_nodes))
-                newgroup = True
-            else:
-                cell_nodes = cells[-1][1]
+    dis.reset()
 
-            cell_nodes.append([n.id for n in ele.nodes])
-            id_to_index[ele.id] = (len(cells) - 1, len(cell_nodes) - 1)
+    return mesh
 
-    # go again through the elements to store element data
-    for eletype in dis.elements.values():
-        for ele in eletype:
-            block_id, cell_id = id_to_index[ele.id]
 
-            if "MAT" in ele.options:
-                if "material" not in cell_data:
-                    cell_data["material"] = _create_cell_variable(
-                        cells, tuple([1]), int
-                    )
-
-                cell_data["material"][block_id][cell_id] = int(
-                    ele.options["MAT"][0]
-                    if _isiter(ele.options["MAT"])
-                    else ele.options["MAT"]
+def _group_elements_by_shape(
+    dis: Discretization,
+) -> Tuple[int, Dict[str, int], Dict[str, Tuple[np.ndarray, np.ndarray]]]:
+    """
+    Groups the elements of all fields by their shape. The (zero based) ids need to be computed
+    before.
+
+    Returns:
+        Tuple of the total number of elements, the offset of each field and a dict with the shape
+        as key and the positions of the elements (over all fields) and their node ids in vtk
+        ordering as value
+    """
+    num_eles = 0
+    field_offsets: Dict[str, int] = {}
+    shape_positions: Dict[str, List[np.ndarray]] = {}
+    shape_node_ids: Dict[str, List[np.ndarray]] = {}
+    for fieldtype, eletype in dis.elements.items():
+        field_offsets[fieldtype] = num_eles
+        for shape, (positions, node_ids) in ElementContainer.group_by_shape(
+            eletype
+        ).items():
+            shape_positions.setdefault(shape, []).append(positions + num_eles)
+            shape_node_ids.setdefault(shape, []).append(node_ids)
+        num_eles += len(eletype)
+
+    shape_groups: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+    for shape in shape_positions.keys():
+        node_ids = (
+            shape_node_ids[shape][0]
+            if len(shape_node_ids[shape]) == 1
+            else np.concatenate(shape_node_ids[shape])
+        )
+
+        if shape in ele_node_order_baci2vtk:
+            node_ids = node_ids[:, ele_node_order_baci2vtk[shape]]
+
+        shape_groups[shape] = (np.concatenate(shape_positions[shape]), node_ids)
+
+    return num_eles, field_offsets, shape_groups
+
+
+def _get_materials(
+    dis: Discretization, field_offsets: Dict[str, int], num_eles: int
+) -> Optional[np.ndarray]:
+    """
+    Returns the material id of all elements (over all fields) or None, if no element has a
+    material. Elements without a material get the id 0.
+    """
+    materials = np.zeros((num_eles), dtype=int)
+    has_material = np.zeros((num_eles), dtype=bool)
+    for fieldtype, eletype in dis.elements.items():
+        dis.compress_element_options(fieldtype)
+        column = dis.element_options[fieldtype].get("MAT", None)
+        if column is None:
+            continue
+
+        # material id of each category (the last entry is for elements without material)
+        matids = np.array(
+            [
+                int(category[0] if _isiter(category) else category)
+                for category in column.categories
+            ]
+            + [0],
+            dtype=int,
+        )
+
+        field_slice = slice(
+            field_offsets[fieldtype], field_offsets[fieldtype] + len(eletype)
+        )
+        materials[field_slice] = matids[column.codes]
+        has_material[field_slice] = column.codes >= 0
+
+    if not np.any(has_material):
+        return None
+
+    return materials
+
+
+def _get_element_data(
+    dis: Discretization, field_offsets: Dict[str, int], num_eles: int
+) -> Dict[str, np.ndarray]:
+    """
+    Returns the element data of all elements (over all fields). Each variable is flattened to
+    np.array((num_eles, num_components)) or np.array((num_eles)) for scalar variables.
+    """
+    element_data: Dict[str, np.ndarray] = {}
+    for fieldtype, eletype in dis.elements.items():
+        for variable_name, values in dis.get_element_data(fieldtype).items():
+            values = values.reshape((values.shape[0], -1))
+            if values.shape[1] == 1:
+                values = values.reshape((-1))
+
+            if variable_name not in element_data:
+                element_data[variable_name] = np.zeros(
+                    tuple([num_eles] + list(values.shape[1:])), dtype=values.dtype
                 )
 
-            for variable_name, value in ele.data.items():
-                value_reshaped = np.array(value).reshape((-1))
-
-                if variable_name not in cell_data:
-                    cell_data[variable_name] = _create_cell_variable(
-                        cells, value_reshaped.shape, value_reshaped.dtype
+            element_data[variable_name][
+                field_offsets[fieldtype] : field_offsets[fieldtype] + len(eletype)
+            ] = values
+
+    return element_data
+
+
+def _get_nodeset_node_ids(ns: Nodeset) -> np.ndarray:
+    """
+    Returns the sorted (zero based) node ids of the nodeset. The ids need to be computed before.
+    """
+    return np.sort(np.fromiter((n.id for n in ns), dtype=int, count=len(ns)))
+
+
+def _get_nodeset_cells(
+    dis: Discretization, nodesets: Sequence[Nodeset], dim: int
+) -> List[Tuple[str, np.ndarray, np.ndarray]]:
+    """
+    Returns the cells of the nodesets of dimension dim (0: vertices, 1: lines, 2: surfaces). The
+    cells are all vertices, edges or faces of the elements where all nodes are within the nodeset.
+    The (zero based) ids need to be computed before.
+
+    Returns:
+        List of cell blocks with the cell type, the node ids in vtk ordering and the (one based)
+        nodeset id of each cell
+    """
+    if dim == 0:
+        return [
+            (
+                "vertex",
+                _get_nodeset_node_ids(ns).reshape((-1, 1)),
+                np.full((len(ns)), nsid, dtype=int),
+            )
+            for nsid, ns in enumerate(nodesets, start=1)
+            if len(ns) > 0
+        ]
+
+    # node ids of the cells and their nodeset ids for each shape
+    shape_node_ids: Dict[str, List[np.ndarray]] = {}
+    shape_ids: Dict[str, List[np.ndarray]] = {}
+
+    masks = []
+    for ns in nodesets:
+        mask = np.zeros((len(dis.nodes)), dtype=bool)
+        mask[_get_nodeset_node_ids(ns)] = True
+        masks.append(mask)
+
+    for elements in dis.elements.values():
+        for positions, node_ids in ElementContainer.group_by_shape(elements).values():
+            entities = _get_local_entities(elements[positions[0]], dim)
+
+            for nsid, mask in enumerate(masks, start=1):
+                node_mask = mask[node_ids]
+                for shape, local_ids in entities:
+                    selected = np.all(node_mask[:, local_ids], axis=1)
+                    if not np.any(selected):
+                        continue
+
+                    shape_node_ids.setdefault(shape, []).append(
+                        node_ids[selected][:, local_ids]
+                    )
+                    shape_ids.setdefault(shape, []).append(
+                        np.full((np.count_nonzero(selected)), nsid, dtype=int)
                     )
-                cell_data[variable_name][block_id][cell_id] = value_reshaped
-
-    mesh: meshio.Mesh = meshio.Mesh(
-        points, cells, cell_data=cell_data, point_data=point_data
-    )
-
-    dis.reset()
 
-    return mesh
+    blocks: List[Tuple[str, np.ndarray, np.ndarray]] = []
+    for shape in shape_node_ids.keys():
+        node_ids = np.concatenate(shape_node_ids[shape])
+        ids = np.concatenate(shape_ids[shape])
+
+        # remove cells that are shared by multiple elements
+        _, unique = np.unique(
+            np.hstack((np.sort(node_ids, axis=1), ids[:, np.newaxis])),
+            axis=0,
+            return_index=True,
+        )
+        unique = np.sort(unique)
+
+        blocks.append(
+            (
+                disc_shape_cell[shape],
+                node_ids[unique][:, ele_node_order_baci2vtk[shape]],
+                ids[unique],
+            )
+        )
 
+    return blocks
 
-def _create_cell_variable(
-    cells: List[Tuple[str, List[int]]], shape: Tuple[int], dtype
-) -> List[np.ndarray]:
-    data = []
 
-    for block in cells:
-        new_shape = tuple([len(block[1])] + list(shape))
-        if len(shape) == 1 and shape[0] == 1:
-            new_shape = tuple([len(block[1])])
-        data.append(np.zeros(new_shape, dtype=dtype))
+def _get_local_entities(ele: Element, dim: int) -> List[Tuple[str, List[int]]]:
+    """
+    Returns the shape and the local node ids of all edges (dim=1) or faces (dim=2) of the element.
+    If the element has the dimension dim, the element itself is returned.
+    """
+    ele_dim = ele.get_space_dim()
+    if ele_dim < dim:
+        return []
 
-    return data
+    if ele_dim == dim:
+        return [(ele.shape, list(range(len(ele.nodes))))]
 
+    local_ids = {id(n): i for i, n in enumerate(ele.nodes)}
 
-def _get_material_from_cell_data(
-    celldata: Dict[str, List[List[Any]]], cellgroupid: int, cellid: int
-) -> Optional[int]:
-    for name in _cell_data_id_names:
-        if name in celldata:
-            return int(celldata[name][cellgroupid][cellid])
+    # edges of 3D elements are the edges of their faces
+    entities: Dict[Tuple[int, ...], Tuple[str, List[int]]] = {}
+    for sub in ele.get_faces() if ele_dim == 3 else ele.get_edges():
+        for shape, sub_local_ids in _get_local_entities(sub, dim):
+            ids = [local_ids[id(sub.nodes[i])] for i in sub_local_ids]
+            entities.setdefault(tuple(sorted(ids)), (shape, ids))
 
-    return None
+    return list(entities.values())
 
 
-def _get_nodesetid_from_cell_data(
-    celldata: Dict[str, List[List[Any]]], cellgroupid: int, cellid: int
-) -> Optional[int]:
+def _get_ids_from_cell_data(
+    celldata: Dict[str, List[List[Any]]], cellgroupid: int
+) -> Optional[np.ndarray]:
     for name in _cell_data_id_names:
         if name in celldata:
-            return int(celldata[name][cellgroupid][cellid])
+            return np.asarray(celldata[name][cellgroupid]).reshape((-1)).astype(int)
 
     return None
 
@@ -9,20 +9,39 @@ I/O for the STL format, cf.
 
 import io
 import logging
-import struct
 
 import numpy
 from meshio import Mesh
 
+from .spatial import merge_points
 
-def read(filename):
-    """Reads a Gmsh msh file."""
+# packed record of a facet in a binary stl file: normal, vertices and the attribute byte count
+# (Mimics stores the material there)
+facet_dtype = numpy.dtype(
+    [("normal", "<f4", (3,)), ("points", "<f4", (3, 3)), ("attr", "<u2")]
+)
+
+
+def read(filename, merge_tolerance=None):
+    """
+    Reads a binary Mimics stl file.
+
+    Args:
+        filename: Path to the stl file
+        merge_tolerance: Vertices with a distance of at most merge_tolerance to the first vertex
+            of a point are merged into this point (None or 0 merges only vertices with exactly the
+            same coordinates). Chains of close vertices are not merged transitively, see
+            spatial.merge_points.
+
+    Returns:
+        Mesh with one triangle cell block and the material as cell data medit:ref
+    """
     with open(filename, "rb") as f:
-        out = read_buffer(f)
+        out = read_buffer(f, merge_tolerance=merge_tolerance)
     return out
 
 
-def read_buffer(f):
+def read_buffer(f, merge_tolerance=None):
     data = numpy.frombuffer(f.read(5), dtype=numpy.uint8)
     if "".join([chr(item) for item in data]) == "solid":
         raise RuntimeError(
@@ -31,42 +50,52 @@ def read_buffer(f):
 
     # binary: read and discard 75 more bytes
     f.read(75)
-    return _read_binary(f)
-
-
-def data_from_facets(facets):
-    # Now, all facets contain the point coordinate. Try to identify individual
-    # points and build the data arrays.
+    return _read_binary(f, merge_tolerance=merge_tolerance)
+
+
+def data_from_facets(facets, merge_tolerance=None):
+    """
+    Identifies the individual points of the facets. The points are in the order of their first
+    appearance and each merged point has the coordinates of its first vertex. The triangles are
+    kept (even if merged vertices make them degenerated), so the cell data needs no remapping.
+
+    Args:
+        facets: Vertex coordinates np.array((num_facets, 3, 3))
+        merge_tolerance: Vertices with a distance of at most merge_tolerance to the first vertex
+            of a point are merged into this point (None or 0 merges only vertices with exactly the
+            same coordinates). Chains of close vertices are not merged transitively, see
+            spatial.merge_points.
+
+    Returns:
+        Tuple of the points np.array((num_points, 3)) and the triangle cells. The cells are the
+        mapping of the vertices of the facets to the points.
+    """
     pts = numpy.concatenate(facets)
 
-    # TODO equip `unique()` with a tolerance
-    # Use return_index so we can use sort on `idx` such that the order is
-    # preserved; see <https://stackoverflow.com/a/15637512/353337>.
-    _, idx, inv = numpy.unique(pts, axis=0, return_index=True, return_inverse=True)
-    k = numpy.argsort(idx)
-    points = pts[idx[k]]
-    inv_k = numpy.argsort(k)
-    cells = [("triangle", inv_k[inv].reshape(-1, 3))]
-    return points, cells
+    kept, inverse = merge_points(
+        pts, merge_tolerance if merge_tolerance is not None else 0.0
+    )
+    cells = [("triangle", inverse.reshape(-1, 3))]
+    return pts[kept], cells
 
 
-def _read_binary(f):
+def _read_binary(f, merge_tolerance=None):
     # read the first uint32 byte to get the number of triangles
     data = numpy.frombuffer(f.read(4), dtype=numpy.uint32)
-    num_triangles = data[0]
+    num_triangles = int(data[0])
 
-    facets = []
-    facet_data = []
-    for _ in range(num_triangles):
-        # discard the normal
-        f.read(12)
-        facets.append(numpy.frombuffer(f.read(36), dtype=numpy.float32).reshape(-1, 3))
-        # discard the attribute byte count
-        facet_data.append(int(struct.unpack("<h", f.read(2))[0]))
+    # read all facets at once, the normals are discarded
+    buffer = f.read(num_triangles * facet_dtype.itemsize)
+    if len(buffer) != num_triangles * facet_dtype.itemsize:
+        raise RuntimeError(
+            "The stl file is truncated, expected {0} triangles".format(num_triangles)
+        )
+    facets = numpy.frombuffer(buffer, dtype=facet_dtype, count=num_triangles)
 
-    points, cells = data_from_facets(numpy.array(facets))
+    points, cells = data_from_facets(facets["points"], merge_tolerance=merge_tolerance)
 
-    cell_data = {"medit:ref": [numpy.array(facet_data)]}
+    # the attribute is interpreted as signed short
+    cell_data = {"medit:ref": [facets["attr"].astype(numpy.int16).astype(int)]}
     return Mesh(points, cells, cell_data=cell_data)
 
 
@@ -124,10 +153,13 @@ def _write_binary(filename, points, cells, cell_data=None):
         byte_io.write(b" " * (80 - byte_io.getbuffer().nbytes))
 
         fh.write(byte_io.getbuffer().tobytes())
-        fh.write(numpy.uint32(len(cells[0].data)))
-        for pt, normal, attr in zip(pts, normals, attrs):
-            fh.write(normal.astype(numpy.float32))
-            fh.write(pt.astype(numpy.float32))
-            fh.write(attr)
+        fh.write(numpy.uint32(len(pts)))
+
+        # assemble all facet records and write them at once
+        facets = numpy.empty((len(pts)), dtype=facet_dtype)
+        facets["normal"] = normals
+        facets["points"] = pts
+        facets["attr"] = attrs
+        facets.tofile(fh)
 
     return
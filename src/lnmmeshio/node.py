@@ -1,9 +1,9 @@
-import io
-from typing import IO, TYPE_CHECKING, Any, Dict, List, Optional
+from typing import IO, TYPE_CHECKING, Any, Dict, List, Mapping, Optional
 
 import numpy as np
 
-from .fiber import Fiber
+from .fiber import Fiber, FiberView
+from .fielddata import ColumnTable, DataView
 
 if TYPE_CHECKING:
     from .nodeset import PointNodeset, LineNodeset, SurfaceNodeset, VolumeNodeset
@@ -14,6 +14,17 @@ class Node:
     Class that holds all information of nodes like coords, fibers, nodesets (and additional data)
     """
 
+    # table of the columnwise stored variables and the row of the node (see ColumnTable)
+    _table: Optional[ColumnTable] = None
+    _row: int = 0
+
+    # own coordinates of the node (None if the coordinates are a row of the buffer of the table)
+    _coords: Optional[np.ndarray] = None
+
+    # locally stored fibers and data (None if there are none)
+    _fibers: Optional[Dict[str, Fiber]] = None
+    _data: Optional[Dict[str, Any]] = None
+
     def __init__(self, coords: np.ndarray = np.zeros((3))):
         """
         Initialize node at the coordinades coords
@@ -22,14 +33,79 @@ class Node:
             coords: np.array((3)) Coordinates of the node
         """
         self.id: Optional[int] = None
-        self.coords: np.ndarray = coords
-        self.fibers: Dict[str, Fiber] = {}
+        self.coords = coords
 
         self.pointnodesets: List[PointNodeset] = []
         self.linenodesets: List[LineNodeset] = []
         self.surfacenodesets: List[SurfaceNodeset] = []
         self.volumenodesets: List[VolumeNodeset] = []
-        self.data: Dict[str, Any] = {}
+
+    @property
+    def coords(self) -> np.ndarray:
+        """
+        Coordinates of the node np.array((3))
+        """
+        coords = self._coords
+        if coords is None and self._table is not None:
+            return self._table.coords[self._row]
+
+        return coords
+
+    @coords.setter
+    def coords(self, coords: np.ndarray) -> None:
+        table = self._table
+        if table is not None and table.coords is not None:
+            table.coords_complete = False
+
+        self._coords = coords
+
+    @property
+    def fibers(self) -> FiberView:
+        """
+        Fibers of the node (fiber type as key, Fiber as value)
+        """
+        return FiberView(self)
+
+    @fibers.setter
+    def fibers(self, fibers: Mapping[str, Fiber]) -> None:
+        self._fibers = dict(fibers)
+
+    @property
+    def data(self) -> DataView:
+        """
+        Additional data of the node (variable name as key)
+        """
+        return DataView(self)
+
+    @data.setter
+    def data(self, data: Mapping[str, Any]) -> None:
+        self._data = dict(data)
+
+    @staticmethod
+    def from_coords(coords: np.ndarray) -> List["Node"]:
+        """
+        Creates many nodes at once. All nodes share one coordinate buffer, i.e. the coordinates of
+        each node are a view into the corresponding row of coords. The coordinates are not copied
+        if coords already is an np.array of floats.
+
+        Args:
+            coords: np.array((num_nodes, 3)) Coordinates of the nodes
+
+        Returns:
+            List of nodes
+        """
+        coords = np.asarray(coords, dtype=float)
+        if len(coords.shape) != 2 or coords.shape[1] != 3:
+            raise ValueError(
+                "Coordinates need to be of shape (num_nodes, 3), got {0}".format(
+                    coords.shape
+                )
+            )
+
+        nodes = [Node(None) for _ in range(len(coords))]
+        ColumnTable(nodes, coords).bind()
+
+        return nodes
 
     def reset(self) -> None:
         """
@@ -41,24 +117,19 @@ class Node:
         """
         Returns the line definition in the dat file
         """
-        dest = io.StringIO()
-        if len(self.fibers) > 0:
-            dest.write("FNODE")
-        else:
-            dest.write("NODE")
-
         if self.id is None:
             raise RuntimeError("You have to compute ids before writing")
 
-        dest.write(
-            " {0} COORD {1}".format(self.id, " ".join([str(i) for i in self.coords]))
+        fiber_line = self.fibers.get_line()
+        line = "{0} {1} COORD {2}".format(
+            "FNODE" if len(fiber_line) > 0 else "NODE",
+            self.id,
+            " ".join([str(i) for i in self.coords]),
         )
+        if len(fiber_line) > 0:
+            line += " " + fiber_line
 
-        for k, f in self.fibers.items():
-            dest.write(" ")
-            f.write(dest, k)
-
-        return dest.getvalue()
+        return line
 
     def write(self, dest: IO) -> None:
         """
@@ -67,20 +138,5 @@ class Node:
         Args:
             dest: stream variable where to write the line
         """
-        if len(self.fibers) > 0:
-            dest.write("FNODE")
-        else:
-            dest.write("NODE")
-
-        if self.id is None:
-            raise RuntimeError("You have to compute ids before writing")
-
-        dest.write(
-            " {0} COORD {1}".format(self.id, " ".join([str(i) for i in self.coords]))
-        )
-
-        for k, f in self.fibers.items():
-            dest.write(" ")
-            f.write(dest, k)
-
+        dest.write(self.get_line())
         dest.write("\n")
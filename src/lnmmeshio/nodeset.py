@@ -1,5 +1,6 @@
-from typing import IO, Iterator, List, Optional, Set
+from typing import IO, Iterable, Iterator, List, Optional, Sequence, Set
 
+import numpy as np
 from loguru import logger
 from tqdm import tqdm
 
@@ -28,9 +29,8 @@ class Nodeset:
         if node not in self.nodes:
             self.nodes.add(node)
 
-    def add_nodes(self, nodes: List[Node]) -> None:
-        for n in nodes:
-            self.nodes.add(n)
+    def add_nodes(self, nodes: Iterable[Node]) -> None:
+        self.nodes.update(nodes)
 
     def __len__(self) -> int:
         return len(self.nodes)
@@ -185,19 +185,66 @@ class NodesetBuilder:
         self.nodesets = []
         self.id2pos = {}
 
-    def add(self, node, id):
+        # all ids below are used, ids are never removed
+        self.next_unused_id = 1
+
+    def __get_nodeset(self, id) -> Nodeset:
         if id not in self.id2pos:
             self.id2pos[id] = len(self.nodesets)
             self.nodesets.append(self.nstype(id))
 
-        self.nodesets[self.id2pos[id]].add_node(node)
+        return self.nodesets[self.id2pos[id]]
+
+    def add(self, node, id):
+        self.__get_nodeset(id).add_node(node)
+
+    def add_many(self, nodes: Sequence[Node], indices: np.ndarray, id: int) -> None:
+        """
+        Adds the nodes at the indices to the nodeset with the id
+
+        Args:
+            nodes: List of all nodes
+            indices: np.array of the (zero based) positions of the nodes within nodes. Duplicate
+                indices are allowed.
+            id: Id of the nodeset
+        """
+        indices = np.unique(np.asarray(indices, dtype=int))
+
+        # an empty nodeset would use up the id
+        if len(indices) == 0:
+            return
+
+        self.__get_nodeset(id).add_nodes([nodes[i] for i in indices])
+
+    def add_groups(self, nodes: Sequence[Node], indices: np.ndarray, ids: np.ndarray):
+        """
+        Adds the nodes at the indices to the nodesets given by ids, e.g. the nodes of a block of
+        cells with one nodeset id per cell
+
+        Args:
+            nodes: List of all nodes
+            indices: np.array((num_items, ...)) of the (zero based) positions of the nodes within
+                nodes
+            ids: np.array((num_items)) with the id of the nodeset of each item
+        """
+        indices = np.asarray(indices, dtype=int).reshape((len(ids), -1))
+        ids = np.asarray(ids, dtype=int)
+
+        # sort the items by their nodeset id and add each group at once
+        order = np.argsort(ids, kind="stable")
+        unique_ids, starts = np.unique(ids[order], return_index=True)
+        for nsid, group in zip(unique_ids, np.split(order, starts[1:])):
+            # items without nodes do not create a nodeset
+            if indices[group].size == 0:
+                continue
+
+            self.add_many(nodes, indices[group], int(nsid))
 
     def get_unused_id(self):
-        nsid = 1
-        while nsid in self.id2pos.keys():
-            nsid += 1
+        while self.next_unused_id in self.id2pos:
+            self.next_unused_id += 1
 
-        return nsid
+        return self.next_unused_id
 
     def finalize(self):
         # return nodeset sorted by its id to preserve the id
@@ -0,0 +1,189 @@
+#
+# This is the interface between pyvista unstructured grids and our Discretization description
+# (without the meshio intermediate)
+#
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .discretization import Discretization, Node
+from .element import factory_many, get_element_type
+from .element.element import Element
+from .meshio_to_discretization import (
+    _get_element_data,
+    _get_materials,
+    _group_elements_by_shape,
+    cell_disc_eles,
+    disc_shape_cell,
+    ele_node_order_vtk2baci,
+)
+
+# vtk cell types of the element shapes
+disc_shape_vtk = {
+    "VERTEX1": 1,
+    "LINE2": 3,
+    "LINE3": 21,
+    "TRI3": 5,
+    "TRI6": 22,
+    "QUAD4": 9,
+    "QUAD8": 23,
+    "QUAD9": 28,
+    "TET4": 10,
+    "TET10": 24,
+    "HEX8": 12,
+    "HEX20": 25,
+    "HEX27": 29,
+    "WEDGE6": 13,
+    "PYRAMID5": 14,
+}
+
+# invert disc_shape_vtk
+vtk_disc_shape = {v: k for k, v in disc_shape_vtk.items()}
+
+
+def discretization2pyvista(dis: Discretization):
+    """
+    Converts the discretization into a pyvista unstructured grid. The cells are in the same order
+    as the elements (all fields one after another). The coordinates and the nodal data are shared
+    with the discretization if possible.
+
+    Args:
+        dis: Discretization
+
+    Returns:
+        pyvista.UnstructuredGrid
+    """
+    import pyvista
+
+    dis.compute_ids(zero_based=True)
+
+    points = dis.get_node_coords()
+
+    num_eles, field_offsets, shape_groups = _group_elements_by_shape(dis)
+
+    # number of nodes of each cell
+    cell_num_nodes = np.zeros((num_eles), dtype=np.int64)
+    celltypes = np.zeros((num_eles), dtype=np.uint8)
+    for shape, (positions, node_ids) in shape_groups.items():
+        if shape not in disc_shape_vtk:
+            raise NotImplementedError(
+                "The element shape {0} is not supported by vtk".format(shape)
+            )
+
+        cell_num_nodes[positions] = node_ids.shape[1]
+        celltypes[positions] = disc_shape_vtk[shape]
+
+    # cells in the legacy vtk format: number of nodes followed by the node ids of each cell
+    offsets = np.zeros((num_eles), dtype=np.int64)
+    offsets[1:] = np.cumsum(cell_num_nodes + 1)[:-1]
+
+    cells = np.zeros((np.sum(cell_num_nodes + 1)), dtype=np.int64)
+    cells[offsets] = cell_num_nodes
+    for positions, node_ids in shape_groups.values():
+        cells[offsets[positions, np.newaxis] + np.arange(1, node_ids.shape[1] + 1)] = (
+            node_ids
+        )
+
+    grid = pyvista.UnstructuredGrid(cells, celltypes, points)
+
+    for name, values in dis.get_node_data().items():
+        grid.point_data[name] = values
+
+    materials = _get_materials(dis, field_offsets, num_eles)
+    if materials is not None:
+        grid.cell_data["material"] = materials
+
+    for name, values in _get_element_data(dis, field_offsets, num_eles).items():
+        grid.cell_data[name] = values
+
+    dis.reset()
+
+    return grid
+
+
+def pyvista2Discretization(grid) -> Discretization:
+    """
+    Converts a pyvista unstructured grid into a discretization. Only cells of the highest dimension
+    become (structural) elements in the order of the cells. The cell data "material" is used as
+    material of the elements, all other cell and point data is stored as element and nodal data.
+
+    Args:
+        grid: pyvista.UnstructuredGrid
+
+    Returns:
+        Discretization
+    """
+    dis = Discretization()
+
+    dis.nodes = Node.from_coords(np.asarray(grid.points, dtype=float))
+    for name in grid.point_data.keys():
+        dis.set_node_data(name, np.asarray(grid.point_data[name]))
+
+    celltypes = np.asarray(grid.celltypes)
+    offsets = np.asarray(grid.offset)
+    connectivity = np.asarray(grid.cell_connectivity)
+
+    shapes: Dict[int, str] = {}
+    for vtk_type in np.unique(celltypes):
+        if vtk_type not in vtk_disc_shape:
+            raise NotImplementedError(
+                "The vtk cell type {0} is currently not implemented".format(vtk_type)
+            )
+        shapes[vtk_type] = vtk_disc_shape[vtk_type]
+
+    # get the maximum element dimension, which is the dimension of the mesh
+    dims = {
+        vtk_type: get_element_type(shape, throw_if_unknown=True).get_space_dim()
+        for vtk_type, shape in shapes.items()
+    }
+    maxdim = max(dims.values()) if len(dims) > 0 else 0
+
+    is_element = np.isin(
+        celltypes, [vtk_type for vtk_type, dim in dims.items() if dim == maxdim]
+    )
+    cell_ids = np.flatnonzero(is_element)
+
+    elements: List[Optional[Element]] = [None] * len(cell_ids)
+    for vtk_type, shape in shapes.items():
+        if dims[vtk_type] != maxdim:
+            continue
+
+        # position of the cells within the elements
+        positions = np.flatnonzero(celltypes[cell_ids] == vtk_type)
+        num_nodes = get_element_type(shape).get_num_nodes()
+        node_ids = connectivity[
+            offsets[cell_ids[positions], np.newaxis] + np.arange(num_nodes)
+        ]
+
+        if shape in ele_node_order_vtk2baci:
+            node_ids = node_ids[:, ele_node_order_vtk2baci[shape]]
+
+        for position, ele in zip(
+            positions,
+            factory_many(
+                shape,
+                node_ids,
+                dis.nodes,
+                type=cell_disc_eles.get(disc_shape_cell.get(shape, ""), "UNKNOWN"),
+            ),
+        ):
+            elements[position] = ele
+
+    dis.elements.structure = elements
+
+    if len(elements) > 0:
+        materials = np.ones((len(elements)), dtype=int)
+        if "material" in grid.cell_data.keys():
+            materials = np.asarray(grid.cell_data["material"])[cell_ids].astype(int)
+
+        for matid in np.unique(materials):
+            dis.set_element_option("MAT", int(matid), materials == matid)
+
+        for name in grid.cell_data.keys():
+            if name == "material":
+                continue
+
+            dis.set_element_data(name, np.asarray(grid.cell_data[name])[cell_ids])
+
+    dis.finalize()
+    return dis
@@ -0,0 +1,535 @@
+import itertools
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+# maximum number of grid cells per dimension, such that the cell keys fit into int64
+_max_cells_per_dim = {1: 2**60, 2: 2**30, 3: 2**20}
+
+# maximum number of pairs of points and boxes that are compared at once
+_max_pairs = 1 << 22
+
+# number of query points that are searched at once in a ring of get_nearest_box
+_nearest_chunk_size = 1 << 10
+
+
+def merge_points(points: np.ndarray, tol: float = 0.0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Merges coincident points. With tol > 0, the points are snapped to representatives: in the
+    order of the points, each point is merged into the first representative with a distance of at
+    most tol, or becomes a new representative otherwise. Hence, all merged points are within tol
+    of the point that represents them, chains of close points are not merged into one point.
+
+    Exactly coincident points are merged first. The remaining points are hashed into a grid with
+    a cell size of tol and the distances are only checked between points of the same and of
+    neighboring cells, i.e. the effort scales linearly with the number of points as long as tol is
+    small compared to the distances of distinct points. A cluster of k distinct points within one
+    cell costs O(k^2) distance checks.
+
+    Args:
+        points: Coordinates np.array((num_points, dim))
+        tol: Tolerance of the distance of merged points. With 0, only points with exactly the
+            same coordinates are merged.
+
+    Returns:
+        Tuple of the indices of the kept points (the representatives) np.array((num_merged)) in
+        the order of their first appearance and the mapping from the old to the new indices
+        np.array((num_points)), such that points[kept][inverse] are the merged coordinates of all
+        points
+    """
+    points = np.asarray(points)
+    if len(points.shape) != 2:
+        raise ValueError(
+            "Expected points of shape (num_points, dim), got {0}".format(points.shape)
+        )
+
+    if len(points) == 0:
+        return np.zeros((0), dtype=int), np.zeros((0), dtype=int)
+
+    # sort the points lexicographically, equal points are in the order of their appearance
+    order = np.lexsort(points.T[::-1])
+    is_first = np.ones((len(points)), dtype=bool)
+    is_first[1:] = np.any(points[order[1:]] != points[order[:-1]], axis=1)
+
+    # sort the unique points by their first appearance
+    index = order[is_first]
+    unique_order = np.argsort(index)
+    unique = index[unique_order]
+    unique_inverse = np.empty((len(points)), dtype=int)
+    unique_inverse[order] = np.argsort(unique_order)[np.cumsum(is_first) - 1]
+    if tol <= 0.0:
+        return unique, unique_inverse
+
+    first, second = get_close_pairs(points[unique], tol)
+    labels = _get_representatives(len(unique), first, second)
+
+    # the label of each point is the index of its representative
+    kept, inverse = np.unique(labels, return_inverse=True)
+    return unique[kept], inverse[unique_inverse]
+
+
+def get_close_pairs(points: np.ndarray, tol: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns all pairs of points with a distance of at most tol using a grid hash
+
+    Args:
+        points: Coordinates np.array((num_points, dim))
+        tol: Maximum distance (> 0)
+
+    Returns:
+        Tuple of the indices of the first and second point of each pair np.array((num_pairs)),
+        each pair is only returned once
+    """
+    points = np.asarray(points, dtype=float)
+    num_dim = points.shape[1]
+    if num_dim not in _max_cells_per_dim:
+        raise NotImplementedError(
+            "Points of dimension {0} are not supported".format(num_dim)
+        )
+
+    # the cells have to be larger for huge extents, such that the keys do not overflow
+    lower = np.min(points, axis=0)
+    extent = float(np.max(np.max(points, axis=0) - lower))
+    cell_size = max(tol, extent / (_max_cells_per_dim[num_dim] - 3))
+
+    # one empty layer of cells around the points, such that neighbor keys are unique
+    cells = np.floor((points - lower) / cell_size).astype(np.int64) + 1
+    strides = np.ones((num_dim), dtype=np.int64)
+    for d in range(num_dim - 2, -1, -1):
+        strides[d] = strides[d + 1] * (np.max(cells[:, d + 1]) + 2)
+    keys = cells @ strides
+
+    order = np.argsort(keys, kind="stable")
+    cell_keys, starts, counts = np.unique(
+        keys[order], return_index=True, return_counts=True
+    )
+
+    first_list = []
+    second_list = []
+
+    def add_close(first: np.ndarray, second: np.ndarray) -> None:
+        diff = points[first] - points[second]
+        is_close = np.einsum("ij,ij->i", diff, diff) <= tol**2
+        first_list.append(first[is_close])
+        second_list.append(second[is_close])
+
+    # pairs within the cells: each point with the following points of its cell
+    num_following = np.repeat(starts + counts, counts) - np.arange(len(points)) - 1
+    candidates = np.flatnonzero(num_following > 0)
+    shift = 1
+    while len(candidates) > 0:
+        add_close(order[candidates], order[candidates + shift])
+        candidates = candidates[num_following[candidates] > shift]
+        shift += 1
+
+    for offset in itertools.product((-1, 0, 1), repeat=num_dim):
+        # each pair of neighboring cells is only checked once
+        if offset <= (0,) * num_dim:
+            continue
+
+        neighbor_keys = cell_keys + int(np.dot(offset, strides))
+        positions = np.minimum(
+            np.searchsorted(cell_keys, neighbor_keys), len(cell_keys) - 1
+        )
+        cells_a = np.flatnonzero(cell_keys[positions] == neighbor_keys)
+        cells_b = positions[cells_a]
+
+        # all combinations of the points of the cells
+        num_b = counts[cells_b]
+        num_pairs = counts[cells_a] * num_b
+        pair_cell = np.repeat(np.arange(len(cells_a)), num_pairs)
+        local = np.arange(np.sum(num_pairs)) - np.repeat(
+            np.cumsum(num_pairs) - num_pairs, num_pairs
+        )
+        add_close(
+            order[starts[cells_a][pair_cell] + local // num_b[pair_cell]],
+            order[starts[cells_b][pair_cell] + local % num_b[pair_cell]],
+        )
+
+    return np.concatenate(first_list), np.concatenate(second_list)
+
+
+def get_nearest(
+    points: np.ndarray, queries: np.ndarray, radius: Optional[float] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the nearest point of each query point. The points within a search radius around the
+    queries are found with a grid (see BoundingBoxGrid), the radius is doubled for the queries
+    without a point in their radius.
+
+    Args:
+        points: Coordinates np.array((num_points, dim))
+        queries: Coordinates of the query points np.array((num_queries, dim))
+        radius: Initial search radius. If None, the mean distance of the points is estimated from
+            their extent.
+
+    Returns:
+        Tuple of the indices of the nearest points and their distances np.array((num_queries))
+    """
+    points = np.asarray(points, dtype=float)
+    queries = np.asarray(queries, dtype=float)
+    if len(points) == 0:
+        raise ValueError("Cannot find the nearest point without any points")
+
+    nearest = np.full((len(queries)), -1, dtype=int)
+    distances = np.full((len(queries)), np.inf)
+    if radius is None:
+        extent = float(np.max(np.max(points, axis=0) - np.min(points, axis=0)))
+        radius = extent / len(points) ** (1.0 / points.shape[1])
+    if radius <= 0.0:
+        radius = 1.0
+
+    remaining = np.arange(len(queries))
+    while len(remaining) > 0:
+        centers = queries[remaining]
+        point_ids, query_ids = BoundingBoxGrid(
+            centers - radius, centers + radius
+        ).query(points)
+
+        # only points within the radius are guaranteed to be the nearest
+        diff = points[point_ids] - centers[query_ids]
+        squared = np.einsum("ij,ij->i", diff, diff)
+        is_within = squared <= radius**2
+        point_ids = point_ids[is_within]
+        query_ids = query_ids[is_within]
+        squared = squared[is_within]
+
+        order = np.lexsort((squared, query_ids))
+        found, first = np.unique(query_ids[order], return_index=True)
+        nearest[remaining[found]] = point_ids[order[first]]
+        distances[remaining[found]] = np.sqrt(squared[order[first]])
+
+        remaining = np.delete(remaining, found)
+        radius *= 2.0
+
+    return nearest, distances
+
+
+def get_nearest_box(
+    lower: np.ndarray, upper: np.ndarray, queries: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the nearest axis aligned bounding box of each query point by the distance to the box
+    (0 if the point is inside). Boxes with the same distance are ordered by the distance to their
+    center.
+
+    The boxes are searched outward from each query point in rings of doubling radius: the boxes
+    enlarged by the radius are put into a grid (see BoundingBoxGrid), the boxes that contain a
+    query point are its candidates. The nearest candidate is final if it is within the radius.
+    Points farther from all boxes than the radius skip the ring. Once the radius exceeds the
+    extent of all boxes, the remaining points are compared with all boxes in chunks.
+
+    Args:
+        lower: Lower corners of the boxes np.array((num_boxes, dim))
+        upper: Upper corners of the boxes np.array((num_boxes, dim))
+        queries: Coordinates of the query points np.array((num_queries, dim))
+
+    Returns:
+        Tuple of the indices of the nearest boxes and their distances np.array((num_queries))
+    """
+    lower = np.asarray(lower, dtype=float)
+    upper = np.asarray(upper, dtype=float)
+    queries = np.asarray(queries, dtype=float)
+    if len(lower) == 0:
+        raise ValueError("Cannot find the nearest box without any boxes")
+
+    nearest = np.full((len(queries)), -1, dtype=int)
+    distances = np.full((len(queries)), np.inf)
+    if len(queries) == 0:
+        return nearest, distances
+
+    centers = (lower + upper) / 2.0
+
+    def get_distances(
+        box_lower: np.ndarray, box_upper: np.ndarray, points: np.ndarray
+    ) -> np.ndarray:
+        diff = np.maximum(box_lower - points, points - box_upper)
+        return np.linalg.norm(np.maximum(diff, 0.0), axis=-1)
+
+    def set_nearest(box_ids: np.ndarray, query_ids: np.ndarray, radius: float) -> None:
+        box_distances = get_distances(
+            lower[box_ids], upper[box_ids], queries[query_ids]
+        )
+        diff = centers[box_ids] - queries[query_ids]
+        order = np.lexsort(
+            (np.einsum("ij,ij->i", diff, diff), box_distances, query_ids)
+        )
+        found, first = np.unique(query_ids[order], return_index=True)
+        is_final = box_distances[order[first]] <= radius
+        nearest[found[is_final]] = box_ids[order[first[is_final]]]
+        distances[found[is_final]] = box_distances[order[first[is_final]]]
+
+    # no box is closer to a point than the bounding box of all boxes
+    all_lower = np.min(lower, axis=0)
+    all_upper = np.max(upper, axis=0)
+    lower_bounds = get_distances(all_lower, all_upper, queries)
+    extent = float(np.max(all_upper - all_lower))
+
+    radius = float(np.mean(np.max(upper - lower, axis=1)))
+    if radius <= 0.0:
+        radius = extent
+    remaining = np.arange(len(queries))
+    while len(remaining) > 0 and 0.0 < radius <= extent:
+        active = remaining[lower_bounds[remaining] <= radius]
+        if len(active) > 0:
+            grid = BoundingBoxGrid(lower - radius, upper + radius)
+            for start in range(0, len(active), _nearest_chunk_size):
+                chunk = active[start : start + _nearest_chunk_size]
+                point_ids, box_ids = grid.query(queries[chunk])
+                set_nearest(box_ids, chunk[point_ids], radius)
+            remaining = remaining[nearest[remaining] < 0]
+
+        radius *= 2.0
+
+    # all boxes are candidates of the far points
+    chunk_size = max(1, _max_pairs // len(lower))
+    for start in range(0, len(remaining), chunk_size):
+        chunk = remaining[start : start + chunk_size]
+        set_nearest(
+            np.tile(np.arange(len(lower)), len(chunk)),
+            np.repeat(chunk, len(lower)),
+            np.inf,
+        )
+
+    return nearest, distances
+
+
+def _get_representatives(
+    num_items: int, first: np.ndarray, second: np.ndarray
+) -> np.ndarray:
+    """
+    Labels each item with its representative, given by the pairs of close items. In the order of
+    the items, each item is represented by the first representative it is paired with, or
+    represents itself if there is none.
+
+    Instead of a loop over the items, all items whose smaller partners are already decided are
+    labeled at once, i.e. the number of iterations is the length of the longest chain of paired
+    items.
+    """
+    lower = np.minimum(first, second)
+    higher = np.maximum(first, second)
+
+    labels = np.arange(num_items)
+    targets = np.arange(num_items)
+    is_blocked = np.zeros((num_items), dtype=bool)
+
+    pending = np.unique(higher)
+    labels[pending] = -1
+    while len(pending) > 0:
+        lower_labels = labels[lower]
+
+        # items with an undecided smaller partner have to wait
+        is_open = lower_labels < 0
+        is_blocked[higher[is_open]] = True
+        is_ready = ~is_blocked[pending]
+        is_blocked[higher[is_open]] = False
+
+        # the first representative among the smaller partners
+        is_representative = lower_labels == lower
+        np.minimum.at(targets, higher[is_representative], lower[is_representative])
+
+        ready = pending[is_ready]
+        labels[ready] = targets[ready]
+        pending = pending[~is_ready]
+
+        # the representatives are recorded in targets, only the open pairs are left
+        lower = lower[is_open]
+        higher = higher[is_open]
+
+    return labels
+
+
+class BoundingBoxGrid:
+    """
+    Multi-level grid over axis aligned bounding boxes (e.g. of the elements). The cells of each
+    level are twice as large as the ones of the previous level. Each box is registered in all
+    cells it overlaps on the level whose cell size is closest to the size of the box, i.e. in at
+    most 3^dim cells. Hence, boxes of very different sizes (e.g. of graded meshes) do not blow up
+    the grid. A point query checks the boxes of the cell of the point on each level.
+    """
+
+    def __init__(
+        self, lower: np.ndarray, upper: np.ndarray, cell_size: Optional[float] = None
+    ):
+        """
+        Builds the grid
+
+        Args:
+            lower: Lower corners of the boxes np.array((num_boxes, dim))
+            upper: Upper corners of the boxes np.array((num_boxes, dim))
+            cell_size: Edge length of the cells of the level of the boxes of this size (the other
+                levels are finer or coarser by powers of 2). If None, the median of the largest
+                edge of the boxes is used.
+        """
+        self.lower = np.asarray(lower, dtype=float)
+        self.upper = np.asarray(upper, dtype=float)
+        if len(self.lower.shape) != 2 or self.lower.shape != self.upper.shape:
+            raise ValueError(
+                "Expected lower and upper corners of shape (num_boxes, dim), got {0} and {1}".format(
+                    self.lower.shape, self.upper.shape
+                )
+            )
+
+        num_boxes, num_dim = self.lower.shape
+        if num_dim not in _max_cells_per_dim:
+            raise NotImplementedError(
+                "Boxes of dimension {0} are not supported".format(num_dim)
+            )
+
+        self.cell_size = 1.0
+        self.levels: List[_GridLevel] = []
+        if num_boxes == 0:
+            return
+
+        origin = np.min(self.lower, axis=0)
+        extent = float(np.max(np.max(self.upper, axis=0) - origin))
+        edges = np.max(self.upper - self.lower, axis=1)
+        if cell_size is None:
+            positive = edges[edges > 0.0]
+            cell_size = float(np.median(positive)) if len(positive) > 0 else extent
+
+        # the cells have to be larger for huge extents, such that the keys do not overflow
+        min_cell_size = extent / (_max_cells_per_dim[num_dim] - 1)
+        self.cell_size = max(cell_size, min_cell_size)
+        if self.cell_size <= 0.0:
+            self.cell_size = 1.0
+
+        # the level whose cells are closest to the size of the box
+        levels = np.zeros((num_boxes), dtype=int)
+        is_positive = edges > 0.0
+        levels[is_positive] = np.round(
+            np.log2(edges[is_positive] / self.cell_size)
+        ).astype(int)
+
+        for level in np.unique(levels).tolist():
+            self.levels.append(
+                _GridLevel(
+                    self.lower,
+                    self.upper,
+                    np.flatnonzero(levels == level),
+                    origin,
+                    max(self.cell_size * 2.0**level, min_cell_size),
+                )
+            )
+
+    def query(self, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns all pairs of points and boxes that contain the point (including the boundary)
+
+        Args:
+            points: Coordinates np.array((num_points, dim))
+
+        Returns:
+            Tuple of the indices of the points and of the boxes np.array((num_pairs)). The pairs
+            are sorted by the point and then by the box.
+        """
+        points = np.asarray(points, dtype=float)
+        if len(points.shape) != 2 or points.shape[1] != self.lower.shape[1]:
+            raise ValueError(
+                "Expected points of shape (num_points, {0}), got {1}".format(
+                    self.lower.shape[1], points.shape
+                )
+            )
+
+        if len(self.levels) == 0:
+            return np.zeros((0), dtype=int), np.zeros((0), dtype=int)
+
+        point_list = []
+        box_list = []
+        for level in self.levels:
+            point_ids, box_ids = level.query(points)
+            is_in = np.all(
+                (self.lower[box_ids] <= points[point_ids])
+                & (points[point_ids] <= self.upper[box_ids]),
+                axis=1,
+            )
+            point_list.append(point_ids[is_in])
+            box_list.append(box_ids[is_in])
+
+        point_ids = np.concatenate(point_list)
+        box_ids = np.concatenate(box_list)
+
+        # the pairs of each level are sorted already
+        if len(self.levels) > 1:
+            order = np.lexsort((box_ids, point_ids))
+            point_ids = point_ids[order]
+            box_ids = box_ids[order]
+
+        return point_ids, box_ids
+
+
+class _GridLevel:
+    """
+    One level of the BoundingBoxGrid: a uniform grid with the boxes registered in all cells they
+    overlap. Only the non-empty cells are stored (sorted by their key).
+    """
+
+    def __init__(
+        self,
+        lower: np.ndarray,
+        upper: np.ndarray,
+        boxes: np.ndarray,
+        origin: np.ndarray,
+        cell_size: float,
+    ):
+        self.origin = origin
+        self.cell_size = cell_size
+
+        first = self.__get_cells(lower[boxes])
+        size = self.__get_cells(upper[boxes]) - first + 1
+        self.num_cells = np.max(first + size, axis=0)
+
+        # all cells of each box
+        counts = np.prod(size, axis=1)
+        box_index = np.repeat(np.arange(len(boxes)), counts)
+        local = np.arange(np.sum(counts)) - np.repeat(
+            np.cumsum(counts) - counts, counts
+        )
+        cells = np.empty((len(box_index), lower.shape[1]), dtype=np.int64)
+        for d in range(lower.shape[1] - 1, -1, -1):
+            cells[:, d] = first[box_index, d] + local % size[box_index, d]
+            local //= size[box_index, d]
+
+        keys = self.__get_keys(cells)
+        order = np.argsort(keys, kind="stable")
+        self.boxes = boxes[box_index[order]]
+        self.cell_keys, self.starts, self.counts = np.unique(
+            keys[order], return_index=True, return_counts=True
+        )
+
+    def __get_cells(self, x: np.ndarray) -> np.ndarray:
+        return np.floor((x - self.origin) / self.cell_size).astype(np.int64)
+
+    def __get_keys(self, cells: np.ndarray) -> np.ndarray:
+        strides = np.ones((len(self.num_cells)), dtype=np.int64)
+        for d in range(len(self.num_cells) - 2, -1, -1):
+            strides[d] = strides[d + 1] * self.num_cells[d + 1]
+
+        return cells @ strides
+
+    def query(self, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the pairs of points and the boxes registered in the cell of the point (not
+        checked whether the box contains the point), sorted by the point and then by the box
+        """
+        cells = self.__get_cells(points)
+        candidates = np.flatnonzero(
+            np.all((cells >= 0) & (cells < self.num_cells), axis=1)
+        )
+        keys = self.__get_keys(cells[candidates])
+        positions = np.minimum(
+            np.searchsorted(self.cell_keys, keys), len(self.cell_keys) - 1
+        )
+        is_found = self.cell_keys[positions] == keys
+        candidates = candidates[is_found]
+        positions = positions[is_found]
+
+        # all boxes of the cells of the points
+        counts = self.counts[positions]
+        point_ids = np.repeat(candidates, counts)
+        local = np.arange(np.sum(counts)) - np.repeat(
+            np.cumsum(counts) - counts, counts
+        )
+        box_ids = self.boxes[np.repeat(self.starts[positions], counts) + local]
+
+        return point_ids, box_ids
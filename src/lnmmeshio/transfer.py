@@ -0,0 +1,132 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from .discretization import Discretization, ElementLocator
+from .element.element_container import ElementContainer
+from .spatial import get_nearest_box
+
+
+def transfer_nodal_field(
+    source_dis: Discretization,
+    target_points: np.ndarray,
+    field: Union[str, np.ndarray],
+    fieldtype: str = ElementContainer.TypeStructure,
+    num_processes: Optional[int] = None,
+    chunk_size: int = 100000,
+) -> np.ndarray:
+    """
+    Interpolates a nodal field of a discretization to arbitrary points (e.g. the nodes of another
+    discretization) with the shape functions of the elements. All points are located at once (see
+    Discretization.locate_points), points outside of all elements are extrapolated with the
+    shape functions of the nearest element (by the distance to its bounding box, see
+    spatial.get_nearest_box).
+
+    Args:
+        source_dis: Discretization with the nodal field
+        target_points: np.array((num_points, 3)) with the coordinates of the points
+        field: Name of a nodal variable of the discretization or np.array((num_nodes, ...)) with
+            the nodal values
+        fieldtype: Type of the element field (e.g. ElementContainer.TypeStructure)
+        num_processes: Number of processes. If > 1, the points are transferred in chunks of
+            chunk_size in a process pool. The nodal coordinates, the node ids of the elements and
+            the nodal values are sent once to each process (see ElementLocator).
+        chunk_size: Number of points of each chunk of the process pool
+
+    Returns:
+        np.array((num_points, ...)) with the interpolated values
+    """
+    if isinstance(field, str):
+        values = source_dis.get_node_data()[field]
+    else:
+        values = np.asarray(field)
+        if len(values.shape) == 0 or values.shape[0] != len(source_dis.nodes):
+            raise ValueError(
+                "Expected one value per node, expected {0} got {1}".format(
+                    len(source_dis.nodes),
+                    values.shape[0] if len(values.shape) > 0 else 0,
+                )
+            )
+
+    target_points = np.asarray(target_points, dtype=float)
+    if len(target_points.shape) != 2 or target_points.shape[1] != 3:
+        raise ValueError(
+            "Expected points of shape (num_points, 3), got {0}".format(
+                target_points.shape
+            )
+        )
+
+    locator = ElementLocator.of(source_dis, fieldtype)
+    if num_processes is None or num_processes <= 1 or len(target_points) <= chunk_size:
+        return _transfer(locator, values, target_points)
+
+    # the arrays of the source are sent once to each process
+    chunks = [
+        target_points[start : start + chunk_size]
+        for start in range(0, len(target_points), chunk_size)
+    ]
+    with ProcessPoolExecutor(
+        max_workers=num_processes,
+        initializer=_init_worker,
+        initargs=(locator, values),
+    ) as executor:
+        results = list(executor.map(_transfer_chunk, chunks))
+
+    return np.concatenate(results)
+
+
+# source of the transfer within a process of the pool (see _init_worker)
+_worker_source: Optional[Tuple[ElementLocator, np.ndarray]] = None
+
+
+def _init_worker(locator: ElementLocator, values: np.ndarray) -> None:
+    global _worker_source
+    _worker_source = (locator, values)
+
+
+def _transfer_chunk(target_points: np.ndarray) -> np.ndarray:
+    locator, values = _worker_source
+    return _transfer(locator, values, target_points)
+
+
+def _transfer(
+    locator: ElementLocator, values: np.ndarray, target_points: np.ndarray
+) -> np.ndarray:
+    """
+    Interpolates the nodal values to the points (see transfer_nodal_field)
+    """
+    positions, xi = locator.locate(target_points)
+
+    # extrapolate the points outside of all elements from the nearest element
+    is_outside = positions < 0
+    if np.any(is_outside):
+        lower, upper = locator.get_bounding_boxes()
+        positions[is_outside], _ = get_nearest_box(
+            lower, upper, target_points[is_outside]
+        )
+
+    result = np.zeros((len(target_points),) + values.shape[1:], dtype=float)
+
+    # all points in elements of the same shape are evaluated at once
+    for ele_type, ele_positions, node_ids in locator.groups:
+        ele_index = np.full((locator.num_ele), -1, dtype=int)
+        ele_index[ele_positions] = np.arange(len(ele_positions))
+        points = np.flatnonzero(ele_index[positions] >= 0)
+        if len(points) == 0:
+            continue
+
+        dim = ele_type.get_space_dim()
+        ele_node_ids = node_ids[ele_index[positions[points]]]
+
+        # the local coordinates outside of the element (without checking the convergence)
+        outside = np.flatnonzero(is_outside[points])
+        if len(outside) > 0:
+            xi[points[outside], :dim] = ele_type.get_xi_many(
+                locator.coords[ele_node_ids[outside]], target_points[points[outside]]
+            )[0]
+
+        shape_fcns = ele_type.shape_fcns_many(xi[points, :dim])
+        result[points] = np.einsum("pn,pn...->p...", shape_fcns, values[ele_node_ids])
+
+    return result
@@ -1,7 +1,9 @@
+import itertools
 import os
 import unittest
 
 import lnmmeshio
+import numpy as np
 
 script_dir = os.path.dirname(os.path.realpath(__file__))
 
@@ -55,3 +57,244 @@ class TestMeshio2Discretization(unittest.TestCase):
         self.assertListEqual(
             sorted([n.id for n in dis.volumenodesets[0]]), [1, 2, 3, 4]
         )
+
+    def test_nodeset_membership(self):
+        dis: lnmmeshio.Discretization = lnmmeshio.read(
+            os.path.join(script_dir, "data", "dummy.dat")
+        )
+
+        membership = dis.get_element_nodeset_membership(dis.surfacenodesets)
+        face_membership = dis.get_face_nodeset_membership(dis.surfacenodesets)
+
+        self.assertEqual(
+            membership.shape,
+            (len(dis.elements.structure), len(dis.surfacenodesets)),
+        )
+        self.assertEqual(face_membership.shape[0], len(dis.elements.structure))
+        self.assertEqual(face_membership.shape[2], len(dis.surfacenodesets))
+
+        for i, ele in enumerate(dis.elements.structure):
+            dsurfs = ele.get_dsurfs()
+            for j, ns in enumerate(dis.surfacenodesets):
+                self.assertEqual(membership[i, j], ns in dsurfs)
+
+            for k, face in enumerate(ele.get_faces()):
+                dsurfs = face.get_dsurfs()
+                for j, ns in enumerate(dis.surfacenodesets):
+                    self.assertEqual(face_membership[i, k, j], ns in dsurfs)
+
+        # the mesh has element faces that lie on the surface nodesets
+        self.assertTrue(np.any(face_membership))
+
+    def test_element_options(self):
+        dis: lnmmeshio.Discretization = lnmmeshio.read(
+            os.path.join(script_dir, "data", "dummy.dat")
+        )
+        columns = dis.element_options[lnmmeshio.ElementContainer.TypeStructure]
+        self.assertListEqual(list(columns["MAT"].categories), ["1", "4", "5", "6"])
+
+        # query
+        mat4 = dis.get_elements_with_option("MAT", 4)
+        self.assertEqual(len(mat4), 12)
+        np.testing.assert_array_equal(mat4, dis.get_elements_with_option("MAT", "4"))
+        self.assertIn(0, dis.get_elements_with_option("EAS", "none"))
+        self.assertEqual(len(dis.get_elements_with_option("MAT", 3)), 0)
+
+        # bulk update
+        dis.set_element_option("MAT", 3, mat4)
+        np.testing.assert_array_equal(dis.get_elements_with_option("MAT", 3), mat4)
+        self.assertEqual(dis.elements.structure[mat4[0]].options["MAT"], 3)
+
+        # per element update and removal
+        ele = dis.elements.structure[0]
+        ele.options["MAT"] = "2"
+        del ele.options["EAS"]
+        self.assertNotIn("EAS", ele.options)
+        self.assertListEqual(list(ele.options.keys()), ["MAT", "KINEM"])
+        dis.compute_ids(zero_based=False)
+        self.assertEqual(
+            ele.get_line(), "1 SOLID HEX8 1 2 3 4 5 6 7 8 MAT 2 KINEM nonlinear"
+        )
+        self.assertEqual(
+            dis.elements.structure[mat4[0]].get_line().split(" MAT ")[1],
+            "3 KINEM nonlinear",
+        )
+
+        # list values are copied, not shared between the elements of a category
+        dis.set_element_option("RAD", [1.0, 2.0])
+        rad = dis.elements.structure[1].options["RAD"]
+        rad.append(3.0)
+        self.assertListEqual(dis.elements.structure[1].options["RAD"], [1.0, 2.0])
+        self.assertListEqual(dis.elements.structure[2].options["RAD"], [1.0, 2.0])
+
+    def test_merge_coincident_nodes(self):
+        # two hexahedra with duplicated nodes at the common face x=1
+        coords = np.array(
+            [[x, y, z] for x in (0.0, 1.0) for y in (0.0, 1.0) for z in (0.0, 1.0)]
+            + [[x, y, z] for x in (1.0, 2.0) for y in (0.0, 1.0) for z in (0.0, 1.0)]
+        )
+        coords[8:12] += 1e-9
+
+        dis = lnmmeshio.Discretization()
+        dis.nodes = lnmmeshio.Node.from_coords(coords)
+        hex_nodes = [0, 4, 6, 2, 1, 5, 7, 3]
+        dis.elements.structure = [
+            lnmmeshio.Hex8("SOLIDH8", [dis.nodes[i] for i in hex_nodes]),
+            lnmmeshio.Hex8("SOLIDH8", [dis.nodes[i + 8] for i in hex_nodes]),
+        ]
+        ns = lnmmeshio.SurfaceNodeset(1)
+        ns.add_nodes(dis.nodes[8:12])
+        dis.surfacenodesets = [ns]
+        dis.finalize()
+        dis.set_node_data("nodeid", np.arange(16))
+
+        # exact merging does not merge the disturbed nodes
+        report = dis.merge_coincident_nodes()
+        self.assertEqual(report["merged_nodes"], 0)
+        self.assertEqual(len(dis.nodes), 16)
+
+        report = dis.merge_coincident_nodes(tol=1e-6)
+        self.assertDictEqual(
+            report,
+            {
+                "merged_nodes": 4,
+                "remapped_elements": 1,
+                "degenerated_elements": 0,
+                "remapped_nodesets": 1,
+            },
+        )
+
+        self.assertEqual(len(dis.nodes), 12)
+        np.testing.assert_array_equal(
+            dis.get_node_data()["nodeid"], [0, 1, 2, 3, 4, 5, 6, 7, 12, 13, 14, 15]
+        )
+        np.testing.assert_array_equal(dis.get_node_coords()[:8], coords[:8])
+        self.assertTrue(np.shares_memory(dis.get_node_coords(), dis.nodes[8].coords))
+        self.assertEqual(dis.nodes[8].data["nodeid"], 12)
+
+        # the elements share the nodes of the common face
+        common = set(dis.elements.structure[0].nodes) & set(
+            dis.elements.structure[1].nodes
+        )
+        self.assertSetEqual(common, set(dis.nodes[4:8]))
+        self.assertSetEqual(ns.nodes, common)
+        for node in common:
+            self.assertListEqual(node.surfacenodesets, [ns])
+
+    def test_locate_points(self):
+        # unit cube split into six tetrahedra along the diagonal
+        coords = np.array(
+            [[x, y, z] for x in (0.0, 1.0) for y in (0.0, 1.0) for z in (0.0, 1.0)]
+        )
+        dis = lnmmeshio.Discretization()
+        dis.nodes = lnmmeshio.Node.from_coords(coords)
+        dis.elements.structure = []
+        for axes in itertools.permutations(range(3)):
+            corner = np.zeros((3), dtype=int)
+            tet_nodes = [0]
+            for axis in axes:
+                corner[axis] = 1
+                tet_nodes.append(int(np.dot(corner, [4, 2, 1])))
+            dis.elements.structure.append(
+                lnmmeshio.Tet4("SOLIDT4", [dis.nodes[i] for i in tet_nodes])
+            )
+        dis.finalize()
+
+        rng = np.random.default_rng(42)
+        points = np.concatenate(
+            [rng.random((50, 3)), [[1.0, 1.0, 1.0], [0.5, 0.5, 0.5], [1.5, 0.5, 0.5]]]
+        )
+
+        positions, xi = dis.locate_points(points)
+
+        np.testing.assert_array_equal(positions[-1], -1)
+        self.assertTrue(np.all(np.isnan(xi[-1])))
+        self.assertTrue(np.all(positions[:-1] >= 0))
+        for point, position, point_xi in zip(points[:-1], positions, xi):
+            ele = dis.elements.structure[position]
+            np.testing.assert_allclose(
+                ele.project_quantity_xi(point_xi, ele.get_node_coords()), point
+            )
+
+    def test_locate_points_mixed(self):
+        dis = lnmmeshio.read(os.path.join(script_dir, "data", "dummy.dat"))
+        elements = dis.elements.structure
+
+        # the centers of all elements (hexahedra and tetrahedra)
+        centers = np.array(
+            [
+                ele.project_quantity_xi(
+                    type(ele).ReferenceCenter, ele.get_node_coords()
+                )
+                for ele in elements
+            ]
+        )
+
+        positions, xi = dis.locate_points(centers)
+
+        np.testing.assert_array_equal(positions, np.arange(len(elements)))
+        for ele, ele_xi in zip(elements, xi):
+            np.testing.assert_allclose(ele_xi, type(ele).ReferenceCenter, atol=1e-10)
+
+    def test_reorder_after_set_data(self):
+        dis = lnmmeshio.Discretization()
+        dis.nodes = lnmmeshio.Node.from_coords(np.arange(18.0).reshape((6, 3)))
+        dis.set_node_data("nodeid", np.arange(6))
+        dis.set_node_fibers(lnmmeshio.Fiber.TypeFiber1, np.arange(18.0).reshape((6, 3)))
+        dis.elements.structure = [
+            lnmmeshio.Line2("LINE2", dis.nodes[i : i + 2]) for i in range(5)
+        ]
+        dis.set_element_option("MAT", 1, [0, 1])
+        dis.set_element_option("MAT", 2, [2, 3, 4])
+        dis.set_element_data("eleid", np.arange(5))
+
+        # reordered as a new list and in place with the first and the last node kept
+        dis.nodes = dis.nodes[::-1]
+        np.testing.assert_array_equal(dis.get_node_data()["nodeid"], np.arange(6)[::-1])
+        dis.nodes[1:5] = sorted(dis.nodes[1:5], key=lambda node: node.data["nodeid"])
+        np.testing.assert_array_equal(dis.get_node_data()["nodeid"], [5, 1, 2, 3, 4, 0])
+        np.testing.assert_array_equal(
+            dis.get_node_fibers()[lnmmeshio.Fiber.TypeFiber1][:, 0],
+            [15, 3, 6, 9, 12, 0],
+        )
+        for node, nodeid in zip(dis.nodes, dis.get_node_data()["nodeid"]):
+            self.assertEqual(node.data["nodeid"], nodeid)
+
+        # elements moved into another field keep their variables
+        elements = dis.elements.structure
+        dis.elements.structure = elements[::2]
+        dis.elements.fluid = elements[1::2]
+        np.testing.assert_array_equal(dis.get_element_data()["eleid"], [0, 2, 4])
+        np.testing.assert_array_equal(
+            dis.get_element_data(lnmmeshio.ElementContainer.TypeFluid)["eleid"], [1, 3]
+        )
+        np.testing.assert_array_equal(dis.get_elements_with_option("MAT", 2), [1, 2])
+        np.testing.assert_array_equal(
+            dis.get_elements_with_option(
+                "MAT", 1, lnmmeshio.ElementContainer.TypeFluid
+            ),
+            [0],
+        )
+        self.assertEqual(elements[3].options["MAT"], 2)
+
+        # replaced elements have no values
+        dis.elements.structure = dis.elements.structure + [
+            lnmmeshio.Line2("LINE2", dis.nodes[:2])
+        ]
+        with self.assertRaises(RuntimeError):
+            dis.get_element_data()
+
+    def test_shared_nodes(self):
+        nodes = lnmmeshio.Node.from_coords(np.zeros((3, 3)))
+        dis = lnmmeshio.Discretization()
+        dis.nodes = nodes
+        dis.set_node_data("nodeid", np.arange(3))
+
+        other = lnmmeshio.Discretization()
+        other.nodes = nodes[::-1]
+        with self.assertRaises(RuntimeError):
+            other.set_node_data("nodeid", np.arange(3))
+        with self.assertRaises(RuntimeError):
+            other.bind_data()
+        self.assertEqual(nodes[1].data["nodeid"], 1)
+        np.testing.assert_array_equal(dis.get_node_data()["nodeid"], np.arange(3))
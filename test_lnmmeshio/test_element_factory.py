@@ -28,3 +28,54 @@ class TestElementFactory(unittest.TestCase):
             cls.ShapeName, TestElementFactory.get_nodes(numnodes)
         )
         self.assertIsInstance(ele, cls)
+
+    def test_element_factory_many(self):
+        coords = np.random.rand(6, 3)
+        nodes = lnmmeshio.Node.from_coords(coords)
+
+        # nodes share the coordinate buffer
+        coords[2] = [1.0, 2.0, 3.0]
+        np.testing.assert_allclose(nodes[2].coords, [1.0, 2.0, 3.0])
+
+        elements = lnmmeshio.element.factory_many(
+            lnmmeshio.Wedge6.ShapeName,
+            np.array([[0, 1, 2, 3, 4, 5], [5, 4, 3, 2, 1, 0]]),
+            nodes,
+            type="SOLID",
+            options={"MAT": 1},
+        )
+
+        self.assertEqual(len(elements), 2)
+        for ele in elements:
+            self.assertIsInstance(ele, lnmmeshio.Wedge6)
+            self.assertEqual(ele.type, "SOLID")
+            self.assertEqual(ele.options["MAT"], 1)
+        self.assertIs(elements[1].nodes[0], nodes[5])
+
+        with self.assertRaises(RuntimeError):
+            lnmmeshio.element.factory_many(
+                lnmmeshio.Tet4.ShapeName, np.array([[0, 1, 2]]), nodes
+            )
+
+    def test_parse_many(self):
+        nodes = TestElementFactory.get_nodes(4)
+        table = lnmmeshio.element.parse_element.parse_many(
+            ["1 SOLID TET4 4 3 2 1 MAT 1", "2 SOLID TET4 1 2 3 4"], nodes
+        )
+        self.assertListEqual(table.items[0].nodes, nodes[::-1])
+
+        # node ids outside of the nodes
+        for node_id in (0, -1, 5):
+            with self.assertRaisesRegex(RuntimeError, "Element 2 "):
+                lnmmeshio.element.parse_element.parse_many(
+                    [
+                        "1 SOLID TET4 1 2 3 4",
+                        "2 SOLID TET4 1 2 {0} 4".format(node_id),
+                    ],
+                    nodes,
+                )
+
+        # too few node ids, with and without options
+        for line in ("3 SOLID TET4 1 2 3", "3 SOLID TET4 1 2 3 MAT 1"):
+            with self.assertRaisesRegex(RuntimeError, "Element 3 .* TET4"):
+                lnmmeshio.element.parse_element.parse_many([line], nodes)
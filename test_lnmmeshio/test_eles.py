@@ -8,6 +8,7 @@ from lnmmeshio import (
     Element1D,
     Element2D,
     Element3D,
+    ElementTet,
     Hex8,
     Hex20,
     Hex27,
@@ -283,6 +284,7 @@ class TestEles(unittest.TestCase):
             [Tet4],
             [Tet10],
             [Line2],
+            [Line3],
             [Quad4],
             [Tri3],
             [Tri6],
@@ -311,6 +313,91 @@ class TestEles(unittest.TestCase):
                     sp.simplify(shapefcnsderivs[i, n] - analytic_deriv) == 0
                 )
 
+    @parameterized.expand(
+        [
+            [Hex8],
+            [Hex20],
+            [Hex27],
+            [Tet4],
+            [Tet10],
+            [Line2],
+            [Line3],
+            [Quad4],
+            [Quad8],
+            [Quad9],
+            [Tri3],
+            [Tri6],
+        ]
+    )
+    def test_shape_fcns_many(self, ele):
+        dim = ele.get_space_dim()
+        xi = np.random.rand(20, dim) * 2.0 - 1.0
+
+        shapefcns = ele.shape_fcns_many(xi)
+        shapefcnsderivs = ele.shape_fcns_derivs_many(xi)
+
+        self.assertEqual(shapefcns.shape, (20, ele.get_num_nodes()))
+        self.assertEqual(shapefcnsderivs.shape, (20, dim, ele.get_num_nodes()))
+        for i in range(len(xi)):
+            np.testing.assert_allclose(
+                shapefcns[i], ele.shape_fcns(xi[i] if dim > 1 else xi[i, 0]), atol=1e-14
+            )
+            np.testing.assert_allclose(
+                shapefcnsderivs[i],
+                np.reshape(
+                    ele.shape_fcns_derivs(xi[i] if dim > 1 else xi[i, 0]), (dim, -1)
+                ),
+                atol=1e-14,
+            )
+
+        # compare the derivatives with central differences
+        h = 1e-6
+        for d in range(dim):
+            shift = np.zeros((dim))
+            shift[d] = h
+            np.testing.assert_allclose(
+                shapefcnsderivs[:, d],
+                (ele.shape_fcns_many(xi + shift) - ele.shape_fcns_many(xi - shift))
+                / (2.0 * h),
+                atol=1e-8,
+            )
+
+    @parameterized.expand(
+        [
+            [Hex8, np.array([-1.0, 1.0, 0.0])[Hex8.TensorProductIndices]],
+            [Hex20, Hex20.nodal_reference_coordinates()],
+            [Hex27, np.array([-1.0, 1.0, 0.0])[Hex27.TensorProductIndices]],
+            [Tet4, Tet4.nodal_reference_coordinates()],
+            [Tet10, Tet10.nodal_reference_coordinates()],
+        ]
+    )
+    def test_get_xi_many(self, ele, ref_coords):
+        # slightly distorted elements
+        num = 50
+        coords = ref_coords + np.random.rand(num, len(ref_coords), 3) * 0.1
+        coords = coords @ np.array([[2.0, 0.1, 0.0], [0.0, 1.0, 0.3], [0.2, 0.0, 0.5]])
+
+        if issubclass(ele, ElementTet):
+            xi = np.random.rand(num, 3) / 3.0
+        else:
+            xi = np.random.rand(num, 3) * 2.0 - 1.0
+        x = np.einsum("kn,knd->kd", ele.shape_fcns_many(xi), coords)
+
+        xi2, converged = ele.get_xi_many(coords, x)
+
+        self.assertTrue(np.all(converged))
+        np.testing.assert_allclose(xi2, xi, atol=1e-10)
+        self.assertTrue(np.all(ele.is_in_ref_many(xi2)))
+
+        # single points
+        element = ele(None, [Node(c) for c in coords[0]])
+        np.testing.assert_allclose(element.get_xi(x[0]), xi[0], atol=1e-10)
+        self.assertTrue(element.is_in(x[0]))
+
+        # degenerated elements do not converge
+        _, converged = ele.get_xi_many(np.zeros((1, len(ref_coords), 3)), x[:1])
+        self.assertFalse(converged[0])
+
     @parameterized.expand(
         [
             [Hex8, 3],
@@ -59,11 +59,250 @@ class TestEnsight(unittest.TestCase):
 
         # how to check?
 
+    def test_read_ensight_binary(self):
+        dis: lnmmeshio.Discretization = lnmmeshio.read(
+            os.path.join(script_dir, "data", "dummy.dat")
+        )
+        num_eles = len(dis.elements.structure)
+
+        dis.set_node_data("temperature", np.arange(len(dis.nodes), dtype=float))
+        dis.set_node_data(
+            "displacement",
+            np.arange(len(dis.nodes) * 4 * 3, dtype=float).reshape((-1, 4, 3)),
+        )
+        dis.set_element_data("eleid", np.arange(num_eles, dtype=float))
+
+        if not os.path.isdir(os.path.join(script_dir, "tmp", "ensight_read")):
+            os.makedirs(os.path.join(script_dir, "tmp", "ensight_read"))
+        filename = os.path.join(script_dir, "tmp", "ensight_read", "ensight.case")
+        lnmmeshio.ensightio.write_case(filename, dis, binary=True, override=True)
+
+        dis2 = lnmmeshio.read(filename)
+        self.assertEqual(len(dis2.nodes), len(dis.nodes))
+        self.assertEqual(len(dis2.elements.structure), num_eles)
+        np.testing.assert_allclose(
+            dis2.get_node_coords(), dis.get_node_coords(), rtol=1e-6
+        )
+        np.testing.assert_array_equal(
+            dis2.get_node_data()["temperature"], np.arange(len(dis.nodes))
+        )
+
+        # the elements are grouped by their type
+        for ele, eleid in zip(
+            dis2.elements.structure, dis2.get_element_data()["eleid"].astype(int)
+        ):
+            self.assertEqual(ele.shape, dis.elements.structure[eleid].shape)
+            np.testing.assert_allclose(
+                ele.get_node_coords(),
+                dis.elements.structure[eleid].get_node_coords(),
+                rtol=1e-6,
+            )
+
+        # transient variables are read per time step
+        case = lnmmeshio.ensightio.EnsightCase(filename)
+        displacement = case.variables["displacement"]
+        self.assertEqual(displacement.location, "node")
+        self.assertEqual(len(displacement), 4)
+        np.testing.assert_array_equal(displacement.times, [0.0, 1.0, 2.0, 3.0])
+        np.testing.assert_array_equal(
+            displacement[2], dis.get_node_data()["displacement"][:, 2, :]
+        )
+        self.assertIsInstance(displacement[-1], np.memmap)
+        self.assertNotIn("displacement", dis2.get_node_data())
+
+    def test_write_ensight_fields(self):
+        dis: lnmmeshio.Discretization = lnmmeshio.read(
+            os.path.join(script_dir, "data", "dummy.dat")
+        )
+        eles = dis.elements.structure
+        dis.elements.structure = eles[::2]
+        dis.elements.fluid = eles[1::2]
+
+        dis.set_element_data(
+            "eleid", np.arange(0, len(eles), 2, dtype=float), fieldtype="structure"
+        )
+        dis.set_element_data(
+            "eleid", np.arange(1, len(eles), 2, dtype=float), fieldtype="fluid"
+        )
+        dis.set_element_data(
+            "fluid", np.ones((len(dis.elements.fluid), 3)), fieldtype="fluid"
+        )
+
+        if not os.path.isdir(os.path.join(script_dir, "tmp", "ensight_fields")):
+            os.makedirs(os.path.join(script_dir, "tmp", "ensight_fields"))
+        filename = os.path.join(script_dir, "tmp", "ensight_fields", "ensight.case")
+        lnmmeshio.ensightio.write_case(filename, dis, binary=True, override=True)
+
+        dis2 = lnmmeshio.read(filename)
+        eleids = dis2.get_element_data()["eleid"].astype(int)
+        self.assertListEqual(sorted(eleids), list(range(len(eles))))
+
+        # elements of both fields are grouped by their type, structure before fluid
+        self.assertListEqual(
+            [ele.shape for ele in dis2.elements.structure],
+            [eles[i].shape for i in eleids],
+        )
+        for shape in ("HEX8", "TET4", "TET10"):
+            ids = [i for i in eleids if eles[i].shape == shape]
+            self.assertListEqual(
+                ids,
+                [i for i in range(0, len(eles), 2) if eles[i].shape == shape]
+                + [i for i in range(1, len(eles), 2) if eles[i].shape == shape],
+            )
+
+        # elements of fields without the variable get zeros
+        np.testing.assert_array_equal(
+            dis2.get_element_data()["fluid"],
+            np.repeat((eleids % 2)[:, np.newaxis], 3, axis=1),
+        )
+
+    def test_read_ensight_ascii(self):
+        dis: lnmmeshio.Discretization = lnmmeshio.read(
+            os.path.join(script_dir, "data", "dummy2.dat")
+        )
+
+        if not os.path.isdir(os.path.join(script_dir, "tmp", "ensight_ascii_read")):
+            os.makedirs(os.path.join(script_dir, "tmp", "ensight_ascii_read"))
+        filename = os.path.join(script_dir, "tmp", "ensight_ascii_read", "ensight.case")
+        lnmmeshio.ensightio.write_case(filename, dis, binary=False, override=True)
+
+        with self.assertRaises(NotImplementedError):
+            lnmmeshio.read(filename)
+
+    def test_write_ensight_parts(self):
+        dis: lnmmeshio.Discretization = lnmmeshio.read(
+            os.path.join(script_dir, "data", "dummy.dat")
+        )
+        num_eles = len(dis.elements.structure)
+        dis.set_node_data("nodeid", np.arange(len(dis.nodes), dtype=float))
+        dis.set_element_data("eleid", np.arange(num_eles, dtype=float))
+
+        if not os.path.isdir(os.path.join(script_dir, "tmp", "ensight_parts")):
+            os.makedirs(os.path.join(script_dir, "tmp", "ensight_parts"))
+        filename = os.path.join(script_dir, "tmp", "ensight_parts", "ensight.case")
+        lnmmeshio.ensightio.write_case(
+            filename, dis, override=True, parts="material", out=False
+        )
+
+        case = lnmmeshio.ensightio.EnsightCase(filename)
+        self.assertListEqual(
+            [part.description for part in case.parts],
+            [
+                "structure MAT 1",
+                "structure MAT 4",
+                "structure MAT 5",
+                "structure MAT 6",
+            ],
+        )
+
+        # each part contains the nodes of its elements
+        nodeids = case.variables["nodeid"][0].astype(int)
+        np.testing.assert_allclose(
+            np.concatenate([part.coords for part in case.parts]),
+            dis.get_node_coords()[nodeids],
+            rtol=1e-6,
+        )
+
+        eleids = case.variables["eleid"][0].astype(int)
+        np.testing.assert_array_equal(np.sort(eleids), np.arange(num_eles))
+
+        dis2 = case.get_discretization()
+        for ele, eleid in zip(dis2.elements.structure, eleids):
+            np.testing.assert_allclose(
+                ele.get_node_coords(),
+                dis.elements.structure[eleid].get_node_coords(),
+                rtol=1e-6,
+            )
+
+        with self.assertRaises(ValueError):
+            lnmmeshio.ensightio.write_case(filename, dis, override=True, parts="mat")
+
+    def test_ensight_writer(self):
+        dis: lnmmeshio.Discretization = lnmmeshio.read(
+            os.path.join(script_dir, "data", "dummy.dat")
+        )
+        num_eles = len(dis.elements.structure)
+        times = [0.1, 0.25, 1.5]
+
+        if not os.path.isdir(os.path.join(script_dir, "tmp", "ensight_writer")):
+            os.makedirs(os.path.join(script_dir, "tmp", "ensight_writer"))
+        filename = os.path.join(script_dir, "tmp", "ensight_writer", "ensight.case")
+        writer = lnmmeshio.ensightio.EnsightWriter(filename, dis, override=True)
+        for i, time in enumerate(times):
+            writer.add_timestep(
+                time,
+                node_vars={"displacement": dis.get_node_coords() * i},
+                ele_vars={"eleid": np.arange(num_eles, dtype=float) + 10 * i},
+            )
+
+        # the variables of all time steps have to be the same
+        with self.assertRaises(RuntimeError):
+            writer.add_timestep(2.0, node_vars={"displacement": dis.get_node_coords()})
+
+        case = lnmmeshio.ensightio.EnsightCase(filename)
+        self.assertEqual(len(case.parts[0].coords), len(dis.nodes))
+
+        displacement = case.variables["displacement"]
+        self.assertEqual(displacement.location, "node")
+        np.testing.assert_allclose(displacement.times, times)
+        for i in range(len(times)):
+            np.testing.assert_allclose(
+                displacement[i], dis.get_node_coords() * i, rtol=1e-6
+            )
+
+        # the elements are grouped by their type
+        eleid = case.variables["eleid"]
+        self.assertEqual(eleid.location, "element")
+        np.testing.assert_allclose(eleid.times, times)
+        np.testing.assert_array_equal(
+            np.sort(eleid[2]), np.arange(num_eles, dtype=float) + 20
+        )
+
+    def test_read_transient_geometry(self):
+        # the first step (one part) is twice as large as the empty second and third step, i.e.
+        # the fourth step is where the third would be with steps of constant size
+        dirname = os.path.join(script_dir, "tmp", "ensight_transient")
+        if not os.path.isdir(dirname):
+            os.makedirs(dirname)
+        with open(os.path.join(dirname, "ensight.geo"), "wb") as f:
+            lnmmeshio.ioutils.ens_write_string(f, "C Binary")
+            for num_parts in (1, 0, 0, 1):
+                for line in ("BEGIN TIME STEP", "geometry", "", "node id off"):
+                    lnmmeshio.ioutils.ens_write_string(f, line)
+                lnmmeshio.ioutils.ens_write_string(f, "element id off")
+                for _ in range(num_parts):
+                    lnmmeshio.ioutils.ens_write_string(f, "part")
+                    lnmmeshio.ioutils.ens_write_int(f, 1)
+                    lnmmeshio.ioutils.ens_write_string(f, "tetrahedra")
+                    lnmmeshio.ioutils.ens_write_string(f, "coordinates")
+                    lnmmeshio.ioutils.ens_write_int(f, 7)
+                    lnmmeshio.ioutils.ens_write_floats(f, np.arange(21.0))
+                    lnmmeshio.ioutils.ens_write_string(f, "tetra4")
+                    lnmmeshio.ioutils.ens_write_int(f, 4)
+                    lnmmeshio.ioutils.ens_write_ints(f, np.arange(16) % 7 + 1)
+                lnmmeshio.ioutils.ens_write_string(f, "END TIME STEP")
+
+        filename = os.path.join(dirname, "ensight.case")
+        with open(filename, "w") as f:
+            f.write(
+                "FORMAT\ntype: ensight gold\n\nGEOMETRY\nmodel: 1 ensight.geo\n\n"
+                "TIME\ntime set: 1\nnumber of steps: 4\ntime values: 0 1 2 3\n"
+            )
+
+        for step, num_parts in enumerate((1, 0, 0, 1)):
+            case = lnmmeshio.ensightio.EnsightCase(filename, geometry_step=step)
+            self.assertEqual(len(case.parts), num_parts)
+            self.assertFalse(case.static_geometry)
+
+        with self.assertRaises(IndexError):
+            lnmmeshio.ensightio.EnsightCase(filename, geometry_step=4)
+
     def test_write_float(self):
         ref_file = os.path.join(script_dir, "tmp", "ref.tmp")
         res_file = os.path.join(script_dir, "tmp", "res.tmp")
 
-        arr = np.random.rand(10, 20)
+        arr = np.random.rand(10, 20) - 0.5
+        arr[0, :5] = [0.0, -0.0, np.nan, np.inf, -np.inf]
 
         # write ref binary file
         with open(ref_file, "wb") as f:
@@ -83,7 +322,7 @@ class TestEnsight(unittest.TestCase):
 
                 f.write("{0:10.5e}\n".format(v))
 
-        # test binary
+        # test ascii
         with open(res_file, "w") as f:
             lnmmeshio.ioutils.ens_write_floats(f, arr, binary=False)
 
@@ -105,6 +344,28 @@ class TestEnsight(unittest.TestCase):
 
         self.assertTrue(filecmp.cmp(res_file, ref_file))
 
+        # write ref ascii file
+        with open(ref_file, "w") as f:
+            for row in arr:
+                f.write("".join(["{0:>10}".format(i) for i in row]) + "\n")
+
+        # test ascii
+        with open(res_file, "w") as f:
+            lnmmeshio.ioutils.ens_write_ints(f, arr, binary=False)
+
+        self.assertTrue(filecmp.cmp(res_file, ref_file))
+
+        # write ref ascii file of a 1d array
+        with open(ref_file, "w") as f:
+            for i in np.ravel(arr, "F"):
+                f.write("{0:>10}\n".format(i))
+
+        # test ascii
+        with open(res_file, "w") as f:
+            lnmmeshio.ioutils.ens_write_ints(f, np.ravel(arr, "F"), binary=False)
+
+        self.assertTrue(filecmp.cmp(res_file, ref_file))
+
     def tearDown(self):
         pass
         # delete tmp folder
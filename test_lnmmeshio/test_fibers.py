@@ -1,8 +1,10 @@
 import os
 import unittest
 
+import lnmmeshio
 import numpy as np
 from lnmmeshio import Fiber
+from lnmmeshio.element.parse_element import parse as parse_ele
 
 script_dir = os.path.dirname(os.path.realpath(__file__))
 
@@ -82,3 +84,95 @@ class TestFibers(unittest.TestCase):
         self.assertEqual(Fiber.get_fiber_type("TAN"), Fiber.TypeTan)
         self.assertEqual(Fiber.get_fiber_type("AXI"), Fiber.TypeAxi)
         self.assertEqual(Fiber.get_fiber_type("RAD"), Fiber.TypeRad)
+
+    def test_fibers_columnwise(self):
+        dis = lnmmeshio.read(os.path.join(script_dir, "data", "dummy2.dat"))
+
+        # fibers defined at all nodes are stored columnwise
+        self.assertEqual(
+            sorted(dis.node_fibers.keys()), [Fiber.TypeFiber1, Fiber.TypeFiber2]
+        )
+        dis.node_fibers[Fiber.TypeFiber1][1] = [0.0, 0.0, 2.0]
+        np.testing.assert_allclose(
+            dis.nodes[1].fibers[Fiber.TypeFiber1].fiber, [0.0, 0.0, 2.0]
+        )
+        dis.compute_ids(zero_based=False)
+        self.assertEqual(
+            dis.nodes[1].get_line(),
+            "FNODE 2 COORD 1.0 0.0 0.0 FIBER1 0.0 0.0 2.0 FIBER2 0.0 1.0 0.0",
+        )
+        self.assertEqual(
+            Fiber.get_lines(Fiber.TypeFiber1, dis.node_fibers[Fiber.TypeFiber1])[1],
+            "FIBER1 0.0 0.0 2.0",
+        )
+
+        # bulk operations
+        f1, f2 = Fiber.orthogonalize(
+            dis.get_node_fibers()[Fiber.TypeFiber1],
+            np.array([[1.0, 1.0, 0.0]] * 4),
+        )
+        np.testing.assert_allclose(np.linalg.norm(f1, axis=1), 1.0)
+        np.testing.assert_allclose(np.sum(f1 * f2, axis=1), 0.0, atol=1e-14)
+        np.testing.assert_allclose(
+            Fiber.normalize(np.array([[0.0, 0.0, 0.0], [0.0, 3.0, 4.0]])),
+            [[0.0, 0.0, 0.0], [0.0, 0.6, 0.8]],
+        )
+        rot = np.array([[0.0, -1.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, 1.0]])
+        np.testing.assert_allclose(
+            Fiber.transform(np.array([[1.0, 0.0, 0.0]]), rot), [[0.0, 1.0, 0.0]]
+        )
+
+        # element fibers
+        fibers = dis.interpolate_nodal_fibers(dis.node_fibers[Fiber.TypeFiber2])
+        np.testing.assert_allclose(fibers, [[0.0, 1.0, 0.0]])
+        np.testing.assert_allclose(
+            dis.interpolate_nodal_fibers(dis.get_node_coords(), numgp=4).sum(axis=1),
+            [[1.0, 1.0, 1.0]],
+        )
+        dis.set_element_fibers(Fiber.TypeFiber1, Fiber.normalize(fibers))
+        dis.compute_ids(zero_based=False)
+        self.assertEqual(
+            dis.elements.structure[0].get_line(),
+            "1 SOLIDSCATRA TET4 1 2 3 4 MAT 1 KINEM nonlinear TYPE Std FIBER1 0.0 1.0 0.0",
+        )
+
+    def test_element_fibers_roundtrip(self):
+        nodes = [lnmmeshio.Node(np.zeros(3)) for _ in range(4)]
+        for i, node in enumerate(nodes):
+            node.id = i + 1
+
+        line = "1 SOLID TET4 1 2 3 4 MAT 1 KINEM nonlinear FIBER1 1.0 0.0 0.0"
+        ele = parse_ele(line, nodes)
+
+        self.assertNotIn("FIBER1", ele.options)
+        self.assertEqual(ele.get_line(), line)
+
+    def test_fibers_mixed_order(self):
+        dis = lnmmeshio.read(os.path.join(script_dir, "data", "dummy2.dat"))
+        dis.compute_ids(zero_based=False)
+
+        # local fibers are written after the columnwise stored fibers
+        node = dis.nodes[1]
+        node.fibers[Fiber.TypeCir] = Fiber(np.array([1.0, 0.0, 0.0]))
+        node.fibers[Fiber.TypeFiber1] = Fiber(np.array([0.0, 0.0, 2.0]))
+        line = (
+            "FNODE 2 COORD 1.0 0.0 0.0 FIBER1 0.0 0.0 2.0 FIBER2 0.0 1.0 0.0 "
+            "CIR 1.0 0.0 0.0"
+        )
+        self.assertEqual(node.get_line(), line)
+        self.assertEqual(dis.get_sections(out=False)["NODE COORDS"][1], line)
+
+        ele = dis.elements.structure[0]
+        ele.fibers = {
+            Fiber.TypeTan: Fiber(np.array([0.0, 1.0, 0.0])),
+            Fiber.TypeCir: Fiber(np.array([1.0, 0.0, 0.0])),
+        }
+        dis.set_element_fibers(Fiber.TypeFiber1, np.array([[0.0, 0.0, 1.0]]))
+        self.assertTrue(
+            ele.get_line().endswith(
+                "FIBER1 0.0 0.0 1.0 TAN 0.0 1.0 0.0 CIR 1.0 0.0 0.0"
+            )
+        )
+        self.assertEqual(
+            dis.get_sections(out=False)["STRUCTURE ELEMENTS"][0], ele.get_line()
+        )
@@ -171,3 +171,83 @@ class TestFibers(unittest.TestCase):
             ),
             np.array(-4.8),
         )
+
+    def test_integrate_volume(self):
+        dis = lnmmeshio.read(os.path.join(script_dir, "data", "dummy.dat"))
+
+        volumes, volume = dis.integrate()
+
+        self.assertEqual(volumes.shape, (len(dis.elements.structure),))
+        self.assertAlmostEqual(volume, 32.0)
+
+        # hexahedra, linear and quadratic tetrahedra fill separate blocks
+        for shape, expected in (("HEX8", 16.0), ("TET4", 8.0), ("TET10", 8.0)):
+            positions = np.array([ele.shape == shape for ele in dis.elements.structure])
+            _, volume = dis.integrate(positions=positions)
+            self.assertAlmostEqual(volume, expected)
+
+        # integral of x over the elements
+        _, moment = dis.integrate(lambda x, normals: x)
+        self.assertEqual(moment.shape, (3,))
+        np.testing.assert_allclose(
+            moment,
+            np.sum(volumes[:, np.newaxis] * self._centroids(dis), axis=0),
+            atol=1e-12,
+        )
+
+    @staticmethod
+    def _centroids(dis):
+        centroids = []
+        for ele in dis.elements.structure:
+            _, volume = lnmmeshio.integration.integrate([ele])
+            _, moment = lnmmeshio.integration.integrate([ele], lambda x, normals: x)
+            centroids.append(moment / volume)
+
+        return np.array(centroids)
+
+    def test_integrate_dsurf(self):
+        dis = lnmmeshio.read(os.path.join(script_dir, "data", "dummy.dat"))
+
+        for dsurf in (0, 3, 4, 5):
+            faces = dis.get_dsurf_elements(dsurf)
+            areas, area = lnmmeshio.integration.integrate(faces)
+
+            self.assertEqual(len(areas), len(faces))
+            self.assertAlmostEqual(area, 4.0)
+
+            # the flux of the unit normal is the area
+            _, flux = lnmmeshio.integration.integrate(
+                faces, lambda x, normals: np.sum(normals * normals, axis=2)
+            )
+            self.assertAlmostEqual(flux, 4.0)
+
+    def test_integrate_coords(self):
+        tri3 = lnmmeshio.Tri3(
+            "T3",
+            [
+                lnmmeshio.Node(np.array([0.0, 0.0, 0.0])),
+                lnmmeshio.Node(np.array([1.0, 0.0, 0.0])),
+                lnmmeshio.Node(np.array([2.0, 3.0, 0.0])),
+            ],
+        )
+        coords = tri3.get_node_coords()[np.newaxis]
+
+        # flux of a constant field through the surface
+        flux = lnmmeshio.integration.integrate_coords(
+            lnmmeshio.Tri3,
+            coords,
+            lambda x, normals: normals @ np.array([0.0, 1.0, 2.0]),
+        )
+        np.testing.assert_allclose(flux, [1.5 * 2.0])
+
+        np.testing.assert_allclose(
+            lnmmeshio.integration.integrate_coords(
+                lnmmeshio.Tri3, coords, lambda x, normals: x[:, :, 0], numgp=3
+            ),
+            [tri3.integrate(lambda x: x[0], 3)],
+        )
+
+        with self.assertRaises(ValueError):
+            lnmmeshio.integration.integrate_coords(
+                lnmmeshio.Tri3, coords, lambda x, normals: np.ones((2, 3))
+            )
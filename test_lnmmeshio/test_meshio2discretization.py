@@ -2,6 +2,7 @@ import os
 import unittest
 
 import lnmmeshio
+import meshio
 import numpy as np
 
 script_dir = os.path.dirname(os.path.realpath(__file__))
@@ -46,18 +47,24 @@ class TestMeshio2Discretization(unittest.TestCase):
             self.assertAlmostEqual(np.linalg.norm(node1.coords - node2.coords), 0)
 
         # compare nodesets
-        # self.assertEqual(len(dis.pointnodesets), len(dis2.pointnodesets))
-        # self.assertEqual(len(dis.linenodesets), len(dis2.linenodesets))
-        # self.assertEqual(len(dis.surfacenodesets), len(dis2.surfacenodesets))
-
-        # for pns1, pns2 in zip(dis.pointnodesets, dis2.pointnodesets):
-        #    self.assertListEqual([n.id for n in pns1], [n.id for n in pns2])
-
-        # for lns1, pns2 in zip(dis.linenodesets, dis2.linenodesets):
-        #    self.assertListEqual([n.id for n in lns1], [n.id for n in lns1])
-
-        # for sns1, pns2 in zip(dis.surfacenodesets, dis2.surfacenodesets):
-        #    self.assertListEqual([n.id for n in sns1], [n.id for n in sns1])
+        self.assertEqual(len(dis.pointnodesets), len(dis2.pointnodesets))
+        self.assertEqual(len(dis.linenodesets), len(dis2.linenodesets))
+        self.assertEqual(len(dis.surfacenodesets), len(dis2.surfacenodesets))
+        self.assertEqual(len(dis.volumenodesets), len(dis2.volumenodesets))
+
+        for ns1, ns2 in zip(
+            dis.pointnodesets
+            + dis.linenodesets
+            + dis.surfacenodesets
+            + dis.volumenodesets,
+            dis2.pointnodesets
+            + dis2.linenodesets
+            + dis2.surfacenodesets
+            + dis2.volumenodesets,
+        ):
+            self.assertListEqual(
+                sorted([n.id for n in ns1]), sorted([n.id for n in ns2])
+            )
 
         self.assertEqual(
             dis.elements.get_num_structure(), dis2.elements.get_num_structure()
@@ -136,3 +143,244 @@ class TestMeshio2Discretization(unittest.TestCase):
         mesh = lnmmeshio.meshio_to_discretization.discretization2mesh(dis)
 
         self.assertListEqual(list(mesh.cell_data["test"][0]), [1, 2])
+
+    def test_cell_blocks(self):
+        points = np.array(
+            [
+                [0.0, 0.0, 0.0],
+                [1.0, 0.0, 0.0],
+                [0.0, 1.0, 0.0],
+                [0.0, 0.0, 1.0],
+                [1.0, 1.0, 1.0],
+            ]
+        )
+        mesh = meshio.Mesh(
+            points,
+            [
+                ("tetra", np.array([[0, 1, 2, 3], [1, 2, 3, 4]])),
+                ("triangle", np.array([[0, 1, 2], [1, 2, 4]])),
+                ("tetra", np.array([[0, 2, 3, 4]])),
+            ],
+            cell_data={"gmsh:geometrical": [[3, 4], [1, 2], [3]]},
+            point_data={"temperature": np.arange(5, dtype=float)},
+        )
+
+        dis = lnmmeshio.meshio_to_discretization.mesh2Discretization(mesh)
+        dis.compute_ids(zero_based=True)
+
+        # nodes share the coordinates and the point data with the mesh
+        self.assertEqual(dis.nodes[4].data["temperature"], 4.0)
+        np.testing.assert_allclose(dis.nodes[4].coords, [1.0, 1.0, 1.0])
+
+        # elements of both tetra blocks
+        self.assertEqual(len(dis.elements.structure), 3)
+        self.assertListEqual(
+            [n.id for n in dis.elements.structure[2].nodes], [0, 2, 3, 4]
+        )
+        self.assertListEqual(
+            [ele.options["MAT"] for ele in dis.elements.structure], [3, 4, 3]
+        )
+        self.assertListEqual(
+            [ele.data["GROUP_ID"] for ele in dis.elements.structure], [0, 0, 2]
+        )
+        np.testing.assert_array_equal(dis.get_elements_with_option("MAT", 3), [0, 2])
+
+        # triangles are surface nodesets
+        self.assertListEqual(
+            [sorted([n.id for n in ns]) for ns in dis.surfacenodesets],
+            [[0, 1, 2], [1, 2, 4]],
+        )
+
+    def test_keep_order(self):
+        dis = lnmmeshio.read(os.path.join(script_dir, "data", "dummy.dat"))
+
+        # cells are grouped by shape
+        mesh = lnmmeshio.meshio_to_discretization.discretization2mesh(
+            dis, keep_order=False
+        )
+        self.assertListEqual(
+            [(block.type, len(block)) for block in mesh.cells],
+            [("hexahedron", 65), ("tetra", 12), ("tetra10", 12)],
+        )
+
+        # by default, the cells are in the order of the elements
+        mesh = lnmmeshio.meshio_to_discretization.discretization2mesh(dis)
+        self.assertListEqual(
+            [(block.type, len(block)) for block in mesh.cells],
+            [("hexahedron", 1), ("tetra", 12), ("tetra10", 12), ("hexahedron", 64)],
+        )
+        self.assertListEqual(
+            [block_data[0] for block_data in mesh.cell_data["material"]], [1, 4, 5, 6]
+        )
+        dis.compute_ids(zero_based=True)
+        np.testing.assert_array_equal(
+            mesh.cells[3].data[0], [n.id for n in dis.elements.structure[25].nodes]
+        )
+
+    def test_shared_coords(self):
+        mesh = meshio.read(os.path.join(script_dir, "data", "dummy.mesh"))
+
+        dis = lnmmeshio.meshio_to_discretization.mesh2Discretization(mesh)
+        coords = dis.get_node_coords()
+        self.assertTrue(np.shares_memory(coords, mesh.points))
+        np.testing.assert_array_equal(coords, mesh.points)
+
+        mesh2 = lnmmeshio.meshio_to_discretization.discretization2mesh(dis)
+        self.assertTrue(np.shares_memory(mesh2.points, mesh.points))
+
+        # nodes read from a dat file share one array, too
+        dis_dat = lnmmeshio.read(os.path.join(script_dir, "data", "dummy2.dat"))
+        self.assertTrue(
+            np.shares_memory(dis_dat.get_node_coords(), dis_dat.nodes[3].coords)
+        )
+
+        # a copy is returned if the nodes do not share one array
+        dis.nodes[0], dis.nodes[1] = dis.nodes[1], dis.nodes[0]
+        coords = dis.get_node_coords()
+        self.assertFalse(np.shares_memory(coords, mesh.points))
+        np.testing.assert_allclose(coords[0], mesh.points[1])
+
+        # binding again gathers the coordinates into a new buffer
+        dis.bind_data()
+        coords = dis.get_node_coords()
+        self.assertTrue(np.shares_memory(coords, dis.nodes[1].coords))
+        np.testing.assert_allclose(coords[1], mesh.points[0])
+
+        # a node with own coordinates is not moved with the buffer
+        dis.nodes[2].coords = np.array([1.0, 2.0, 3.0])
+        coords = dis.get_node_coords()
+        self.assertFalse(np.shares_memory(coords, dis.nodes[1].coords))
+        np.testing.assert_allclose(coords[2], [1.0, 2.0, 3.0])
+
+    def test_nodeset_cells(self):
+        dis = lnmmeshio.Discretization()
+        dis.nodes = lnmmeshio.Node.from_coords(
+            np.array([[x, y, z] for z in range(3) for y in range(2) for x in range(2)])
+        )
+
+        # two stacked hexahedra
+        dis.elements.structure = [
+            lnmmeshio.Hex8(
+                "SOLIDH8",
+                [dis.nodes[i] for i in [0, 1, 3, 2, 4, 5, 7, 6]],
+            ),
+            lnmmeshio.Hex8(
+                "SOLIDH8",
+                [dis.nodes[i] for i in [4, 5, 7, 6, 8, 9, 11, 10]],
+            ),
+        ]
+
+        dis.pointnodesets = [lnmmeshio.PointNodeset(1)]
+        dis.pointnodesets[0].add_node(dis.nodes[0])
+        dis.linenodesets = [lnmmeshio.LineNodeset(1)]
+        dis.linenodesets[0].add_nodes([dis.nodes[0], dis.nodes[4], dis.nodes[8]])
+        dis.surfacenodesets = [lnmmeshio.SurfaceNodeset(1), lnmmeshio.SurfaceNodeset(2)]
+        dis.surfacenodesets[0].add_nodes(dis.nodes[8:12])
+        dis.surfacenodesets[1].add_nodes([dis.nodes[i] for i in [0, 1, 4, 5, 8, 9]])
+        dis.finalize()
+
+        mesh = lnmmeshio.meshio_to_discretization.discretization2mesh(
+            dis, nodeset_cells=True
+        )
+
+        self.assertListEqual(
+            list(mesh.point_sets.keys()), ["point1", "line1", "surface1", "surface2"]
+        )
+        np.testing.assert_array_equal(mesh.point_sets["surface1"], [8, 9, 10, 11])
+        self.assertListEqual(
+            [(block.type, len(block)) for block in mesh.cells],
+            [("hexahedron", 2), ("vertex", 1), ("line", 2), ("quad", 3)],
+        )
+        self.assertListEqual(
+            [list(ids) for ids in mesh.cell_data["nodeset_id"]],
+            [[0, 0], [1], [1, 1], [1, 2, 2]],
+        )
+
+        # file formats without point sets keep the nodesets in the cells
+        if not os.path.isdir(os.path.join(script_dir, "tmp")):
+            os.makedirs(os.path.join(script_dir, "tmp"))
+        filename = os.path.join(script_dir, "tmp", "nodeset_cells.vtu")
+        lnmmeshio.write_mesh(filename, mesh)
+
+        dis2 = lnmmeshio.from_mesh(lnmmeshio.read_mesh(filename))
+        dis2.compute_ids(zero_based=True)
+
+        self.assertEqual(len(dis2.elements.structure), 2)
+        self.assertNotIn("nodeset_id", dis2.get_element_data())
+        self.assertListEqual(
+            [
+                sorted([n.id for n in ns])
+                for ns in dis2.pointnodesets + dis2.linenodesets + dis2.surfacenodesets
+            ],
+            [[0], [0, 4, 8], [8, 9, 10, 11], [0, 1, 4, 5, 8, 9]],
+        )
+
+    def test_point_sets(self):
+        points = np.array(
+            [
+                [0.0, 0.0, 0.0],
+                [1.0, 0.0, 0.0],
+                [0.0, 1.0, 0.0],
+                [0.0, 0.0, 1.0],
+            ]
+        )
+        mesh = meshio.Mesh(
+            points,
+            [
+                ("tetra", np.array([[0, 1, 2, 3]])),
+                ("line", np.array([[0, 1], [1, 2], [2, 3]])),
+            ],
+            cell_data={"medit:ref": [[1], [2, 5, 2]]},
+            point_sets={
+                "line_a": np.array([3, 0, 3]),
+                "line_b": np.array([1]),
+                "surface_a": np.array([0, 1, 2]),
+            },
+        )
+
+        dis = lnmmeshio.meshio_to_discretization.mesh2Discretization(mesh)
+        dis.compute_ids(zero_based=True)
+
+        # point sets get the unused ids 1 and 3 after the ids 2 and 5 of the line cells
+        self.assertListEqual(
+            [sorted([n.id for n in ns]) for ns in dis.linenodesets],
+            [[0, 3], [0, 1, 2, 3], [1], [1, 2]],
+        )
+        self.assertListEqual(
+            [sorted([n.id for n in ns]) for ns in dis.surfacenodesets], [[0, 1, 2]]
+        )
+
+        builder = lnmmeshio.nodeset.PointNodesetBuilder()
+        builder.add_groups(dis.nodes, np.array([[0, 1], [1, 2], [0, 3]]), [4, 1, 4])
+        self.assertEqual(builder.get_unused_id(), 2)
+        builder.add_many(dis.nodes, np.array([2]), 2)
+        self.assertEqual(builder.get_unused_id(), 3)
+        self.assertListEqual(
+            [(ns.id, len(ns)) for ns in builder.finalize()], [(1, 2), (2, 1), (4, 3)]
+        )
+
+    def test_empty_point_set(self):
+        mesh = meshio.Mesh(
+            np.array(
+                [
+                    [0.0, 0.0, 0.0],
+                    [1.0, 0.0, 0.0],
+                    [0.0, 1.0, 0.0],
+                    [0.0, 0.0, 1.0],
+                ]
+            ),
+            [("tetra", np.array([[0, 1, 2, 3]]))],
+            point_sets={
+                "surface_empty": np.zeros((0), dtype=int),
+                "surface_a": np.array([0, 1, 2]),
+            },
+        )
+
+        # the empty point set does not use up an id
+        dis = lnmmeshio.meshio_to_discretization.mesh2Discretization(mesh)
+        self.assertListEqual([(ns.id, len(ns)) for ns in dis.surfacenodesets], [(1, 3)])
+
+        builder = lnmmeshio.nodeset.LineNodesetBuilder()
+        builder.add_groups(dis.nodes, np.zeros((2, 0), dtype=int), [1, 2])
+        self.assertEqual(builder.get_unused_id(), 1)
+        self.assertListEqual(builder.finalize(), [])
@@ -1,4 +1,5 @@
 import filecmp
+import io
 import os
 import shutil
 import unittest
@@ -30,6 +31,45 @@ class TestMimicsStlIO(unittest.TestCase):
         self.assertEqual(np.sum(mesh.cell_data["medit:ref"][0] == 2), 2006)
         self.assertEqual(np.sum(mesh.cell_data["medit:ref"][0] == 3), 5706)
 
+    def test_read_mimics_stl_cube(self):
+        mesh = lnmmeshio.read_mesh(
+            os.path.join(script_dir, "data", "cube.stl"), file_format="mimicsstl"
+        )
+
+        self.assertEqual(mesh.cells[0].data.shape, (12, 3))
+        self.assertEqual(mesh.points.shape, (8, 3))
+        np.testing.assert_array_equal(
+            mesh.cell_data["medit:ref"][0], [1, 1, 2, 2, 3, 3, 4, 4, 5, 5, 6, 6]
+        )
+        np.testing.assert_array_equal(
+            mesh.points[mesh.cells[0].data[0]], [[0, 0, 0], [10, 0, 0], [0, 0, 10]]
+        )
+
+        # truncated files are not read
+        with open(os.path.join(script_dir, "data", "cube.stl"), "rb") as f:
+            content = f.read()
+        with self.assertRaises(RuntimeError):
+            lnmmeshio.mimics_stlio.read_buffer(io.BytesIO(content[:-10]))
+
+    def test_merge_tolerance(self):
+        facets = np.array(
+            [
+                [[0, 0, 0], [1, 0, 0], [0, 1, 0]],
+                [[1, 0, 0], [1, 1, 0], [0, 1, 0]],
+            ],
+            dtype=np.float32,
+        )
+        facets[1, 0, 0] += 1e-6
+
+        points, cells = lnmmeshio.mimics_stlio.data_from_facets(facets)
+        self.assertEqual(points.shape, (5, 3))
+
+        points, cells = lnmmeshio.mimics_stlio.data_from_facets(
+            facets, merge_tolerance=1e-5
+        )
+        self.assertEqual(points.shape, (4, 3))
+        np.testing.assert_array_equal(cells[0][1], [[0, 1, 2], [1, 3, 2]])
+
     def test_write_mimics_stl(self):
         points = np.array(
             [
@@ -95,6 +135,17 @@ class TestMimicsStlIO(unittest.TestCase):
             )
         )
 
+        # read the written file again
+        mesh2 = lnmmeshio.read_mesh(
+            os.path.join(script_dir, "tmp", "dummy.stl"), file_format="mimicsstl"
+        )
+        np.testing.assert_array_equal(
+            mesh2.points[mesh2.cells[0].data], points[cells[0][1]]
+        )
+        np.testing.assert_array_equal(
+            mesh2.cell_data["medit:ref"][0], cell_data["medit:ref"][0]
+        )
+
     def tearDown(self):
         # delete tmp folder
         # shutil.rmtree(os.path.join(script_dir, "tmp"))
@@ -0,0 +1,194 @@
+import unittest
+
+import numpy as np
+from lnmmeshio.spatial import (
+    BoundingBoxGrid,
+    get_close_pairs,
+    get_nearest,
+    get_nearest_box,
+    merge_points,
+)
+
+
+class TestSpatial(unittest.TestCase):
+    def test_merge_exact(self):
+        points = np.array(
+            [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, 0.0], [1.0, 1e-9, 0.0]]
+        )
+
+        kept, inverse = merge_points(points)
+
+        np.testing.assert_array_equal(kept, [0, 1, 3])
+        np.testing.assert_array_equal(inverse, [0, 1, 0, 2])
+
+    def test_merge_tolerance(self):
+        points = np.array(
+            [
+                [1.0, 0.0, 0.0],
+                [0.0, 0.0, 0.0],
+                [1.0, 1e-9, 0.0],
+                [0.0, 0.0, 5e-7],
+                [0.0, 0.0, 1e-6],
+                [0.0, 1.0, 0.0],
+            ]
+        )
+
+        kept, inverse = merge_points(points, 6e-7)
+
+        # chains of close points are not merged, the last point is too far from the first one
+        np.testing.assert_array_equal(kept, [0, 1, 4, 5])
+        np.testing.assert_array_equal(inverse, [0, 1, 0, 1, 2, 3])
+        np.testing.assert_array_equal(points[kept][inverse][3], [0.0, 0.0, 0.0])
+
+    def test_merge_snapped(self):
+        rng = np.random.default_rng(42)
+        points = rng.random((500, 2))
+        points = np.concatenate([points, points[:100], points[:200] + 1e-3])
+
+        kept, inverse = merge_points(points, 0.02)
+
+        # each point is within the tolerance of its representative
+        distances = np.linalg.norm(points - points[kept][inverse], axis=1)
+        self.assertTrue(np.all(distances <= 0.02))
+
+        # the representatives are not within the tolerance of each other
+        distances = np.linalg.norm(points[kept][:, None] - points[kept][None], axis=2)
+        self.assertFalse(np.any(np.triu(distances <= 0.02, 1)))
+
+        # the same as merging the points one after another into the first representative
+        expected = []
+        for i, point in enumerate(points):
+            close = [
+                j
+                for j, r in enumerate(expected)
+                if np.linalg.norm(points[r] - point) <= 0.02
+            ]
+            if len(close) == 0:
+                expected.append(i)
+        np.testing.assert_array_equal(kept, expected)
+
+    def test_close_pairs(self):
+        rng = np.random.default_rng(42)
+        for dim in (1, 2, 3):
+            points = rng.random((200, dim))
+            points = np.concatenate(
+                [points, points[:50] + rng.normal(scale=1e-3, size=(50, dim))]
+            )
+
+            first, second = get_close_pairs(points, 0.01)
+
+            distances = np.linalg.norm(points[:, None] - points[None], axis=2)
+            expected = np.argwhere(np.triu(distances <= 0.01, 1))
+            self.assertSetEqual(
+                {(min(i, j), max(i, j)) for i, j in zip(first, second)},
+                {(i, j) for i, j in expected},
+            )
+
+    def test_bounding_box_grid(self):
+        rng = np.random.default_rng(42)
+        lower = rng.random((300, 3))
+        upper = lower + rng.random((300, 3)) * 0.1
+        points = rng.random((500, 3)) * 1.2 - 0.1
+
+        point_ids, box_ids = BoundingBoxGrid(lower, upper).query(points)
+
+        expected = np.argwhere(
+            np.all(
+                (lower[None] <= points[:, None]) & (points[:, None] <= upper[None]),
+                axis=2,
+            )
+        )
+        np.testing.assert_array_equal(np.stack([point_ids, box_ids], axis=1), expected)
+
+    def test_bounding_box_grid_graded(self):
+        # boundary layer of thin boxes next to coarse boxes growing up to a huge far field box
+        x = np.concatenate(
+            [np.linspace(0.0, 1e-3, 50, endpoint=False), 2.0 ** -np.arange(9, -1, -1)]
+        )
+        widths = np.diff(np.append(x, 1e4))
+        lower = np.stack([x, np.zeros_like(x), np.zeros_like(x)], axis=1)
+        upper = lower + np.maximum(widths, 1e-3)[:, None]
+        rng = np.random.default_rng(42)
+        points = np.concatenate(
+            [rng.random((200, 3)) * 2e-3, rng.random((200, 3)) * 1e3]
+        )
+
+        grid = BoundingBoxGrid(lower, upper)
+        point_ids, box_ids = grid.query(points)
+
+        # each box is only registered in a few cells
+        self.assertLessEqual(
+            sum(len(level.boxes) for level in grid.levels), 27 * len(lower)
+        )
+        expected = np.argwhere(
+            np.all(
+                (lower[None] <= points[:, None]) & (points[:, None] <= upper[None]),
+                axis=2,
+            )
+        )
+        np.testing.assert_array_equal(np.stack([point_ids, box_ids], axis=1), expected)
+
+    def test_nearest(self):
+        rng = np.random.default_rng(42)
+        points = rng.random((300, 3))
+        queries = np.concatenate([rng.random((100, 3)), [[10.0, 0.0, 0.0]]])
+
+        nearest, distances = get_nearest(points, queries)
+
+        expected = np.linalg.norm(queries[:, None] - points[None], axis=2)
+        np.testing.assert_array_equal(nearest, np.argmin(expected, axis=1))
+        np.testing.assert_allclose(distances, np.min(expected, axis=1))
+
+    def test_nearest_box(self):
+        rng = np.random.default_rng(42)
+        lower = rng.random((300, 3))
+        upper = lower + rng.random((300, 3)) ** 4
+        queries = np.concatenate([rng.random((100, 3)) * 3.0 - 1.0, [[10.0, 0.0, 0.0]]])
+
+        nearest, distances = get_nearest_box(lower, upper, queries)
+
+        expected = np.linalg.norm(
+            np.maximum(
+                np.maximum(
+                    lower[None] - queries[:, None], queries[:, None] - upper[None]
+                ),
+                0.0,
+            ),
+            axis=2,
+        )
+        np.testing.assert_allclose(distances, np.min(expected, axis=1))
+        np.testing.assert_allclose(
+            expected[np.arange(len(queries)), nearest], np.min(expected, axis=1)
+        )
+
+    def test_nearest_box_outlier(self):
+        # cells of a unit cube with query points close to the cube and far away
+        cells = np.stack(
+            np.meshgrid(*[np.arange(10.0)] * 3, indexing="ij"), axis=-1
+        ).reshape((-1, 3))
+        lower = cells / 10.0
+        upper = lower + 0.1
+        rng = np.random.default_rng(42)
+        queries = np.concatenate(
+            [
+                rng.random((200, 3)) * [0.05, 1.0, 1.0] + [1.0, 0.0, 0.0],
+                [[500.0, 0.55, 0.55], [0.95, -1e3, 0.05]],
+            ]
+        )
+
+        nearest, distances = get_nearest_box(lower, upper, queries)
+
+        expected = np.linalg.norm(
+            np.maximum(
+                np.maximum(
+                    lower[None] - queries[:, None], queries[:, None] - upper[None]
+                ),
+                0.0,
+            ),
+            axis=2,
+        )
+        np.testing.assert_allclose(distances, np.min(expected, axis=1))
+        np.testing.assert_allclose(
+            expected[np.arange(len(queries)), nearest], np.min(expected, axis=1)
+        )
+        np.testing.assert_array_equal(nearest[-2:], [955, 900])
@@ -1,9 +1,11 @@
+import itertools
 import os
 import unittest
 from typing import List
 
 import lnmmeshio
 import numpy as np
+import pyvista
 
 script_dir = os.path.dirname(os.path.realpath(__file__))
 
@@ -26,3 +28,56 @@ class TestPyvista(unittest.TestCase):
                 [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
             ),
         )
+
+    def test_pyvista_round_trip(self):
+        dis = lnmmeshio.read(os.path.join(script_dir, "data", "dummy.dat"))
+        for i, ele in enumerate(dis.elements.structure):
+            ele.data["vec"] = np.array([i, 2 * i, 3 * i])
+        dis.set_node_data("temperature", np.arange(len(dis.nodes), dtype=float))
+
+        grid = lnmmeshio.to_pyvista(dis)
+
+        # cells are in the order of the elements
+        self.assertEqual(grid.n_cells, 89)
+        self.assertListEqual(list(grid.celltypes[:3]), [12, 10, 10])
+        np.testing.assert_array_equal(grid.cell_data["material"][:3], [1, 4, 4])
+        np.testing.assert_array_equal(grid.cell_data["vec"][5], [5, 10, 15])
+
+        # coordinates and nodal data are shared
+        self.assertTrue(np.shares_memory(grid.points, dis.nodes[0].coords))
+        self.assertTrue(
+            np.shares_memory(
+                grid.point_data["temperature"], dis.node_data["temperature"]
+            )
+        )
+
+        dis2 = lnmmeshio.from_pyvista(grid)
+        dis.compute_ids(zero_based=True)
+        dis2.compute_ids(zero_based=True)
+
+        self.assertEqual(len(dis2.nodes), len(dis.nodes))
+        for ele1, ele2 in zip(dis.elements.structure, dis2.elements.structure):
+            self.assertEqual(ele1.shape, ele2.shape)
+            self.assertListEqual([n.id for n in ele1.nodes], [n.id for n in ele2.nodes])
+            self.assertEqual(int(ele1.options["MAT"]), ele2.options["MAT"])
+            np.testing.assert_array_equal(ele1.data["vec"], ele2.data["vec"])
+        self.assertEqual(dis2.nodes[7].data["temperature"], 7.0)
+
+    def test_to_pyvista_node_order(self):
+        # nodes of a HEX27 element on the reference element
+        coords = np.zeros((27, 3))
+        for xi in itertools.product([-1.0, 0.0, 1.0], repeat=3):
+            coords[np.argmax(lnmmeshio.Hex27.shape_fcns(np.array(xi)))] = xi
+
+        dis = lnmmeshio.Discretization()
+        dis.nodes = lnmmeshio.Node.from_coords(coords)
+        dis.elements.structure = [lnmmeshio.Hex27("SOLID", dis.nodes)]
+
+        # the volume is only correct if the vtk node ordering is correct
+        for grid in [
+            lnmmeshio.to_pyvista(dis),
+            pyvista.from_meshio(lnmmeshio.to_mesh(dis)),
+        ]:
+            self.assertAlmostEqual(
+                grid.compute_cell_sizes().cell_data["Volume"][0], 8.0
+            )
@@ -0,0 +1,107 @@
+import itertools
+import pickle
+import unittest
+
+import lnmmeshio
+import numpy as np
+from lnmmeshio.discretization import ElementLocator
+
+
+def _get_tet_cube(n: int) -> lnmmeshio.Discretization:
+    # unit cube with n^3 cells, each split into six tetrahedra along the diagonal
+    coords = np.stack(
+        np.meshgrid(*[np.linspace(0.0, 1.0, n + 1)] * 3, indexing="ij"), axis=-1
+    ).reshape((-1, 3))
+    node_ids = np.arange(len(coords)).reshape((n + 1, n + 1, n + 1))
+
+    dis = lnmmeshio.Discretization()
+    dis.nodes = lnmmeshio.Node.from_coords(coords)
+    dis.elements.structure = []
+    for cell in itertools.product(range(n), repeat=3):
+        for axes in itertools.permutations(range(3)):
+            corner = np.array(cell)
+            tet_nodes = [node_ids[tuple(corner)]]
+            for axis in axes:
+                corner[axis] += 1
+                tet_nodes.append(node_ids[tuple(corner)])
+            dis.elements.structure.append(
+                lnmmeshio.Tet4("SOLIDT4", [dis.nodes[i] for i in tet_nodes])
+            )
+    dis.finalize()
+
+    return dis
+
+
+class TestTransfer(unittest.TestCase):
+    def setUp(self):
+        self.dis = _get_tet_cube(3)
+        coords = self.dis.get_node_coords()
+
+        # linear fields are interpolated (and extrapolated) exactly
+        self.gradient = np.array([[1.0, -2.0], [0.5, 0.0], [3.0, 1.0]])
+        self.dis.set_node_data("field", coords @ self.gradient + [1.0, 2.0])
+
+        rng = np.random.default_rng(42)
+        self.points = np.concatenate(
+            [rng.random((100, 3)), [[1.2, 0.5, 0.5], [-0.1, -0.1, 1.1]]]
+        )
+        self.expected = self.points @ self.gradient + [1.0, 2.0]
+
+    def test_transfer_nodal_field(self):
+        values = lnmmeshio.transfer_nodal_field(self.dis, self.points, "field")
+
+        np.testing.assert_allclose(values, self.expected)
+
+    def test_transfer_array(self):
+        field = self.dis.get_node_coords()[:, 0]
+
+        values = lnmmeshio.transfer_nodal_field(self.dis, self.points, field)
+
+        np.testing.assert_allclose(values, self.points[:, 0])
+        with self.assertRaises(ValueError):
+            lnmmeshio.transfer_nodal_field(self.dis, self.points, field[:-1])
+
+    def test_transfer_process_pool(self):
+        values = lnmmeshio.transfer_nodal_field(
+            self.dis, self.points, "field", num_processes=2, chunk_size=30
+        )
+
+        np.testing.assert_allclose(values, self.expected)
+
+        # the processes only receive arrays, no nodes or elements
+        locator = pickle.loads(pickle.dumps(ElementLocator.of(self.dis)))
+        self.assertIsInstance(locator.coords, np.ndarray)
+        positions, xi = locator.locate(self.points)
+        expected_positions, expected_xi = self.dis.locate_points(self.points)
+        np.testing.assert_array_equal(positions, expected_positions)
+        np.testing.assert_allclose(xi, expected_xi)
+
+    def test_transfer_nearest_box(self):
+        # a large and a small hexahedron with different linear fields
+        corners = np.array(
+            [
+                [0.0, 0.0, 0.0],
+                [1.0, 0.0, 0.0],
+                [1.0, 1.0, 0.0],
+                [0.0, 1.0, 0.0],
+                [0.0, 0.0, 1.0],
+                [1.0, 0.0, 1.0],
+                [1.0, 1.0, 1.0],
+                [0.0, 1.0, 1.0],
+            ]
+        )
+        coords = np.concatenate([corners * 10.0, corners + [10.0, 0.0, 0.0]])
+
+        dis = lnmmeshio.Discretization()
+        dis.nodes = lnmmeshio.Node.from_coords(coords)
+        dis.elements.structure = [
+            lnmmeshio.Hex8("SOLIDH8", dis.nodes[:8]),
+            lnmmeshio.Hex8("SOLIDH8", dis.nodes[8:]),
+        ]
+        dis.finalize()
+        field = np.concatenate([coords[:8, 0], 2.0 * coords[8:, 1] + 7.0])
+
+        # the point is next to the large element, but closer to the center of the small one
+        values = lnmmeshio.transfer_nodal_field(dis, [[10.2, 0.5, 5.0]], field)
+
+        np.testing.assert_allclose(values, [10.2])
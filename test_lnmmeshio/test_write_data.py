@@ -62,3 +62,45 @@ class TestWriteData(unittest.TestCase):
             for i in range(3):
                 self.assertIn("test", dis_read.nodes[i].data)
                 self.assertAlmostEqual(dis_read.nodes[i].data["test"], int(i == 1))
+
+    def test_columnar_data(self):
+        d = lnmmeshio.Discretization()
+        d.nodes = [
+            lnmmeshio.Node(np.array([0.0, 0.0, 0.0])),
+            lnmmeshio.Node(np.array([1.0, 0.0, 0.0])),
+            lnmmeshio.Node(np.array([2.0, 0.0, 0.0])),
+        ]
+        d.elements.structure = [
+            lnmmeshio.Line2("LINE", [d.nodes[0], d.nodes[1]]),
+            lnmmeshio.Line2("LINE", [d.nodes[1], d.nodes[2]]),
+        ]
+
+        pressure = np.array([1.0, 2.0, 3.0])
+        displacement = np.zeros((3, 3))
+        d.set_node_data("pressure", pressure)
+        d.set_node_data("displacement", displacement)
+        d.set_element_data("stress", np.array([[1.0, 2.0], [3.0, 4.0]]))
+        d.nodes[2].data["local"] = 7.0
+
+        # the data of each node is a view into the columns
+        self.assertAlmostEqual(d.nodes[1].data["pressure"], 2.0)
+        d.nodes[1].data["displacement"][0] = 5.0
+        self.assertAlmostEqual(displacement[1, 0], 5.0)
+        d.nodes[0].data["pressure"] = 4.0
+        self.assertAlmostEqual(pressure[0], 4.0)
+        self.assertListEqual(
+            list(d.nodes[2].data.keys()), ["pressure", "displacement", "local"]
+        )
+        np.testing.assert_equal(d.elements.structure[1].data["stress"], [3.0, 4.0])
+
+        # columns are handed over without copying
+        node_data = d.get_node_data()
+        self.assertIs(node_data["pressure"], pressure)
+        np.testing.assert_equal(node_data["local"], [0.0, 0.0, 7.0])
+
+        mesh = lnmmeshio.to_mesh(d)
+        self.assertIs(mesh.point_data["pressure"], pressure)
+        np.testing.assert_equal(mesh.cell_data["stress"][0], [[1.0, 2.0], [3.0, 4.0]])
+
+        with self.assertRaises(ValueError):
+            d.set_node_data("wrong", np.zeros(2))